@@ -0,0 +1,99 @@
+"""
+Measure the CPU time the consuming process spends per report when polling the simulator in-process with
+WeatherLinkPoller and through ShardedCollector with 1, 2 and 4 workers. Only the parent's CPU time is counted: the
+collector's workers poll and decode in their own processes, so what is left here is receiving the forwarded rows
+and building condition objects from them. Every field of every condition is read, as a sink or archive would. The
+simulator runs in a separate process too.
+
+    python benchmarks/collector.py [--devices 500] [--interval 1.0] [--duration 10] [--workers 0 1 2 4]
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+
+from argparse import ArgumentParser
+from dataclasses import fields
+from multiprocessing.connection import Connection
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Tuple
+)
+
+import payloads  # noqa: F401 - puts src/ on the path
+
+from api.collector import ShardedCollector
+from api.poller import WeatherLinkPoller
+from api.simulator import WeatherLinkSimulator
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+def _Simulate(devices: int, connection: Connection) -> None:
+    async def _Run() -> None:
+        async with WeatherLinkSimulator(devices=devices) as sim:
+            connection.send(sim.Hosts())
+            await asyncio.get_running_loop().run_in_executor(None, connection.recv)
+
+    asyncio.run(_Run())
+
+
+async def _Measure(source: AsyncIterator[WeatherLinkConditionsReport], interval: float, duration: float) -> Tuple[int, float, float]:
+    # Skip the first interval, while polls are still being spread out and workers are starting
+    await asyncio.sleep(interval * 2)
+    reports = 0
+
+    cpuStarted = time.process_time()
+    started = time.perf_counter()
+    deadline = started + duration
+    while time.perf_counter() < deadline:
+        try:
+            report = await asyncio.wait_for(source.__anext__(), deadline - time.perf_counter())
+        except asyncio.TimeoutError:
+            break
+        for condition in report.DeviceConditions:
+            for f in fields(condition):
+                getattr(condition, f.name)
+        reports += 1
+    return reports, time.perf_counter() - started, time.process_time() - cpuStarted
+
+
+async def _Poll(hosts: List[str], workers: int, interval: float, duration: float) -> None:
+    options: Dict[str, Any] = dict(interval=interval, max_in_flight=256, queue_size=4096)
+    if workers:
+        async with ShardedCollector(hosts, workers=workers, **options) as collector:
+            reports, elapsed, cpu = await _Measure(collector, interval, duration)
+        name = f'{workers} worker(s)'
+    else:
+        async with WeatherLinkPoller(hosts, **options) as poller:
+            reports, elapsed, cpu = await _Measure(poller, interval, duration)
+        name = 'in-process'
+
+    print(f'{name:>12}: {reports / elapsed:9,.1f} reports/s, {cpu / max(reports, 1) * 1e6:7.0f} us parent CPU/report')
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument('--devices', type=int, default=500, help='Simulated fleet size')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between polls of each device')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to measure each configuration for')
+    parser.add_argument('--workers', type=int, nargs='+', default=[0, 1, 2, 4], help='Worker counts, 0 for in-process')
+    args = parser.parse_args()
+
+    parent, child = multiprocessing.Pipe()
+    simulator = multiprocessing.Process(target=_Simulate, args=(args.devices, child), daemon=True)
+    simulator.start()
+    try:
+        hosts = parent.recv()
+        for workers in args.workers:
+            asyncio.run(_Poll(hosts, workers, args.interval, args.duration))
+    finally:
+        parent.send(None)
+        simulator.join(5)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Records per second through the table-driven decoder compared with WeatherLinkConditionsReport.FromJson, and the
+cost of converting to metric units while decoding.
+
+    python benchmarks/decode.py
+"""
+from __future__ import annotations
+
+import functools
+import timeit
+
+from payloads import Payloads
+
+from api.decoder import DecodeReport
+from api.units import UnitSystem
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+def main() -> None:
+    payloads = Payloads(2000, devices=50)
+    records = sum(len(p['conditions']) for p in payloads)
+
+    assert [DecodeReport(p) for p in payloads] == [WeatherLinkConditionsReport.FromJson(p) for p in payloads]
+
+    for name, decode in (
+        ('FromJson', WeatherLinkConditionsReport.FromJson),
+        ('DecodeReport', DecodeReport),
+        ('metric', functools.partial(DecodeReport, units=UnitSystem.Metric))
+    ):
+        best = min(timeit.repeat(lambda: [decode(p) for p in payloads], number=1, repeat=7))
+        print(f'{name:>14}: {records / best:12,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Bytes on the wire when a stream of simulated reports is sent as full ReportToDict() output compared with the
+ConditionDelta records from ConditionDiffer, both encoded with the configured JSON backend. Simulated stations
+change gradually, like real ones: mostly wind and temperature move between updates. Deltas are measured with exact
+comparison and with epsilons of half and one unit (degree, percent, mile per hour) on every numeric field.
+
+    python benchmarks/delta.py [--devices 20] [--updates 360] [--keyframe-interval 60]
+"""
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from typing import List
+
+import payloads  # noqa: F401 - puts src/ on the path
+
+from api.decoder import DecodeReport
+from api.delta import ConditionDiffer, ConditionReconstructor, DeltaFromDict, DeltaToDict
+from api.json_backend import Dumps, Loads
+from api.serialization import ReportToDict
+from api.simulator import VirtualDevice
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+def _Reports(devices: int, updates: int) -> List[WeatherLinkConditionsReport]:
+    fleet = [VirtualDevice(DeviceId=f'001D0A7{i:05X}', Seed=i + 1) for i in range(devices)]
+    start = 1700000000
+    return [
+        DecodeReport(device.CurrentConditions(start + n * device.UpdateInterval))
+        for n in range(updates) for device in fleet
+    ]
+
+
+def _Deltas(reports: List[WeatherLinkConditionsReport], differ: ConditionDiffer) -> int:
+    size = 0
+    reconstructor = ConditionReconstructor()
+    for report in reports:
+        for delta in differ.Diff(report):
+            encoded = Dumps(DeltaToDict(delta))
+            size += len(encoded)
+            # Make sure what is measured can actually be decoded and applied
+            reconstructor.Apply(DeltaFromDict(Loads(encoded)))
+    return size
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument('--devices', type=int, default=20, help='Simulated fleet size')
+    parser.add_argument('--updates', type=int, default=360, help='Reports per device')
+    parser.add_argument('--keyframe-interval', type=int, default=60, help='Reports of each sensor between keyframes')
+    args = parser.parse_args()
+
+    reports = _Reports(args.devices, args.updates)
+    full = sum(len(Dumps(ReportToDict(r))) for r in reports)
+    print(f'{"ReportToDict":>16}: {full:12,} bytes, {full / len(reports):8,.0f} bytes/report')
+
+    for name, epsilon in (('exact', 0.0), ('epsilon 0.5', 0.5), ('epsilon 1', 1.0)):
+        size = _Deltas(reports, ConditionDiffer(args.keyframe_interval, default_epsilon=epsilon))
+        print(f'{name:>16}: {size:12,} bytes, {size / len(reports):8,.0f} bytes/report, {full / size:5.1f}x smaller')
+
+
+if __name__ == '__main__':
+    main()
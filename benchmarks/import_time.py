@@ -0,0 +1,103 @@
+"""
+Startup cost of the CLI measured with `python -X importtime`, so changes that pull heavy modules into the fast
+paths get caught. Exits with status 1, for use as a CI step, when a scenario imports one of its excluded modules
+or the median import time of this project's own modules (`api` and below, including whatever they import) over
+several runs exceeds its budget. Interpreter and standard library startup is reported but not budgeted, since it
+varies too much between runs and machines to hold to a fixed limit.
+
+    python benchmarks/import_time.py [--runs 5] [--budget-scale 1.0]
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from argparse import ArgumentParser
+from typing import (
+    Dict,
+    FrozenSet,
+    List,
+    Set,
+    Tuple
+)
+
+
+_CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'aioweatherlink.py')
+
+# Modules that must not be imported at all on the fast paths. Checking for them doesn't depend on timing, so it
+# catches aiohttp, asyncio or numpy creeping back in on any machine.
+_HEAVY: FrozenSet[str] = frozenset({'aiohttp', 'asyncio', 'numpy', 'pyarrow'})
+
+# Arguments and budget in milliseconds for the import time of this project's modules in each scenario. Budgets are
+# about twice the median on a typical development machine, which run to run noise stays well inside.
+SCENARIOS: Dict[str, Tuple[List[str], float]] = {
+    'help': (['--help'], 10.0),
+    # Port 9 (discard) refuses the connection immediately, so this times the --once imports without a device
+    'once': (['--once', '-H', '127.0.0.1:9', '--timeout', '0.5'], 100.0)
+}
+
+
+def _IsProject(module: str) -> bool:
+    return module == 'api' or module.startswith('api.')
+
+
+def _Measure(args: List[str]) -> Tuple[float, float, float, List[Tuple[int, str]], Set[str]]:
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', _CLI, *args], capture_output=True, text=True)
+    wall = time.perf_counter() - started
+
+    total = project = 0
+    modules: List[Tuple[int, str]] = []
+    heavy: Set[str] = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        module = name.strip()
+        if module.split('.')[0] in _HEAVY:
+            heavy.add(module.split('.')[0])
+        # Top-level imports have no indentation; nested ones are already part of their parent's cumulative time
+        if not name[1:].startswith(' '):
+            total += int(cumulative)
+            if _IsProject(module):
+                project += int(cumulative)
+            modules.append((int(cumulative), module))
+
+    return project / 1000.0, total / 1000.0, wall * 1000.0, sorted(modules, reverse=True), heavy
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument('--runs', type=int, default=5, help='Runs per scenario; the median is compared to the budget')
+    parser.add_argument('--budget-scale', type=float, default=1.0, help='Multiply every budget, for slow CI machines')
+    args = parser.parse_args()
+
+    failed = False
+    for name, (cliArgs, budget) in SCENARIOS.items():
+        runs = sorted(_Measure(cliArgs) for _ in range(args.runs))
+        project = statistics.median(r[0] for r in runs)
+        total = statistics.median(r[1] for r in runs)
+        wall = statistics.median(r[2] for r in runs)
+        modules = runs[len(runs) // 2][3]
+        heavy = set().union(*(r[4] for r in runs))
+
+        limit = budget * args.budget_scale
+        status = 'ok' if project <= limit and not heavy else 'OVER BUDGET'
+        print(
+            f'{name:>6}: {project:7.1f} ms project imports (budget {limit:.0f} ms), {total:7.1f} ms all imports, '
+            f'{wall:7.1f} ms wall  {status}'
+        )
+        if heavy:
+            print(f'        imports {", ".join(sorted(heavy))}')
+        for cumulative, module in modules[:5]:
+            print(f'        {cumulative / 1000.0:7.1f} ms  {module}')
+        failed = failed or status != 'ok'
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Decode throughput of each installed JSON backend on `current_conditions` response bodies, alone and together with
+building the report.
+
+    python benchmarks/json_backends.py
+"""
+from __future__ import annotations
+
+import json
+import timeit
+
+from payloads import Payloads
+
+from api.decoder import DecodeReport
+from api.json_backend import BACKENDS
+
+
+def main() -> None:
+    bodies = [json.dumps({'data': p, 'error': None}, indent=4).encode() for p in Payloads(2000, devices=50)]
+    print(f'{len(bodies)} bodies, {sum(map(len, bodies)) / len(bodies):,.0f} bytes each on average')
+
+    for name in ('orjson', 'msgspec', 'json'):
+        loads = BACKENDS.get(name)
+        if loads is None:
+            print(f'{name:>8}: not installed')
+            continue
+
+        decode = min(timeit.repeat(lambda: [loads(b) for b in bodies], number=1, repeat=7))
+        full = min(timeit.repeat(lambda: [DecodeReport(loads(b)['data']) for b in bodies], number=1, repeat=7))
+        print(f'{name:>8}: {len(bodies) / decode:10,.0f} bodies/s decode, {len(bodies) / full:10,.0f} bodies/s decode + build')
+
+
+if __name__ == '__main__':
+    main()
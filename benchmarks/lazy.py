@@ -0,0 +1,42 @@
+"""
+Decoding cost when a consumer reads only Temperature and WindLast from each ISS condition: eager DecodeReport
+compared with the lazy views from api.lazy.
+
+    python benchmarks/lazy.py
+"""
+from __future__ import annotations
+
+import timeit
+
+from typing import (
+    Any,
+    Callable,
+    Dict
+)
+
+from payloads import Payloads
+
+from api.decoder import DecodeReport
+from api.device_condition_reports import IssCondition
+from api.lazy import DecodeLazyReport
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+def _Read(decode: Callable[[Dict[str, Any]], WeatherLinkConditionsReport], payload: Dict[str, Any]) -> None:
+    for c in decode(payload).DeviceConditions:
+        if isinstance(c, IssCondition):
+            c.Temperature
+            c.WindLast
+
+
+def main() -> None:
+    payloads = Payloads(2000, devices=50)
+    records = sum(len(p['conditions']) for p in payloads)
+
+    for name, decode in (('DecodeReport', DecodeReport), ('DecodeLazyReport', DecodeLazyReport)):
+        best = min(timeit.repeat(lambda: [_Read(decode, p) for p in payloads], number=1, repeat=7))
+        print(f'{name:>16}: {records / best:12,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main()
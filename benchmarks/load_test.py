@@ -0,0 +1,92 @@
+"""
+Load test WeatherLinkPoller against the simulator at 10, 100 and 1000 devices, reporting polls/s, p99 response
+latency and client CPU time per report. The simulator runs in a separate process so its CPU use isn't counted.
+
+    python benchmarks/load_test.py [--interval 1.0] [--duration 10] [--devices 10 100 1000]
+"""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+
+from argparse import ArgumentParser
+from multiprocessing.connection import Connection
+from typing import List
+
+import payloads  # noqa: F401 - puts src/ on the path
+
+from api.instrumentation import Histogram, PollMetrics
+from api.poller import WeatherLinkPoller
+from api.simulator import WeatherLinkSimulator
+
+
+# 0.1 ms to ~10 s in 5% steps, fine enough to read a p99 from
+_BUCKETS = tuple(0.0001 * 1.05 ** i for i in range(240))
+
+
+def _Simulate(devices: int, connection: Connection) -> None:
+    async def _Run() -> None:
+        async with WeatherLinkSimulator(devices=devices) as sim:
+            connection.send(sim.Hosts())
+            await asyncio.get_running_loop().run_in_executor(None, connection.recv)
+
+    asyncio.run(_Run())
+
+
+async def _Poll(hosts: List[str], interval: float, duration: float) -> None:
+    metrics = PollMetrics(buckets=_BUCKETS)
+    reports = 0
+
+    async with WeatherLinkPoller(hosts, interval=interval, max_in_flight=256, queue_size=4096, metrics=metrics) as poller:
+        # Skip the first interval, while polls are still being spread out
+        await asyncio.sleep(interval)
+        metrics.Latency.clear()
+
+        cpuStarted = time.process_time()
+        started = time.perf_counter()
+        deadline = started + duration
+        while time.perf_counter() < deadline:
+            try:
+                await asyncio.wait_for(poller.__anext__(), deadline - time.perf_counter())
+            except asyncio.TimeoutError:
+                break
+            reports += 1
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpuStarted
+
+    latency = Histogram(_BUCKETS)
+    for (host, stage), h in metrics.Latency.items():
+        if stage == 'response':
+            latency.Counts = [a + b for a, b in zip(latency.Counts, h.Counts)]
+            latency.Count += h.Count
+
+    errors = sum(metrics.Errors.values())
+    print(
+        f'{len(hosts):>6} devices: {reports / elapsed:9,.1f} polls/s, '
+        f'p99 {latency.Quantile(0.99) * 1000:7.1f} ms, '
+        f'{cpu / max(reports, 1) * 1e6:7.0f} us CPU/report, {errors} errors'
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser()
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between polls of each device')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds to measure for at each fleet size')
+    parser.add_argument('--devices', type=int, nargs='+', default=[10, 100, 1000], help='Fleet sizes to test')
+    args = parser.parse_args()
+
+    for devices in args.devices:
+        parent, child = multiprocessing.Pipe()
+        simulator = multiprocessing.Process(target=_Simulate, args=(devices, child), daemon=True)
+        simulator.start()
+        try:
+            hosts = parent.recv()
+            asyncio.run(_Poll(hosts, args.interval, args.duration))
+        finally:
+            parent.send(None)
+            simulator.join(5)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+Bytes held per decoded record by the regular condition dataclasses compared with the slotted Compact* classes.
+
+    python benchmarks/memory.py
+"""
+from __future__ import annotations
+
+import gc
+import tracemalloc
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List
+)
+
+from payloads import BAROMETER, ISS, MOISTURE, TEMP_HUM
+
+from api.decoder import DecodeCondition
+
+
+def _BytesPerRecord(decode: Callable[[Dict[str, Any]], Any], records: List[Dict[str, Any]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = [decode(r) for r in records]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del held
+    return (after - before) / len(records)
+
+
+def main() -> None:
+    count = 20000
+
+    for name, template in (('ISS', ISS), ('Leaf/Soil', MOISTURE), ('Barometer', BAROMETER), ('Temp/Hum', TEMP_HUM)):
+        # Vary the readings so records don't share float objects, as they wouldn't in a real rolling window
+        records = [dict(template, lsid=i, **{k: v + i / 1000 for k, v in template.items() if type(v) is float}) for i in range(count)]
+
+        assert DecodeCondition(records[0], compact=True) == type(DecodeCondition(records[0], compact=True)).FromJson(records[0])
+
+        regular = _BytesPerRecord(DecodeCondition, records)
+        compact = _BytesPerRecord(lambda r: DecodeCondition(r, compact=True), records)
+        print(f'{name:>10}: {regular:8,.0f} -> {compact:8,.0f} bytes/record ({1 - compact / regular:.0%} smaller)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Recorded-shape `current_conditions` payloads shared by the benchmarks."""
+from __future__ import annotations
+
+import copy
+import sys
+
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    List
+)
+
+# Benchmarks run from a checkout, the same way src/aioweatherlink.py does
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+
+ISS: Dict[str, Any] = {
+    "lsid": 48308, "data_structure_type": 1, "txid": 1,
+    "temp": 62.7, "hum": 41.1, "dew_point": 38.9, "wet_bulb": 50.2, "heat_index": 61.8,
+    "wind_chill": 62.7, "thw_index": 61.8, "thsw_index": 66.1,
+    "wind_speed_last": 2, "wind_dir_last": 270,
+    "wind_speed_avg_last_1_min": 4, "wind_dir_scalar_avg_last_1_min": 265,
+    "wind_speed_avg_last_2_min": 3.5, "wind_dir_scalar_avg_last_2_min": 262,
+    "wind_speed_hi_last_2_min": 8, "wind_dir_at_hi_speed_last_2_min": 280,
+    "wind_speed_avg_last_10_min": 3.2, "wind_dir_scalar_avg_last_10_min": 258,
+    "wind_speed_hi_last_10_min": 11, "wind_dir_at_hi_speed_last_10_min": 290,
+    "rain_size": 2, "rain_rate_last": 0, "rain_rate_hi": 0, "rainfall_last_15_min": 0,
+    "rain_rate_hi_last_15_min": 0, "rainfall_last_60_min": 0, "rainfall_last_24_hr": 14,
+    "rain_storm": 14, "rain_storm_start_at": 1531700000,
+    "solar_rad": 747, "uv_index": 5.5, "rx_state": 0, "trans_battery_flag": 0,
+    "rainfall_daily": 6, "rainfall_monthly": 63, "rainfall_year": 412,
+    "rain_storm_last": 20, "rain_storm_last_start_at": 1531000000, "rain_storm_last_end_at": 1531090000
+}
+
+MOISTURE: Dict[str, Any] = {
+    "lsid": 3187671188, "data_structure_type": 2, "txid": 3,
+    "temp_1": 61.2, "temp_2": 59.8, "temp_3": None, "temp_4": None,
+    "moist_soil_1": 14, "moist_soil_2": 22, "moist_soil_3": None, "moist_soil_4": None,
+    "wet_leaf_1": 0, "wet_leaf_2": None,
+    "rx_state": 0, "trans_battery_flag": 0
+}
+
+BAROMETER: Dict[str, Any] = {
+    "lsid": 48306, "data_structure_type": 3,
+    "bar_sea_level": 30.008, "bar_trend": -0.012, "bar_absolute": 29.452
+}
+
+TEMP_HUM: Dict[str, Any] = {
+    "lsid": 48307, "data_structure_type": 4,
+    "temp_in": 78.0, "hum_in": 41.1, "dew_point_in": 52.8, "heat_index_in": 78.4
+}
+
+
+def Payload(did: str = '001D0A700002', ts: int = 1531754005) -> Dict[str, Any]:
+    """The `data` member of a `current_conditions` response with one record of each structure type"""
+    return {
+        "did": did,
+        "ts": ts,
+        "conditions": [copy.deepcopy(c) for c in (ISS, MOISTURE, BAROMETER, TEMP_HUM)]
+    }
+
+
+def Payloads(count: int, devices: int = 1) -> List[Dict[str, Any]]:
+    """`count` payloads spread across `devices` devices at 10 second intervals"""
+    return [Payload(did=f'001D0A7{i % devices:05X}', ts=1531754005 + 10 * (i // devices)) for i in range(count)]
@@ -1,21 +1,222 @@
-import aiohttp
-import asyncio
-import json
+from __future__ import annotations
+
 import logging
 import os
+import sys
+
+from argparse import ArgumentParser, Namespace
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    List,
+    Union
+)
+
+# Everything else is imported where it's used, so `--help` and `--once` start without loading aiohttp or asyncio
+if TYPE_CHECKING:
+    from api.collector import ShardedCollector
+    from api.poller import WeatherLinkPoller
+    from api.scheduler import Scheduler
+    from api.sinks import Sink
+    from api.weatherlink_conditions_report import RecordError, WeatherLinkConditionsReport
+
+
+def _Hosts(args: Namespace) -> List[str]:
+    hosts = list(args.host or [])
+    if args.hosts_file:
+        with open(args.hosts_file) as f:
+            hosts.extend(h for h in (line.split('#', 1)[0].strip() for line in f) if h)
+    if not hosts and os.environ.get('WEATHERLINK_HOSTNAME'):
+        hosts = [os.environ['WEATHERLINK_HOSTNAME']]
+    return hosts
+
+
+def _Outputs(args: Namespace) -> List[Sink]:
+    if not (args.influx or args.csv or args.parquet):
+        return []
+
+    from api import sinks
+
+    outputs: List[sinks.Sink] = []
+    if args.influx:
+        if args.influx.startswith(('http://', 'https://')):
+            outputs.append(sinks.InfluxHttpSink(args.influx, token=args.influx_token))
+        else:
+            outputs.append(sinks.InfluxLineSink(args.influx))
+    if args.csv:
+        outputs.append(sinks.CsvSink(args.csv))
+    if args.parquet:
+        outputs.append(sinks.ParquetSink(args.parquet))
+    return outputs
+
+
+def _LogErrors(source: str, errors: Iterable[RecordError]) -> None:
+    for e in errors:
+        action = 'Kept' if e.Kept else 'Left out'
+        logging.warning('%s record %d (lsid %s) from %s: %s: %s', action, e.Index, e.LsId, source, e.Error, e.Message)
+
+
+def _Once(args: Namespace) -> int:
+    # Fast path for cron-style runs: the standard library HTTP client, no event loop, one request per host
+    import http.client
+
+    from api import decoder, json_backend, units
+
+    unitSystem = units.UnitSystem(args.units)
+    reports = []
+    failed = False
+    for host in _Hosts(args):
+        connection = http.client.HTTPConnection(host, timeout=args.timeout)
+        try:
+            connection.request('GET', '/v1/current_conditions')
+            response = connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise http.client.HTTPException(f'{response.status} {response.reason}')
+            logging.debug(body)
+            report = decoder.DecodeReport(json_backend.Loads(body)['data'], units=unitSystem, tolerant=args.tolerant)
+            _LogErrors(host, report.Errors)
+            reports.append(report)
+        except (OSError, http.client.HTTPException, ValueError, KeyError) as e:
+            logging.error('Polling %s failed: %r', host, e)
+            failed = True
+        finally:
+            connection.close()
+
+    _Write(args, reports)
+    return 1 if failed else 0
+
+
+def _Write(args: Namespace, reports: List[WeatherLinkConditionsReport]) -> None:
+    # Output of the single-shot modes: archive and sinks if any were given, otherwise print
+    outputs = _Outputs(args)
+    if args.archive:
+        from api import archive
+        with archive.ArchiveWriter(args.archive) as writer:
+            for conds in reports:
+                writer.Append(conds)
+    if outputs:
+        from api import sinks
+        tables = sinks.Tabulate(reports)
+        for sink in outputs:
+            sink.Write(tables)
+            sink.Close()
+    if not args.archive and not outputs:
+        from pprint import pprint
+        for conds in reports:
+            pprint(conds)
 
-from argparse import ArgumentParser
 
-from api import weatherlink_conditions_report
+async def _Poll(args: Namespace) -> None:
+    import functools
 
+    from pprint import pprint
 
-async def main() -> None:
+    from api import archive, collector, instrumentation, poller, scheduler, sinks, units
+
+    hosts = _Hosts(args)
+    unitSystem = units.UnitSystem(args.units)
+    interval = args.interval if args.interval is not None else 10.0
+    writer = archive.ArchiveWriter(args.archive) if args.archive else None
+    outputs = _Outputs(args)
+    pipeline = sinks.SinkPipeline(outputs) if outputs else None
+    metrics = instrumentation.PollMetrics() if args.metrics_port else None
+    runner = await metrics.Serve(port=args.metrics_port) if metrics is not None else None
+    # Each worker gets an equal share of the global rate limit
+    maxRate = args.max_rate / args.workers if args.max_rate is not None and args.workers else args.max_rate
+    schedule: Callable[[], Scheduler]
+    if args.adaptive:
+        schedule = functools.partial(scheduler.AdaptiveScheduler, initial_interval=interval, max_rate=maxRate)
+    else:
+        schedule = functools.partial(scheduler.FixedScheduler, interval, max_rate=maxRate)
+
+    source: Union[ShardedCollector, WeatherLinkPoller]
+    if args.workers is not None:
+        source = collector.ShardedCollector(hosts, workers=args.workers, scheduler_factory=schedule, interval=interval, timeout=args.timeout, units=unitSystem, tolerant=args.tolerant)
+    else:
+        source = poller.WeatherLinkPoller(hosts, interval=interval, timeout=args.timeout, metrics=metrics, scheduler=schedule(), units=unitSystem, tolerant=args.tolerant)
+    if pipeline is not None:
+        await pipeline.Start()
+    try:
+        async with source as p:
+            async for conds in p:
+                _LogErrors(conds.DeviceId, conds.Errors)
+                if writer is not None:
+                    writer.Append(conds)
+                if pipeline is not None:
+                    await pipeline.Put(conds)
+                if writer is None and pipeline is None:
+                    pprint(conds)
+    finally:
+        if pipeline is not None:
+            await pipeline.Close()
+        if writer is not None:
+            writer.Close()
+        if runner is not None:
+            await runner.cleanup()
+
+
+async def _Fetch(args: Namespace) -> int:
+    # One report from every host, fetched concurrently over one session, then written like --once
+    import asyncio
+
+    import aiohttp
+
+    from api import decoder, json_backend, units
+
+    unitSystem = units.UnitSystem(args.units)
+    hosts = _Hosts(args)
+
+    async def _Get(session: aiohttp.ClientSession, host: str) -> WeatherLinkConditionsReport:
+        async with session.get(f'http://{host}/v1/current_conditions') as response:
+            response.raise_for_status()
+            body = await response.read()
+            logging.debug(body)
+            report = decoder.DecodeReport(json_backend.Loads(body)['data'], units=unitSystem, tolerant=args.tolerant)
+            _LogErrors(host, report.Errors)
+            return report
+
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=args.timeout)) as session:
+        results = await asyncio.gather(*(_Get(session, host) for host in hosts), return_exceptions=True)
+
+    reports: List[WeatherLinkConditionsReport] = []
+    failed = False
+    for host, result in zip(hosts, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logging.error('Polling %s failed: %r', host, result)
+            failed = True
+        else:
+            reports.append(result)
+
+    _Write(args, reports)
+    return 1 if failed else 0
+
+
+def main() -> None:
     parser = ArgumentParser(
         description = "Retrieve and parse data from Davis WeatherLink devices.",
         epilog = "https://github.com/leadzero/aioweatherlink"
     )
     parser.add_argument('-v', '--verbose', action='count', default=0, help='Increase level of verbosity (ex. -v for INFO, -vv for DEBUG')
-    parser.add_argument('-H', '--host', default=os.environ.get('WEATHERLINK_HOSTNAME'), help='REST API host')
+    parser.add_argument('-H', '--host', action='append', help='REST API host (repeat for multiple hosts)')
+    parser.add_argument('--hosts-file', metavar='FILE', help='Read REST API hosts from FILE, one per line (# starts a comment)')
+    parser.add_argument('--once', action='store_true', help='Fetch one report from every host with minimal startup cost and exit, nonzero if any failed')
+    parser.add_argument('-i', '--interval', type=float, help='Keep polling every INTERVAL seconds instead of exiting after one report')
+    parser.add_argument('--adaptive', action='store_true', help='Learn how often each device updates and poll just after updates, starting from INTERVAL')
+    parser.add_argument('--max-rate', type=float, help='Poll at most MAX_RATE times per second across all hosts')
+    parser.add_argument('-w', '--workers', type=int, help='Poll from WORKERS processes, sharding hosts between them (implies --interval 10 if not given)')
+    parser.add_argument('--units', choices=('imperial', 'metric', 'raw'), default='imperial', help='Report in imperial or metric units, or raw rain collector counts (default: imperial)')
+    parser.add_argument('--tolerant', action='store_true', help='Leave out malformed condition records with a warning instead of discarding the whole report')
+    parser.add_argument('-t', '--timeout', type=float, default=10.0, help='Request timeout in seconds (default: 10)')
+    parser.add_argument('-a', '--archive', metavar='DIRECTORY', help='Append every report to an archive in DIRECTORY instead of printing it')
+    parser.add_argument('--influx', metavar='FILE_OR_URL', help='Write InfluxDB line protocol to a file, or POST it to a write URL with precision=s')
+    parser.add_argument('--influx-token', default=os.environ.get('INFLUX_TOKEN'), help='InfluxDB API token (default: $INFLUX_TOKEN)')
+    parser.add_argument('--csv', metavar='DIRECTORY', help='Append reports to one CSV file per condition type in DIRECTORY')
+    parser.add_argument('--parquet', metavar='DIRECTORY', help='Write reports to one Parquet file per condition type in DIRECTORY (requires pyarrow)')
+    parser.add_argument('--metrics-port', type=int, help='Serve Prometheus metrics on PORT at /metrics while polling')
     #parser.add_argument('')
 
     args = parser.parse_args()
@@ -29,18 +230,24 @@ async def main() -> None:
 
     logging.debug(args)
 
-    async with aiohttp.ClientSession() as session:
-        url = f'http://{args.host}/v1/current_conditions'
+    if not (args.host or args.hosts_file or os.environ.get('WEATHERLINK_HOSTNAME')):
+        parser.error('no host given: use -H, --hosts-file or set WEATHERLINK_HOSTNAME')
 
-        async with session.get(url) as response:
-            js = await response.json()
-            logging.debug(await response.json())
-            conds = weatherlink_conditions_report.WeatherLinkConditionsReport.FromJson(js['data'])
-            from pprint import pprint
-            pprint(conds)
+    if args.once:
+        if args.interval is not None or args.workers is not None or args.metrics_port:
+            parser.error('--once cannot be combined with --interval, --workers or --metrics-port')
+        sys.exit(_Once(args))
+
+    if args.workers is not None and args.metrics_port:
+        parser.error('--metrics-port is not supported with --workers')
 
-    
+    import asyncio
+
+    if args.interval is not None or args.workers is not None:
+        asyncio.run(_Poll(args))
+    else:
+        sys.exit(asyncio.run(_Fetch(args)))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
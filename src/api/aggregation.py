@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import math
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import (
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple
+)
+
+from .device_condition_reports import CompactIssCondition, IssCondition
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+@dataclass
+class WindowStats:
+    """Summary of the samples in one window"""
+
+    Count: int
+    Min: float | None
+    Max: float | None
+    Mean: float | None
+
+
+class RollingWindow:
+    """
+    Min, max and mean of the samples from the last `span`, updated in O(1) amortized time per sample with monotonic
+    deques and a running sum. Samples must be added in time order.
+    """
+
+    def __init__(self, span: timedelta) -> None:
+        self.Span = span
+
+        self._samples: Deque[Tuple[datetime, float]] = deque()
+        self._min: Deque[Tuple[datetime, float]] = deque()
+        self._max: Deque[Tuple[datetime, float]] = deque()
+        self._sum = 0.0
+
+    def Add(self, timestamp: datetime, value: float) -> None:
+        self._samples.append((timestamp, value))
+        self._sum += value
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((timestamp, value))
+
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((timestamp, value))
+
+        self.Expire(timestamp)
+
+    def Expire(self, now: datetime) -> None:
+        """Drop samples older than `span` before `now`"""
+        cutoff = now - self.Span
+
+        while self._samples and self._samples[0][0] <= cutoff:
+            _, value = self._samples.popleft()
+            self._sum -= value
+        while self._min and self._min[0][0] <= cutoff:
+            self._min.popleft()
+        while self._max and self._max[0][0] <= cutoff:
+            self._max.popleft()
+
+        if not self._samples:
+            # Reset so floating point error from long runs of adds and removes doesn't accumulate
+            self._sum = 0.0
+
+    def Stats(self) -> WindowStats:
+        count = len(self._samples)
+        if count == 0:
+            return WindowStats(0, None, None, None)
+        return WindowStats(count, self._min[0][1], self._max[0][1], self._sum / count)
+
+
+class CircularRollingWindow:
+    """Circular mean of directions in degrees over the last `span`, using running sums of sines and cosines."""
+
+    def __init__(self, span: timedelta) -> None:
+        self.Span = span
+
+        self._samples: Deque[Tuple[datetime, float, float]] = deque()
+        self._sin = 0.0
+        self._cos = 0.0
+
+    def Add(self, timestamp: datetime, degrees: float) -> None:
+        radians = math.radians(degrees)
+        s, c = math.sin(radians), math.cos(radians)
+        self._samples.append((timestamp, s, c))
+        self._sin += s
+        self._cos += c
+
+        self.Expire(timestamp)
+
+    def Expire(self, now: datetime) -> None:
+        """Drop samples older than `span` before `now`"""
+        cutoff = now - self.Span
+
+        while self._samples and self._samples[0][0] <= cutoff:
+            _, s, c = self._samples.popleft()
+            self._sin -= s
+            self._cos -= c
+
+        if not self._samples:
+            self._sin = self._cos = 0.0
+
+    def Mean(self) -> float | None:
+        """Mean direction in degrees [0, 360), or None when empty or the directions cancel out"""
+        if not self._samples or math.hypot(self._sin, self._cos) < 1e-9 * len(self._samples):
+            return None
+        return math.degrees(math.atan2(self._sin, self._cos)) % 360.0
+
+
+DEFAULT_WINDOWS: Tuple[timedelta, ...] = (timedelta(hours=1), timedelta(hours=24), timedelta(days=7))
+"""Window spans used when none are given: 1 hour, 24 hours and 7 days"""
+
+
+@dataclass
+class IssWindowStats:
+    """Aggregates of one ISS over one window"""
+
+    Temperature: WindowStats
+    """Temperature in degrees Fahrenheit"""
+
+    WindGust: WindowStats
+    """10-minute wind gust speed in miles per hour"""
+
+    RainRate: WindowStats
+    """Rain rate in inches per hour"""
+
+    WindDirection: float | None
+    """Circular mean of the most recent wind direction in degrees"""
+
+
+class _IssWindows:
+    def __init__(self, span: timedelta) -> None:
+        self.Temperature = RollingWindow(span)
+        self.WindGust = RollingWindow(span)
+        self.RainRate = RollingWindow(span)
+        self.WindDirection = CircularRollingWindow(span)
+
+    def Add(self, timestamp: datetime, condition: IssCondition | CompactIssCondition) -> None:
+        if condition.Temperature is not None:
+            self.Temperature.Add(timestamp, condition.Temperature)
+
+        gust = condition.Wind10MinGust
+        if gust is not None and gust.Speed is not None:
+            self.WindGust.Add(timestamp, gust.Speed)
+
+        if condition.RainRate is not None:
+            self.RainRate.Add(timestamp, condition.RainRate)
+
+        wind = condition.WindLast
+        if wind is not None and wind.Direction is not None and wind.Speed:
+            # Direction is meaningless in calm air, so calm samples don't pull the mean
+            self.WindDirection.Add(timestamp, wind.Direction)
+
+        self.Expire(timestamp)
+
+    def Expire(self, now: datetime) -> None:
+        self.Temperature.Expire(now)
+        self.WindGust.Expire(now)
+        self.RainRate.Expire(now)
+        self.WindDirection.Expire(now)
+
+    def Stats(self) -> IssWindowStats:
+        return IssWindowStats(
+            Temperature=self.Temperature.Stats(),
+            WindGust=self.WindGust.Stats(),
+            RainRate=self.RainRate.Stats(),
+            WindDirection=self.WindDirection.Mean()
+        )
+
+
+class IssAggregator:
+    """
+    Incremental rolling-window statistics for every ISS seen in a report stream, keyed by LsId. Memory is bounded by
+    the number of samples inside the longest window, not by the length of the stream.
+    """
+
+    def __init__(self, windows: Iterable[timedelta] = DEFAULT_WINDOWS) -> None:
+        """
+        :param windows: Window spans to maintain
+        """
+        self.Windows: Tuple[timedelta, ...] = tuple(windows)
+
+        self._stations: Dict[int, Dict[timedelta, _IssWindows]] = {}
+        self._latest: Dict[int, datetime] = {}
+
+    def Add(self, report: WeatherLinkConditionsReport) -> None:
+        """
+        Add the ISS conditions of a report. Reports for the same ISS must arrive in time order; older ones are ignored.
+
+        :param report: Report from any device
+        """
+        for condition in report.DeviceConditions:
+            if not isinstance(condition, (IssCondition, CompactIssCondition)):
+                continue
+
+            latest = self._latest.get(condition.LsId)
+            if latest is not None and report.Timestamp <= latest:
+                continue
+            self._latest[condition.LsId] = report.Timestamp
+
+            windows = self._stations.get(condition.LsId)
+            if windows is None:
+                windows = self._stations[condition.LsId] = {span: _IssWindows(span) for span in self.Windows}
+
+            for w in windows.values():
+                w.Add(report.Timestamp, condition)
+
+    def LsIds(self) -> Tuple[int, ...]:
+        """Logical sensor ids with statistics"""
+        return tuple(self._stations)
+
+    def Stats(self, lsid: int, now: Optional[datetime] = None) -> Dict[timedelta, IssWindowStats]:
+        """
+        Statistics of one ISS for every window
+
+        :param lsid: Logical sensor id
+        :param now: Expire samples relative to this time rather than the newest sample, for ISSs that went quiet
+        """
+        windows = self._stations.get(lsid)
+        if windows is None:
+            raise KeyError(lsid)
+
+        if now is not None:
+            for w in windows.values():
+                w.Expire(now)
+
+        return {span: w.Stats() for span, w in windows.items()}
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import bisect
+import json
+import mmap
+import os
+import re
+import time
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import TracebackType
+from typing import (
+    IO,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type
+)
+
+from .json_backend import Loads
+from .serialization import ReportFromDict, ReportToDict
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+# An archive is a directory of append-only segments. Each segment is a text file with one report per line:
+#
+#     <unix timestamp>\t<device id>\t<ReportToDict() as JSON>\n
+#
+# The plain-text prefix lets readers skip records for other devices or times without decoding their JSON.
+# Next to each segment, a .idx file holds one JSON line every `index_interval` records:
+#
+#     {"ts": <latest timestamp written before offset>, "offset": <byte offset of the next record>}
+#
+# and, once the segment is complete, a final line summarising it:
+#
+#     {"first": <earliest timestamp>, "last": <latest timestamp>, "records": <count>, "devices": [<device ids>]}
+
+_SEGMENT_PATTERN = re.compile(r'^segment-(\d{6})\.log$')
+
+
+def _SegmentPath(directory: str, sequence: int) -> str:
+    return os.path.join(directory, f'segment-{sequence:06d}.log')
+
+
+class ArchiveWriter:
+    """
+    Appends reports to segment files in a directory, starting a new segment once the current one reaches
+    `max_segment_bytes` or has been open for `max_segment_age` seconds.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_segment_age: float = 24 * 60 * 60,
+        index_interval: int = 256,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        :param directory: Archive directory, created if missing
+        :param max_segment_bytes: Size at which a segment is closed and a new one started
+        :param max_segment_age: Seconds after which a segment is closed and a new one started
+        :param index_interval: Records between sparse index entries
+        :param clock: Monotonic time source in seconds
+        """
+        self.Directory = directory
+        self.MaxSegmentBytes = max_segment_bytes
+        self.MaxSegmentAge = max_segment_age
+        self.IndexInterval = index_interval
+
+        self._clock = clock
+        self._file: Optional[IO[bytes]] = None
+        self._index: Optional[IO[str]] = None
+        self._sequence = -1
+        self._opened = 0.0
+        self._records = 0
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+        self._devices: Set[str] = set()
+
+        os.makedirs(directory, exist_ok=True)
+        existing = [int(m.group(1)) for m in map(_SEGMENT_PATTERN.match, os.listdir(directory)) if m]
+        self._sequence = max(existing, default=-1)
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        self.Close()
+
+    def Append(self, report: WeatherLinkConditionsReport) -> None:
+        """
+        Write a report to the current segment
+
+        :param report: Report to archive
+        """
+        if self._file is not None and (
+            self._file.tell() >= self.MaxSegmentBytes or self._clock() - self._opened >= self.MaxSegmentAge
+        ):
+            self._Seal()
+
+        if self._file is None:
+            self._Open()
+        assert self._file is not None and self._index is not None
+
+        ts = report.Timestamp.timestamp()
+        if self._records % self.IndexInterval == 0:
+            self._index.write(json.dumps({'ts': self._last, 'offset': self._file.tell()}) + '\n')
+
+        line = json.dumps(ReportToDict(report), separators=(',', ':'))
+        self._file.write(f'{ts!r}\t{report.DeviceId}\t{line}\n'.encode())
+
+        self._records += 1
+        self._first = ts if self._first is None else min(self._first, ts)
+        self._last = ts if self._last is None else max(self._last, ts)
+        self._devices.add(report.DeviceId)
+
+    def Flush(self) -> None:
+        """Push buffered records to the operating system"""
+        if self._file is not None and self._index is not None:
+            self._file.flush()
+            self._index.flush()
+
+    def Close(self) -> None:
+        """Complete the current segment"""
+        if self._file is not None:
+            self._Seal()
+
+    def _Open(self) -> None:
+        self._sequence += 1
+        path = _SegmentPath(self.Directory, self._sequence)
+        self._file = open(path, 'ab')
+        self._index = open(path[:-len('.log')] + '.idx', 'a')
+        self._opened = self._clock()
+        self._records = 0
+        self._first = None
+        self._last = None
+        self._devices = set()
+
+    def _Seal(self) -> None:
+        assert self._file is not None and self._index is not None
+
+        self._index.write(json.dumps({
+            'first': self._first,
+            'last': self._last,
+            'records': self._records,
+            'devices': sorted(self._devices)
+        }) + '\n')
+        self._file.close()
+        self._index.close()
+        self._file = None
+        self._index = None
+
+
+@dataclass
+class _Segment:
+    Path: str
+    IndexTimestamps: List[float] = field(default_factory=list)
+    IndexOffsets: List[int] = field(default_factory=list)
+    First: Optional[float] = None
+    Last: Optional[float] = None
+    Devices: Optional[Set[str]] = None
+
+
+class ArchiveReader:
+    """
+    Reads reports back from an ArchiveWriter directory. Segments are memory-mapped and only the records needed for
+    a query are decoded; complete segments that can't hold a matching record are skipped by their index alone.
+    """
+
+    def __init__(self, directory: str, slack: float = 300.0) -> None:
+        """
+        :param directory: Archive directory
+        :param slack: Seconds past the end of a time range to keep scanning for records that arrived late
+        """
+        self.Directory = directory
+        self.Slack = slack
+
+    def _Segments(self) -> List[_Segment]:
+        sequences = sorted(int(m.group(1)) for m in map(_SEGMENT_PATTERN.match, os.listdir(self.Directory)) if m)
+        segments: List[_Segment] = []
+
+        for sequence in sequences:
+            segment = _Segment(_SegmentPath(self.Directory, sequence))
+            try:
+                with open(segment.Path[:-len('.log')] + '.idx') as f:
+                    for line in f:
+                        entry = json.loads(line)
+                        if 'offset' in entry:
+                            # The first entry of a segment has no earlier record, so nothing before it can be skipped
+                            segment.IndexTimestamps.append(entry['ts'] if entry['ts'] is not None else float('-inf'))
+                            segment.IndexOffsets.append(entry['offset'])
+                        else:
+                            segment.First = entry['first']
+                            segment.Last = entry['last']
+                            segment.Devices = set(entry['devices'])
+            except FileNotFoundError:
+                pass
+            segments.append(segment)
+
+        return segments
+
+    def Read(
+        self,
+        device_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Iterator[WeatherLinkConditionsReport]:
+        """
+        Lazily yield archived reports in the order they were written
+
+        :param device_id: Only reports from this device, or None for every device
+        :param start: Only reports at or after this time
+        :param end: Only reports at or before this time
+        """
+        for ts, did, line in self._Records(device_id, start, end):
+            yield ReportFromDict(Loads(line))
+
+    def _Records(
+        self,
+        device_id: Optional[str],
+        start: Optional[datetime],
+        end: Optional[datetime]
+    ) -> Iterator[Tuple[float, str, bytes]]:
+        startTs = start.timestamp() if start is not None else float('-inf')
+        endTs = end.timestamp() if end is not None else float('inf')
+        deviceKey = device_id.encode() if device_id is not None else None
+
+        for segment in self._Segments():
+            if segment.Devices is not None and device_id is not None and device_id not in segment.Devices:
+                continue
+            if segment.First is not None and segment.Last is not None and (segment.Last < startTs or segment.First > endTs):
+                continue
+            if os.path.getsize(segment.Path) == 0:
+                continue
+
+            # Index timestamps are the latest time written before each offset, so every record before the last
+            # entry older than `start` is older than `start` too
+            position = bisect.bisect_left(segment.IndexTimestamps, startTs) - 1
+            offset = segment.IndexOffsets[position] if position >= 0 else 0
+
+            with open(segment.Path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                while offset < len(m):
+                    newline = m.find(b'\n', offset)
+                    if newline < 0:
+                        break  # Partially written record at the end of an active segment
+                    line = m[offset:newline]
+                    offset = newline + 1
+
+                    tsField, didField, payload = line.split(b'\t', 2)
+                    ts = float(tsField)
+                    if ts > endTs + self.Slack:
+                        break
+                    if ts < startTs or ts > endTs or (deviceKey is not None and didField != deviceKey):
+                        continue
+
+                    yield ts, didField.decode(), payload
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import time
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Callable,
+    Optional
+)
+
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+@dataclass
+class _Entry:
+    Digest: bytes
+    Timestamp: datetime
+    Report: WeatherLinkConditionsReport
+    LastSeen: float
+
+
+class ReportCache:
+    """
+    Remembers the last `current_conditions` body received from each host. When a host returns the same body again,
+    the report built from it last time is reused instead of decoding it again. Hosts are evicted least recently polled
+    first once more than `max_hosts` are cached, and after `ttl` seconds without a poll.
+    """
+
+    def __init__(self, max_hosts: int = 4096, ttl: float = 300.0, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        :param max_hosts: Maximum hosts to keep a report for
+        :param ttl: Seconds after the last poll of a host before its entry is dropped
+        :param clock: Monotonic time source in seconds
+        """
+        self.MaxHosts = max_hosts
+        self.Ttl = ttl
+
+        self.Hits = 0
+        """Polls answered from the cache"""
+
+        self.Misses = 0
+        """Polls that had to be decoded"""
+
+        self.Evictions = 0
+        """Entries dropped for capacity or age"""
+
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def Digest(body: bytes) -> bytes:
+        """Hash identifying a response body"""
+        return hashlib.blake2b(body, digest_size=16).digest()
+
+    def Get(self, host: str, digest: bytes) -> Optional[WeatherLinkConditionsReport]:
+        """
+        Report previously built from an identical body, counting a hit or a miss
+
+        :param host: Host the body was received from
+        :param digest: Digest() of the body
+        """
+        entry = self._entries.get(host)
+        now = self._clock()
+
+        if entry is None or entry.Digest != digest or now - entry.LastSeen > self.Ttl:
+            self.Misses += 1
+            return None
+
+        entry.LastSeen = now
+        self._entries.move_to_end(host)
+        self.Hits += 1
+        return entry.Report
+
+    def Put(self, host: str, digest: bytes, report: WeatherLinkConditionsReport) -> None:
+        """
+        Remember the report built from a body
+
+        :param host: Host the body was received from
+        :param digest: Digest() of the body
+        :param report: Report decoded from the body
+        """
+        now = self._clock()
+        self._entries[host] = _Entry(digest, report.Timestamp, report, now)
+        self._entries.move_to_end(host)
+        self._Evict(now)
+
+    def LastTimestamp(self, host: str) -> Optional[datetime]:
+        """Timestamp of the last report cached for a host"""
+        entry = self._entries.get(host)
+        return entry.Timestamp if entry is not None else None
+
+    def Remove(self, host: str) -> None:
+        """Forget the report of a host"""
+        self._entries.pop(host, None)
+
+    def _Evict(self, now: float) -> None:
+        # Entries are ordered by last poll, so the oldest are always at the front
+        while self._entries:
+            host, entry = next(iter(self._entries.items()))
+            if len(self._entries) <= self.MaxHosts and now - entry.LastSeen <= self.Ttl:
+                break
+            del self._entries[host]
+            self.Evictions += 1
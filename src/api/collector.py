@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import multiprocessing
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from datetime import datetime, timezone
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+from .json_backend import Dumps, Loads
+from .poller import WeatherLinkPoller
+from .scheduler import Scheduler
+from .serialization import ConditionFromRow, ConditionToRow
+from .weatherlink_conditions_report import RecordError, WeatherLinkConditionsReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HashRing:
+    """
+    Consistent hash ring mapping keys to nodes. Each node owns `replicas` points on the ring, so adding or removing a
+    node only moves the keys next to its points rather than reshuffling everything.
+    """
+
+    def __init__(self, nodes: Iterable[int], replicas: int = 64) -> None:
+        """
+        :param nodes: Node ids
+        :param replicas: Points per node; more gives a more even spread
+        """
+        points = sorted((self._Hash(f'{node}:{i}'), node) for node in nodes for i in range(replicas))
+        if not points:
+            raise ValueError('HashRing needs at least one node')
+
+        self._hashes = [h for h, _ in points]
+        self._nodes = [n for _, n in points]
+
+    @staticmethod
+    def _Hash(key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+    def Node(self, key: str) -> int:
+        """Node that owns a key"""
+        position = bisect.bisect(self._hashes, self._Hash(key)) % len(self._hashes)
+        return self._nodes[position]
+
+    def Shard(self, keys: Iterable[str]) -> Dict[int, List[str]]:
+        """Keys grouped by owning node"""
+        shards: Dict[int, List[str]] = {}
+        for key in keys:
+            shards.setdefault(self.Node(key), []).append(key)
+        return shards
+
+
+def _Work(
+    hosts: List[str],
+    options: Dict[str, Any],
+    scheduler_factory: Optional[Callable[[], Scheduler]],
+    connection: Connection
+) -> None:
+    # Worker process entry point: poll a shard of hosts and send every report to the parent as JSON. Records are
+    # decoded here, in parallel, and sent as rows of final field values, so the parent only has to build the
+    # objects rather than parse and convert every field again.
+    async def _Run() -> None:
+        scheduler = scheduler_factory() if scheduler_factory is not None else None
+        async with WeatherLinkPoller(hosts, scheduler=scheduler, **options) as poller:
+            async for report in poller:
+                obj: Dict[str, Any] = {
+                    'did': report.DeviceId,
+                    'ts': report.Timestamp.timestamp(),
+                    'conditions': [ConditionToRow(c) for c in report.DeviceConditions]
+                }
+                if report.Errors:
+                    obj['errors'] = [asdict(e) for e in report.Errors]
+                # A full pipe blocks the whole loop, which is the backpressure we want from a slow parent
+                connection.send_bytes(Dumps(obj))
+
+    try:
+        asyncio.run(_Run())
+    except (KeyboardInterrupt, BrokenPipeError):
+        pass
+    finally:
+        connection.close()
+
+
+def _ReceiveBatch(connection: Connection, limit: int = 256) -> List[bytes]:
+    # Take one message, then whatever else is already waiting, so a busy pipe costs one event loop wakeup per batch
+    # rather than per report. End of file after the first message is left for the next call to raise.
+    batch = [connection.recv_bytes()]
+    try:
+        while len(batch) < limit and connection.poll():
+            batch.append(connection.recv_bytes())
+    except (EOFError, OSError):
+        pass
+    return batch
+
+
+class ShardedCollector:
+    """
+    Polls a large fleet from several processes. Hosts are spread over `workers` processes by consistent hash, each
+    worker runs its own event loop, connection pool and WeatherLinkPoller, and decoded conditions are sent back to
+    this process as compact JSON rows and delivered through an async iterator, like WeatherLinkPoller:
+
+        async with ShardedCollector(hosts, workers=4, interval=10) as collector:
+            async for report in collector:
+                ...
+
+    A worker that exits unexpectedly is restarted with the same hosts.
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        workers: Optional[int] = None,
+        queue_size: int = 1024,
+        scheduler_factory: Optional[Callable[[], Scheduler]] = None,
+        **options: Any
+    ) -> None:
+        """
+        :param hosts: WeatherLink Live host names or addresses (optionally with :port)
+        :param workers: Number of worker processes, default one per CPU
+        :param queue_size: Maximum reports waiting to be consumed before reading from workers pauses
+        :param scheduler_factory: Picklable callable creating each worker's Scheduler, e.g. a functools.partial of
+            AdaptiveScheduler; a rate limit given to it applies per worker
+        :param options: WeatherLinkPoller arguments for every worker, e.g. interval or timeout
+        """
+        self.Hosts: List[str] = list(dict.fromkeys(hosts))
+        self.Workers = max(1, min(workers or os.cpu_count() or 1, len(self.Hosts) or 1))
+        self.Options = options
+        self.SchedulerFactory = scheduler_factory
+
+        self.Shards: Dict[int, List[str]] = HashRing(range(self.Workers)).Shard(self.Hosts)
+        """Hosts polled by each worker"""
+
+        self._context = multiprocessing.get_context('spawn')
+        # None marks the end of iteration after Close()
+        self._queue: asyncio.Queue[Optional[WeatherLinkConditionsReport]] = asyncio.Queue(maxsize=queue_size)
+        self._ended = False
+        self._processes: Dict[int, Tuple[BaseProcess, Connection]] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+        self._readers: Optional[ThreadPoolExecutor] = None
+        self._closing = False
+
+    async def __aenter__(self) -> ShardedCollector:
+        await self.Start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        await self.Close()
+
+    def __aiter__(self) -> ShardedCollector:
+        return self
+
+    async def __anext__(self) -> WeatherLinkConditionsReport:
+        if not self._tasks and self._queue.empty():
+            raise StopAsyncIteration
+        report = await self._queue.get()
+        if report is None:
+            # Leave the marker for any other consumer waiting
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+        return report
+
+    async def Start(self) -> None:
+        """Start the worker processes."""
+        if self._tasks:
+            return
+
+        if self._ended:
+            self._queue.get_nowait()
+            self._ended = False
+
+        self._closing = False
+        # One thread per worker waits on its pipe, so blocking reads never hold up the event loop
+        self._readers = ThreadPoolExecutor(max_workers=len(self.Shards), thread_name_prefix='weatherlink-collector')
+        for worker in self.Shards:
+            self._Spawn(worker)
+            self._tasks.append(asyncio.create_task(self._Receive(worker), name=f'collector worker {worker}'))
+
+    async def Close(self) -> None:
+        """Stop the workers and wait for them to exit."""
+        self._closing = True
+        for process, _ in self._processes.values():
+            process.terminate()
+
+        loop = asyncio.get_running_loop()
+        for process, _ in self._processes.values():
+            await loop.run_in_executor(None, process.join)
+
+        tasks = self._tasks
+        self._tasks = []
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._End()
+
+        for _, connection in self._processes.values():
+            connection.close()
+        self._processes.clear()
+
+        if self._readers is not None:
+            # The readers have seen end of file from the exited workers, so this doesn't wait
+            self._readers.shutdown()
+            self._readers = None
+
+    def _End(self) -> None:
+        # Wake consumers waiting in __anext__. Only an empty queue can have any, and reports still queued end
+        # iteration once they have been taken.
+        if self._queue.empty() and not self._ended:
+            self._queue.put_nowait(None)
+            self._ended = True
+
+    def _Spawn(self, worker: int) -> None:
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=_Work,
+            args=(self.Shards[worker], self.Options, self.SchedulerFactory, sender),
+            name=f'weatherlink-collector-{worker}',
+            daemon=True
+        )
+        process.start()
+        # Only the worker may hold the sending end, so its exit shows up here as end of file
+        sender.close()
+        self._processes[worker] = (process, receiver)
+        _LOGGER.info('Started collector worker %d (pid %s) for %d host(s)', worker, process.pid, len(self.Shards[worker]))
+
+    async def _Receive(self, worker: int) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            process, connection = self._processes[worker]
+            try:
+                batch = await loop.run_in_executor(self._readers, _ReceiveBatch, connection)
+            except (EOFError, OSError):
+                if self._closing:
+                    return
+                _LOGGER.warning('Collector worker %d exited with code %s, restarting', worker, process.exitcode)
+                connection.close()
+                await loop.run_in_executor(None, process.join)
+                # Don't spin if the worker can't start at all
+                await asyncio.sleep(1.0)
+                self._Spawn(worker)
+                continue
+
+            for body in batch:
+                obj = Loads(body)
+                report = WeatherLinkConditionsReport(
+                    DeviceId=obj['did'],
+                    Timestamp=datetime.fromtimestamp(obj['ts'], timezone.utc),
+                    DeviceConditions=[ConditionFromRow(row) for row in obj['conditions']],
+                    Errors=[RecordError(**e) for e in obj.get('errors', ())]
+                )
+                await self._queue.put(report)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import math
+
+from dataclasses import dataclass, fields
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+
+from .decoder import CONDITION_SPECS, ConditionSpec
+from .units import RAIN_FACTORS, Conversion, ConversionT, UnitSystem
+
+
+@dataclass(frozen=True)
+class Column:
+    """One output column of a condition table"""
+
+    Name: str
+    """Column name, the condition attribute name with Wind and slot fields flattened"""
+
+    Key: str
+    """Key of the value in the API record"""
+
+    Kind: str
+    """How the value is decoded: value, integer, rain, timestamp, rx_state or battery"""
+
+    Attribute: str
+    """Condition attribute holding the value"""
+
+    Part: str | int | None = None
+    """Wind member (Speed or Direction) or slot number within the attribute, if the column is one part of it"""
+
+
+def _Columns(spec: ConditionSpec) -> Tuple[Column, ...]:
+    # Column order follows the condition class's field order, so the dataclasses remain the schema
+    plain = dict(spec.Fields)
+    rain = dict(spec.RainFields)
+    timestamps = dict(spec.TimestampFields)
+    winds = {attr: (speed, direction) for attr, speed, direction in spec.WindFields}
+    slots = dict(spec.SlotFields)
+
+    columns: List[Column] = []
+    for f in fields(spec.Class):
+        if f.name in plain:
+            columns.append(Column(f.name, plain[f.name], 'integer' if f.type == 'int' else 'value', f.name))
+        elif f.name in rain:
+            columns.append(Column(f.name, rain[f.name], 'rain', f.name))
+        elif f.name in timestamps:
+            columns.append(Column(f.name, timestamps[f.name], 'timestamp', f.name))
+        elif f.name in winds:
+            speed, direction = winds[f.name]
+            columns.append(Column(f'{f.name}Speed', speed, 'value', f.name, 'Speed'))
+            columns.append(Column(f'{f.name}Direction', direction, 'value', f.name, 'Direction'))
+        elif f.name in slots:
+            columns.extend(Column(f'{f.name}{i}', key, 'value', f.name, i) for i, key in enumerate(slots[f.name], 1))
+        elif f.name == 'RxState' and spec.RxStateKey is not None:
+            columns.append(Column(f.name, spec.RxStateKey, 'rx_state', f.name))
+        elif f.name == 'TxBatteryLow' and spec.BatteryKey is not None:
+            columns.append(Column(f.name, spec.BatteryKey, 'battery', f.name))
+        else:
+            raise TypeError(f'{spec.Class.__name__}.{f.name} has no decoding spec')
+
+    return tuple(columns)
+
+
+COLUMNS: Dict[int, Tuple[Column, ...]] = {
+    structureType: _Columns(spec) for structureType, spec in CONDITION_SPECS.items()
+}
+"""Columns of the table produced for each known `data_structure_type`, after the DeviceId and Timestamp columns"""
+
+_NAN = math.nan
+
+
+def _Gather(payloads: Iterable[Dict[str, Any]]) -> Dict[int, Tuple[List[str], List[int], List[Dict[str, Any]]]]:
+    # Group raw records by structure type, remembering the parent device and report time of each
+    groups: Dict[int, Tuple[List[str], List[int], List[Dict[str, Any]]]] = {}
+
+    for obj in payloads:
+        did = obj['did']
+        ts = obj['ts']
+        for c in obj['conditions']:
+            structureType = c['data_structure_type']
+            if structureType not in COLUMNS:
+                continue
+
+            group = groups.get(structureType)
+            if group is None:
+                group = groups[structureType] = ([], [], [])
+            group[0].append(did)
+            group[1].append(ts)
+            group[2].append(c)
+
+    return groups
+
+
+def _Conversion(column: Column, units: UnitSystem) -> Optional[ConversionT]:
+    # Wind speed columns are named after the flattened attribute, slot columns after the attribute holding them
+    return Conversion(column.Name, units) or Conversion(column.Attribute, units)
+
+
+def DecodeColumns(
+    payloads: Iterable[Dict[str, Any]],
+    units: UnitSystem = UnitSystem.Imperial
+) -> Dict[int, Dict[str, List[Any]]]:
+    """
+    Decode many reports into one column dict per `data_structure_type`, without building condition objects.
+    Numeric nulls become NaN, rain counts are converted to inches (or the chosen units), timestamps stay as UNIX
+    seconds (None when null) and RxState stays as its integer value (None when null).
+
+    :param payloads: `data` members of `current_conditions` responses
+    :param units: Unit system of the decoded values, converted in the same pass that replaces nulls
+    """
+    rainFactors = RAIN_FACTORS[units]
+    conversions = {t: [_Conversion(c, units) for c in columns] for t, columns in COLUMNS.items()}
+    result: Dict[int, Dict[str, List[Any]]] = {}
+
+    for structureType, (dids, stamps, records) in _Gather(payloads).items():
+        table: Dict[str, List[Any]] = {'DeviceId': dids, 'Timestamp': stamps}
+
+        factors: List[float] = []
+        if CONDITION_SPECS[structureType].RainFields:
+            factors = [rainFactors.get(r['rain_size'], _NAN) for r in records]
+
+        for column, conversion in zip(COLUMNS[structureType], conversions[structureType]):
+            values = [r[column.Key] for r in records]
+            if column.Kind == 'value' and conversion is not None:
+                scale, offset = conversion
+                values = [_NAN if v is None else v * scale + offset for v in values]
+            elif column.Kind == 'value':
+                values = [_NAN if v is None else v for v in values]
+            elif column.Kind == 'rain':
+                values = [_NAN if v is None else v * f for v, f in zip(values, factors)]
+            elif column.Kind == 'battery':
+                values = [v == 1 for v in values]
+            table[column.Name] = values
+
+        result[structureType] = table
+
+    return result
+
+
+def DecodeArrays(payloads: Iterable[Dict[str, Any]], units: UnitSystem = UnitSystem.Imperial) -> Dict[int, Any]:
+    """
+    Decode many reports into one NumPy structured array per `data_structure_type`, without building condition
+    objects. Measurements are float64 with NaN for nulls, timestamps are datetime64[s] with NaT for nulls, RxState is
+    int8 with -1 for null, and rain counts are converted to inches (or the chosen units) in one vectorized step per
+    `rain_size`.
+
+    :param payloads: `data` members of `current_conditions` responses
+    :param units: Unit system of the decoded values, converted with one vectorized step per column
+    """
+    # Imported here rather than with the module: numpy is optional and takes longer to import than this package
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - numpy is optional
+        raise ImportError('DecodeArrays requires numpy, use DecodeColumns instead') from None
+
+    rainFactors = np.full(max(RAIN_FACTORS[units]) + 1, np.nan)
+    for size, factor in RAIN_FACTORS[units].items():
+        rainFactors[size] = factor
+
+    dtypes = {
+        'value': np.float64,
+        'integer': np.int64,
+        'rain': np.float64,
+        'timestamp': 'datetime64[s]',
+        'rx_state': np.int8,
+        'battery': np.bool_
+    }
+
+    result: Dict[int, Any] = {}
+
+    for structureType, (dids, stamps, records) in _Gather(payloads).items():
+        columns = COLUMNS[structureType]
+        array = np.empty(len(records), dtype=[
+            ('DeviceId', f'U{max(len(d) for d in dids)}'),
+            ('Timestamp', 'datetime64[s]'),
+            *((c.Name, dtypes[c.Kind]) for c in columns)
+        ])
+        array['DeviceId'] = dids
+        array['Timestamp'] = np.array(stamps, dtype='datetime64[s]')
+
+        factors = None
+        if CONDITION_SPECS[structureType].RainFields:
+            sizes = np.fromiter((r['rain_size'] for r in records), dtype=np.int64, count=len(records))
+            known = (sizes >= 0) & (sizes < len(rainFactors))
+            factors = np.full(len(records), np.nan)
+            factors[known] = rainFactors[sizes[known]]
+
+        for column in columns:
+            values = [r[column.Key] for r in records]
+            if column.Kind == 'value':
+                array[column.Name] = np.array(values, dtype=np.float64)
+                conversion = _Conversion(column, units)
+                if conversion is not None:
+                    array[column.Name] *= conversion[0]
+                    array[column.Name] += conversion[1]
+            elif column.Kind == 'integer':
+                array[column.Name] = values
+            elif column.Kind == 'rain':
+                assert factors is not None
+                array[column.Name] = np.array(values, dtype=np.float64) * factors
+            elif column.Kind == 'timestamp':
+                array[column.Name] = np.array(['NaT' if v is None else v for v in values], dtype='datetime64[s]')
+            elif column.Kind == 'rx_state':
+                array[column.Name] = [-1 if v is None else v for v in values]
+            elif column.Kind == 'battery':
+                array[column.Name] = np.array(values, dtype=object) == 1
+
+        result[structureType] = array
+
+    return result
@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+import logging
+
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from .device_condition_reports import (
+    CompactIssCondition,
+    CompactLeafSoilMoistureCondition,
+    CompactLssBarometerCondition,
+    CompactLssTempHumidityCondition,
+    IssCondition,
+    IssRealTimeCondition,
+    LeafSoilMoistureCondition,
+    LssBarometerCondition,
+    LssTempHumidityCondition
+)
+from .device_condition_reports.iss import RAIN_INCHES_PER_COUNT, Wind
+from .device_condition_reports.receiver_state import RxState
+from .units import CONVERSIONS, RAIN_FACTORS, Conversion, UnitSystem
+from .weatherlink_conditions_report import RECORD_ERRORS, DeviceConditionT, RecordError, WeatherLinkConditionsReport
+from .weatherlink_realtime_report import WeatherLinkRealTimeReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ConditionSpec:
+    """
+    How to build one condition class from its API record. Each entry pairs a dataclass field with the JSON key(s)
+    it is decoded from.
+    """
+
+    Class: type
+    """Condition class to construct"""
+
+    Fields: Tuple[Tuple[str, str], ...] = ()
+    """Values copied as-is"""
+
+    ScaledFields: Tuple[Tuple[str, str, float, float], ...] = ()
+    """Values converted to another unit as `value * scale + offset`, with (attribute, key, scale, offset) entries"""
+
+    RainFields: Tuple[Tuple[str, str], ...] = ()
+    """Rain collector counts converted using the record's `rain_size` and RainFactors"""
+
+    RainFactors: Dict[int, float] = field(default_factory=lambda: RAIN_INCHES_PER_COUNT, hash=False)
+    """Rain per collector count for each `rain_size`"""
+
+    TimestampFields: Tuple[Tuple[str, str], ...] = ()
+    """UNIX timestamps converted to UTC datetimes"""
+
+    UnsetTimestamps: Tuple[Optional[int], ...] = (None,)
+    """TimestampFields values that mean the time is not set and decode to None"""
+
+    WindFields: Tuple[Tuple[str, str, str], ...] = ()
+    """Speed and direction key pairs combined into a Wind"""
+
+    WindScale: float = 1.0
+    """Factor applied to WindFields speeds"""
+
+    SlotFields: Tuple[Tuple[str, Tuple[str, ...]], ...] = ()
+    """Numbered sensor slots gathered into a dict keyed from 1, or a tuple when TupleSlots is set"""
+
+    ScaledSlotFields: Tuple[Tuple[str, Tuple[str, ...], float, float], ...] = ()
+    """Numbered sensor slots gathered like SlotFields and converted like ScaledFields"""
+
+    TupleSlots: bool = False
+    """Gather SlotFields into tuples instead of dicts"""
+
+    RxStateKey: Optional[str] = None
+    """Key of the radio receiver state, if the record has one"""
+
+    BatteryKey: Optional[str] = None
+    """Key of the transmitter battery flag, if the record has one"""
+
+
+CONDITION_SPECS: Dict[int, ConditionSpec] = {
+    1: ConditionSpec(
+        Class=IssCondition,
+        Fields=(
+            ('LsId', 'lsid'),
+            ('TxId', 'txid'),
+            ('Temperature', 'temp'),
+            ('Humidity', 'hum'),
+            ('DewPoint', 'dew_point'),
+            ('WetBulb', 'wet_bulb'),
+            ('HeatIndex', 'heat_index'),
+            ('WindChill', 'wind_chill'),
+            ('THWIndex', 'thw_index'),
+            ('THSWIndex', 'thsw_index'),
+            ('SolarRadiation', 'solar_rad'),
+            ('UVIndex', 'uv_index')
+        ),
+        RainFields=(
+            ('RainRate', 'rain_rate_last'),
+            ('Rain1MinMax', 'rain_rate_hi'),
+            ('Rain15MinTotal', 'rainfall_last_15_min'),
+            ('Rain15MinMax', 'rain_rate_hi_last_15_min'),
+            ('Rain60MinTotal', 'rainfall_last_60_min'),
+            ('Rain24HourTotal', 'rainfall_last_24_hr'),
+            ('RainStormTotal', 'rain_storm'),
+            ('RainStormLastTotal', 'rain_storm_last'),
+            ('RainDaily', 'rainfall_daily'),
+            ('RainMonthly', 'rainfall_monthly'),
+            ('RainYearly', 'rainfall_year')
+        ),
+        TimestampFields=(
+            ('RainStormStarted', 'rain_storm_start_at'),
+            ('RainStormLastStarted', 'rain_storm_last_start_at'),
+            ('RainStormLastEnded', 'rain_storm_last_end_at')
+        ),
+        WindFields=(
+            ('WindLast', 'wind_speed_last', 'wind_dir_last'),
+            ('Wind1MinAverage', 'wind_speed_avg_last_1_min', 'wind_dir_scalar_avg_last_1_min'),
+            ('Wind2MinAverage', 'wind_speed_avg_last_2_min', 'wind_dir_scalar_avg_last_2_min'),
+            ('Wind2MinGust', 'wind_speed_hi_last_2_min', 'wind_dir_at_hi_speed_last_2_min'),
+            ('Wind10MinAverage', 'wind_speed_avg_last_10_min', 'wind_dir_scalar_avg_last_10_min'),
+            ('Wind10MinGust', 'wind_speed_hi_last_10_min', 'wind_dir_at_hi_speed_last_10_min')
+        ),
+        RxStateKey='rx_state',
+        BatteryKey='trans_battery_flag'
+    ),
+    2: ConditionSpec(
+        Class=LeafSoilMoistureCondition,
+        Fields=(
+            ('LsId', 'lsid'),
+            ('TxId', 'txid')
+        ),
+        SlotFields=(
+            ('SoilTemperatures', ('temp_1', 'temp_2', 'temp_3', 'temp_4')),
+            ('SoilMoisture', ('moist_soil_1', 'moist_soil_2', 'moist_soil_3', 'moist_soil_4')),
+            ('LeafWetness', ('wet_leaf_1', 'wet_leaf_2'))
+        ),
+        RxStateKey='rx_state',
+        BatteryKey='trans_battery_flag'
+    ),
+    3: ConditionSpec(
+        Class=LssBarometerCondition,
+        Fields=(
+            ('LsId', 'lsid'),
+            ('Pressure', 'bar_absolute'),
+            ('SeaLevelPressure', 'bar_sea_level'),
+            ('ThreeHourPressureTrend', 'bar_trend')
+        )
+    ),
+    4: ConditionSpec(
+        Class=LssTempHumidityCondition,
+        Fields=(
+            ('LsId', 'lsid'),
+            ('Temperature', 'temp_in'),
+            ('Humidity', 'hum_in'),
+            ('DewPoint', 'dew_point_in'),
+            ('HeatIndex', 'heat_index_in')
+        )
+    )
+}
+"""Decoding spec for each known `data_structure_type`"""
+
+
+def _InlineWinds(fields: Tuple[Tuple[str, str, str], ...]) -> Tuple[Tuple[str, str], ...]:
+    return tuple(f for attr, speed, direction in fields for f in ((f'{attr}Speed', speed), (f'{attr}Direction', direction)))
+
+
+COMPACT_CONDITION_SPECS: Dict[int, ConditionSpec] = {
+    1: replace(
+        CONDITION_SPECS[1],
+        Class=CompactIssCondition,
+        Fields=CONDITION_SPECS[1].Fields + _InlineWinds(CONDITION_SPECS[1].WindFields),
+        WindFields=()
+    ),
+    2: replace(
+        CONDITION_SPECS[2],
+        Class=CompactLeafSoilMoistureCondition,
+        SlotFields=(
+            ('SoilTemperatureSlots', ('temp_1', 'temp_2', 'temp_3', 'temp_4')),
+            ('SoilMoistureSlots', ('moist_soil_1', 'moist_soil_2', 'moist_soil_3', 'moist_soil_4')),
+            ('LeafWetnessSlots', ('wet_leaf_1', 'wet_leaf_2'))
+        ),
+        TupleSlots=True
+    ),
+    3: replace(CONDITION_SPECS[3], Class=CompactLssBarometerCondition),
+    4: replace(CONDITION_SPECS[4], Class=CompactLssTempHumidityCondition)
+}
+"""Decoding spec for each known `data_structure_type`, producing the slotted Compact* condition classes"""
+
+REAL_TIME_SPEC = ConditionSpec(
+    Class=IssRealTimeCondition,
+    Fields=(
+        ('LsId', 'lsid'),
+        ('TxId', 'txid')
+    ),
+    RainFields=(
+        ('RainRate', 'rain_rate_last'),
+        ('Rain15MinTotal', 'rain_15_min'),
+        ('Rain60MinTotal', 'rain_60_min'),
+        ('Rain24HourTotal', 'rain_24_hr'),
+        ('RainStormTotal', 'rain_storm'),
+        ('RainDaily', 'rainfall_daily'),
+        ('RainMonthly', 'rainfall_monthly'),
+        ('RainYearly', 'rainfall_year')
+    ),
+    TimestampFields=(
+        ('RainStormStarted', 'rain_storm_start_at'),
+    ),
+    # Real-time broadcasts send 0 rather than null when no storm is in progress
+    UnsetTimestamps=(None, 0),
+    WindFields=(
+        ('WindLast', 'wind_speed_last', 'wind_dir_last'),
+        ('Wind10MinGust', 'wind_speed_hi_last_10_min', 'wind_dir_at_hi_speed_last_10_min')
+    )
+)
+"""Decoding spec for the ISS records (`data_structure_type` 1) of real-time UDP broadcasts"""
+
+def _WithUnits(spec: ConditionSpec, units: UnitSystem) -> ConditionSpec:
+    # Move every field with a unit conversion into the scaled groups, so decoding converts while it copies
+    if units is UnitSystem.Imperial:
+        return spec
+
+    fields: List[Tuple[str, str]] = []
+    scaled: List[Tuple[str, str, float, float]] = []
+    for attr, key in spec.Fields:
+        conversion = Conversion(attr, units)
+        if conversion is None:
+            fields.append((attr, key))
+        else:
+            scaled.append((attr, key, *conversion))
+
+    slots: List[Tuple[str, Tuple[str, ...]]] = []
+    scaledSlots: List[Tuple[str, Tuple[str, ...], float, float]] = []
+    for attr, keys in spec.SlotFields:
+        conversion = Conversion(attr, units)
+        if conversion is None:
+            slots.append((attr, keys))
+        else:
+            scaledSlots.append((attr, keys, *conversion))
+
+    return replace(
+        spec,
+        Fields=tuple(fields),
+        ScaledFields=spec.ScaledFields + tuple(scaled),
+        RainFactors=RAIN_FACTORS[units],
+        WindScale=CONVERSIONS[units].get('speed', (1.0, 0.0))[0],
+        SlotFields=tuple(slots),
+        ScaledSlotFields=spec.ScaledSlotFields + tuple(scaledSlots)
+    )
+
+
+_SPECS: Dict[Tuple[bool, UnitSystem], Dict[int, ConditionSpec]] = {
+    (compact, units): {t: _WithUnits(spec, units) for t, spec in specs.items()}
+    for compact, specs in ((False, CONDITION_SPECS), (True, COMPACT_CONDITION_SPECS))
+    for units in UnitSystem
+}
+
+_REAL_TIME_SPECS: Dict[UnitSystem, ConditionSpec] = {units: _WithUnits(REAL_TIME_SPEC, units) for units in UnitSystem}
+
+_RX_STATES: Dict[int | None, RxState | None] = {None: None, **{s.value: s for s in RxState}}
+
+
+@lru_cache(maxsize=4096)
+def _Timestamp(ts: int) -> datetime:
+    # Storm start/end times repeat on every poll until the storm changes, so most lookups are cache hits
+    return datetime.fromtimestamp(ts, timezone.utc)
+
+
+def _Constructor(cls: type) -> Callable[[Dict[str, Any]], Any]:
+    # The decoded values already cover every field, so plain dataclasses can skip __init__ argument binding and
+    # adopt them directly. Classes with __post_init__ or without an instance __dict__ go through __init__.
+    if hasattr(cls, '__post_init__') or '__slots__' in cls.__dict__:
+        return lambda values: cls(**values)
+
+    def _Construct(values: Dict[str, Any]) -> Any:
+        instance: Any = object.__new__(cls)
+        instance.__dict__.update(values)
+        return instance
+
+    return _Construct
+
+
+_CONSTRUCTORS: Dict[type, Callable[[Dict[str, Any]], Any]] = {
+    spec.Class: _Constructor(spec.Class)
+    for spec in (*CONDITION_SPECS.values(), *COMPACT_CONDITION_SPECS.values(), REAL_TIME_SPEC)
+}
+
+_STRUCTURE_TYPES: Dict[type, Optional[int]] = {
+    spec.Class: structureType for specs in (CONDITION_SPECS, COMPACT_CONDITION_SPECS) for structureType, spec in specs.items()
+}
+
+
+def StructureType(cls: type) -> Optional[int]:
+    """
+    `data_structure_type` of a condition class
+
+    :param cls: Regular or Compact* condition class, or a subclass of one such as the api.lazy views
+    :return: Structure type, or None if cls is not a condition class
+    """
+    structureType = _STRUCTURE_TYPES.get(cls, -1)
+    if structureType == -1:
+        # Subclasses belong to the type of the condition class they extend
+        structureType = _STRUCTURE_TYPES[cls] = next((_STRUCTURE_TYPES[c] for c in cls.__mro__ if c in _STRUCTURE_TYPES), None)
+    return structureType
+
+
+FieldDecoderT = Callable[[Dict[str, Any]], Any]
+
+
+def _Scale(value: float | None, scale: float, offset: float) -> float | None:
+    return value * scale + offset if value is not None else None
+
+
+def FieldDecoders(spec: ConditionSpec) -> Tuple[Tuple[str, FieldDecoderT], ...]:
+    """
+    One decoder per attribute of a spec, each taking the whole API record. They make the same conversions as
+    DecodeCondition(), for decoding attributes one at a time.
+
+    :param spec: Spec from CONDITION_SPECS or COMPACT_CONDITION_SPECS
+    """
+    decoders: List[Tuple[str, FieldDecoderT]] = []
+
+    for attr, key in spec.Fields:
+        def _Value(obj: Dict[str, Any], key: str = key) -> Any:
+            return obj[key]
+        decoders.append((attr, _Value))
+
+    for attr, key, scale, offset in spec.ScaledFields:
+        def _Scaled(obj: Dict[str, Any], key: str = key, scale: float = scale, offset: float = offset) -> float | None:
+            return _Scale(obj[key], scale, offset)
+        decoders.append((attr, _Scaled))
+
+    for attr, key in spec.RainFields:
+        def _Rain(obj: Dict[str, Any], key: str = key, factors: Dict[int, float] = spec.RainFactors) -> float | None:
+            # Matches RainCountToInches: counts from an unknown collector can't be converted
+            count = obj[key]
+            factor = factors.get(obj['rain_size'])
+            if count is None or factor is None:
+                return None
+            return float(count * factor)
+        decoders.append((attr, _Rain))
+
+    for attr, key in spec.TimestampFields:
+        def _Time(obj: Dict[str, Any], key: str = key, unset: Tuple[Optional[int], ...] = spec.UnsetTimestamps) -> datetime | None:
+            ts = obj[key]
+            return _Timestamp(ts) if ts not in unset else None
+        decoders.append((attr, _Time))
+
+    for attr, speed, direction in spec.WindFields:
+        def _Wind(obj: Dict[str, Any], speed: str = speed, direction: str = direction, scale: float = spec.WindScale) -> Wind:
+            return Wind(_Scale(obj[speed], scale, 0.0), obj[direction])
+        decoders.append((attr, _Wind))
+
+    for attr, keys in spec.SlotFields:
+        def _Slots(obj: Dict[str, Any], keys: Tuple[str, ...] = keys, tuples: bool = spec.TupleSlots) -> Any:
+            if tuples:
+                return tuple([obj[key] for key in keys])
+            return {i: obj[key] for i, key in enumerate(keys, 1)}
+        decoders.append((attr, _Slots))
+
+    for attr, keys, scale, offset in spec.ScaledSlotFields:
+        def _ScaledSlots(
+            obj: Dict[str, Any],
+            keys: Tuple[str, ...] = keys,
+            scale: float = scale,
+            offset: float = offset,
+            tuples: bool = spec.TupleSlots
+        ) -> Any:
+            slots = [_Scale(obj[key], scale, offset) for key in keys]
+            return tuple(slots) if tuples else dict(enumerate(slots, 1))
+        decoders.append((attr, _ScaledSlots))
+
+    if spec.RxStateKey is not None:
+        def _RxState(obj: Dict[str, Any], key: str = spec.RxStateKey) -> RxState | None:
+            return _RX_STATES[obj[key]]
+        decoders.append(('RxState', _RxState))
+
+    if spec.BatteryKey is not None:
+        def _Battery(obj: Dict[str, Any], key: str = spec.BatteryKey) -> bool:
+            return bool(obj[key] == 1)
+        decoders.append(('TxBatteryLow', _Battery))
+
+    return tuple(decoders)
+
+
+def DecodeCondition(
+    obj: Dict[str, Any],
+    compact: bool = False,
+    units: UnitSystem = UnitSystem.Imperial
+) -> DeviceConditionT | None:
+    """
+    Create a condition object from one record of the `conditions` list
+
+    :param obj: Condition record from the source API JSON
+    :param compact: Build the slotted, immutable Compact* classes instead of the regular dataclasses
+    :param units: Unit system of the decoded values; the attribute docstrings describe the imperial default
+    :return: Decoded condition, or None if the `data_structure_type` is not known
+    """
+    spec = _SPECS[(compact, units)].get(obj['data_structure_type'])
+    if spec is None:
+        return None
+    condition: DeviceConditionT = _Decode(spec, obj)
+    return condition
+
+
+def _Decode(spec: ConditionSpec, obj: Dict[str, Any]) -> Any:
+    values: Dict[str, Any] = {attr: obj[key] for attr, key in spec.Fields}
+
+    for attr, key, scale, offset in spec.ScaledFields:
+        value = obj[key]
+        values[attr] = value * scale + offset if value is not None else None
+
+    if spec.RainFields:
+        factor = spec.RainFactors.get(obj['rain_size'])
+        for attr, key in spec.RainFields:
+            count = obj[key]
+            # Matches RainCountToInches: counts from an unknown collector can't be converted
+            values[attr] = count * factor if count is not None and factor is not None else None
+
+    for attr, key in spec.TimestampFields:
+        ts = obj[key]
+        values[attr] = _Timestamp(ts) if ts not in spec.UnsetTimestamps else None
+
+    if spec.WindScale == 1.0:
+        for attr, speed, direction in spec.WindFields:
+            values[attr] = Wind(obj[speed], obj[direction])
+    else:
+        for attr, speed, direction in spec.WindFields:
+            value = obj[speed]
+            values[attr] = Wind(value * spec.WindScale if value is not None else None, obj[direction])
+
+    for attr, keys in spec.SlotFields:
+        if spec.TupleSlots:
+            values[attr] = tuple([obj[key] for key in keys])
+        else:
+            values[attr] = {i: obj[key] for i, key in enumerate(keys, 1)}
+
+    for attr, keys, scale, offset in spec.ScaledSlotFields:
+        slots = [_Scale(obj[key], scale, offset) for key in keys]
+        values[attr] = tuple(slots) if spec.TupleSlots else dict(enumerate(slots, 1))
+
+    if spec.RxStateKey is not None:
+        values['RxState'] = _RX_STATES[obj[spec.RxStateKey]]
+
+    if spec.BatteryKey is not None:
+        values['TxBatteryLow'] = obj[spec.BatteryKey] == 1
+
+    return _CONSTRUCTORS[spec.Class](values)
+
+
+def DecodeReport(
+    obj: Dict[str, Any],
+    compact: bool = False,
+    units: UnitSystem = UnitSystem.Imperial,
+    tolerant: bool = False
+) -> WeatherLinkConditionsReport:
+    """
+    Create a report from source API JSON. Records with an unknown `data_structure_type` are skipped.
+
+    :param obj: The `data` member of a `current_conditions` response
+    :param compact: Build the slotted, immutable Compact* condition classes instead of the regular dataclasses
+    :param units: Unit system of the decoded values
+    :param tolerant: Leave out malformed condition records and list them in the report's Errors, instead of raising
+    """
+    _conditions: List[DeviceConditionT] = []
+    _errors: List[RecordError] = []
+
+    for i, c in enumerate(obj['conditions']):
+        try:
+            condition = DecodeCondition(c, compact, units)
+        except RECORD_ERRORS as e:
+            if not tolerant:
+                raise
+            _LOGGER.debug('Skipping malformed record %d from %s: %r', i, obj['did'], e)
+            _errors.append(RecordError.FromException(i, c, e))
+            continue
+        if condition is None:
+            _LOGGER.debug('Skipping unknown data structure type %s from %s', c.get('data_structure_type'), obj['did'])
+            continue
+        _conditions.append(condition)
+        rainError = RecordError.UnknownRainSize(i, c)
+        if rainError is not None:
+            _errors.append(rainError)
+
+    return WeatherLinkConditionsReport(
+        DeviceId=obj['did'],
+        Timestamp=datetime.fromtimestamp(obj['ts'], timezone.utc),
+        DeviceConditions=_conditions,
+        Errors=_errors
+    )
+
+
+def DecodeRealTimeReport(obj: Dict[str, Any], units: UnitSystem = UnitSystem.Imperial) -> WeatherLinkRealTimeReport:
+    """
+    Create a report from a real-time UDP broadcast packet. Only ISS records are broadcast; anything else is skipped.
+
+    :param obj: Decoded broadcast packet
+    :param units: Unit system of the decoded values
+    """
+    spec = _REAL_TIME_SPECS[units]
+    return WeatherLinkRealTimeReport(
+        DeviceId=obj['did'],
+        Timestamp=datetime.fromtimestamp(obj['ts'], timezone.utc),
+        DeviceConditions=[_Decode(spec, c) for c in obj['conditions'] if c['data_structure_type'] == 1]
+    )
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from . import device_condition_reports
+from .device_condition_reports.iss import Wind
+from .serialization import CONDITION_TYPES, CodecT, ConditionClass, FieldCodecs
+from .weatherlink_conditions_report import DeviceConditionT, WeatherLinkConditionsReport
+
+
+ConditionKeyT = Tuple[str, int]
+"""(DeviceId, LsId) identifying one sensor of one WeatherLink device"""
+
+
+@dataclass
+class ConditionDelta:
+    """Fields of one condition that changed since the previous delta for the same sensor"""
+
+    DeviceId: str
+    """WeatherLink or Airlink Device Id"""
+
+    LsId: int
+    """Logical sensor id"""
+
+    Timestamp: datetime
+    """Timestamp of the report the delta was taken from"""
+
+    ConditionType: str
+    """Class name of the condition, such as IssCondition; lazy views are named after the class they extend"""
+
+    Keyframe: bool
+    """Whether Changes holds every field, so a consumer can start from this delta"""
+
+    Changes: Dict[str, Any] = field(default_factory=dict)
+    """Changed fields and their new values"""
+
+
+def _Differs(old: Any, new: Any, epsilon: float) -> bool:
+    if isinstance(old, Wind) and isinstance(new, Wind):
+        return _Differs(old.Speed, new.Speed, epsilon) or _Differs(old.Direction, new.Direction, epsilon)
+
+    if type(old) in (int, float) and type(new) in (int, float):
+        return bool(abs(new - old) > epsilon)
+
+    return bool(old != new)
+
+
+_DELTA_CODECS: Dict[str, Dict[str, CodecT]] = {}
+
+
+def _DeltaCodecs(condition_type: str) -> Dict[str, CodecT]:
+    codecs = _DELTA_CODECS.get(condition_type)
+    if codecs is None:
+        codecs = _DELTA_CODECS[condition_type] = dict(FieldCodecs(CONDITION_TYPES[condition_type]))
+    return codecs
+
+
+def DeltaToDict(delta: ConditionDelta) -> Dict[str, Any]:
+    """
+    Convert a delta to a JSON-compatible dict. Changed fields are encoded as ConditionToDict() encodes them.
+
+    :param delta: Delta to convert
+    """
+    codecs = _DeltaCodecs(delta.ConditionType)
+    obj: Dict[str, Any] = {
+        'DeviceId': delta.DeviceId,
+        'LsId': delta.LsId,
+        'Timestamp': delta.Timestamp.timestamp(),
+        'Type': delta.ConditionType,
+        'Changes': {name: codecs[name][0](value) for name, value in delta.Changes.items()}
+    }
+    # Only keyframes are marked, since all but a few deltas aren't
+    if delta.Keyframe:
+        obj['Keyframe'] = True
+    return obj
+
+
+def DeltaFromDict(obj: Dict[str, Any]) -> ConditionDelta:
+    """
+    Rebuild a delta from DeltaToDict() output
+
+    :param obj: Python dictionary, often returned from json.loads()
+    """
+    codecs = _DeltaCodecs(obj['Type'])
+    return ConditionDelta(
+        DeviceId=obj['DeviceId'],
+        LsId=obj['LsId'],
+        Timestamp=datetime.fromtimestamp(obj['Timestamp'], timezone.utc),
+        ConditionType=obj['Type'],
+        Keyframe=obj.get('Keyframe', False),
+        Changes={name: codecs[name][1](value) for name, value in obj['Changes'].items()}
+    )
+
+
+class ConditionDiffer:
+    """
+    Turns a stream of reports into ConditionDelta records holding only the fields that changed, per (DeviceId, LsId).
+    Values are compared against the last value sent, not the last value seen, so slow drift below a field's epsilon
+    still goes out once it adds up. Every `keyframe_interval` reports that include a sensor, whether or not its
+    fields changed, the sensor's delta is a full keyframe instead.
+    """
+
+    def __init__(
+        self,
+        keyframe_interval: int = 60,
+        epsilon: Optional[Dict[str, float]] = None,
+        default_epsilon: float = 0.0
+    ) -> None:
+        """
+        :param keyframe_interval: Reports of each sensor from one full keyframe to the next
+        :param epsilon: Per-field change threshold for numeric and Wind fields, by field name
+        :param default_epsilon: Change threshold for numeric fields without their own epsilon
+        """
+        self.KeyframeInterval = keyframe_interval
+        self.Epsilon: Dict[str, float] = dict(epsilon or {})
+        self.DefaultEpsilon = default_epsilon
+
+        self._sent: Dict[ConditionKeyT, Tuple[str, Dict[str, Any]]] = {}
+        # Reports that included the sensor since its last keyframe, counting the keyframe itself
+        self._sinceKeyframe: Dict[ConditionKeyT, int] = {}
+
+    def Diff(self, report: WeatherLinkConditionsReport) -> List[ConditionDelta]:
+        """
+        Compare a report with what has been sent so far. Sensors with no changes produce no delta.
+
+        :param report: Next report from any device
+        """
+        deltas: List[ConditionDelta] = []
+
+        for condition in report.DeviceConditions:
+            key = (report.DeviceId, condition.LsId)
+            conditionType = ConditionClass(type(condition)).__name__
+            values = {f.name: getattr(condition, f.name) for f in fields(condition)}
+
+            sent = self._sent.get(key)
+            count = self._sinceKeyframe.get(key, 0)
+
+            if sent is None or sent[0] != conditionType or count >= self.KeyframeInterval:
+                self._sent[key] = (conditionType, values)
+                self._sinceKeyframe[key] = 1
+                deltas.append(ConditionDelta(report.DeviceId, condition.LsId, report.Timestamp, conditionType, True, dict(values)))
+                continue
+
+            previous = sent[1]
+            changes = {
+                name: value for name, value in values.items()
+                if _Differs(previous[name], value, self.Epsilon.get(name, self.DefaultEpsilon))
+            }
+
+            self._sinceKeyframe[key] = count + 1
+            if changes:
+                previous.update(changes)
+                deltas.append(ConditionDelta(report.DeviceId, condition.LsId, report.Timestamp, conditionType, False, changes))
+
+        return deltas
+
+    def Reset(self, key: Optional[ConditionKeyT] = None) -> None:
+        """
+        Forget what has been sent so the next delta is a keyframe, for example after a consumer reconnects
+
+        :param key: Sensor to reset, or None for all sensors
+        """
+        if key is None:
+            self._sent.clear()
+            self._sinceKeyframe.clear()
+        else:
+            self._sent.pop(key, None)
+            self._sinceKeyframe.pop(key, None)
+
+
+class ConditionReconstructor:
+    """Consumer-side counterpart of ConditionDiffer that rebuilds full condition objects from deltas."""
+
+    def __init__(self) -> None:
+        self._state: Dict[ConditionKeyT, Tuple[str, Dict[str, Any]]] = {}
+
+    def Apply(self, delta: ConditionDelta) -> DeviceConditionT | None:
+        """
+        Apply a delta and return the resulting condition
+
+        :param delta: Next delta for any sensor
+        :return: Current condition of the sensor, or None until the first keyframe for it has been received
+        """
+        key = (delta.DeviceId, delta.LsId)
+
+        state: Optional[Tuple[str, Dict[str, Any]]]
+        if delta.Keyframe:
+            state = self._state[key] = (delta.ConditionType, dict(delta.Changes))
+        else:
+            state = self._state.get(key)
+            if state is None or state[0] != delta.ConditionType:
+                return None
+            state[1].update(delta.Changes)
+
+        condition: DeviceConditionT = getattr(device_condition_reports, state[0])(**state[1])
+        return condition
+
+    def Latest(self, device_id: str, lsid: int) -> DeviceConditionT | None:
+        """
+        Most recently reconstructed condition of a sensor
+
+        :param device_id: WeatherLink device id
+        :param lsid: Logical sensor id
+        """
+        state = self._state.get((device_id, lsid))
+        if state is None:
+            return None
+
+        condition: DeviceConditionT = getattr(device_condition_reports, state[0])(**state[1])
+        return condition
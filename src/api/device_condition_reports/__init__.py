@@ -1,11 +1,63 @@
-from .iss import IssCondition
-from .lss import LssBarometerCondition, LssTempHumidityCondition
-from .moisture import LeafSoilMoistureCondition
+from __future__ import annotations
+
+import importlib
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List
+)
+
+if TYPE_CHECKING:
+    from .iss import CompactIssCondition, CompactIssRealTimeCondition, IssCondition, IssRealTimeCondition
+    from .lss import (
+        CompactLssBarometerCondition,
+        CompactLssTempHumidityCondition,
+        LssBarometerCondition,
+        LssTempHumidityCondition
+    )
+    from .moisture import CompactLeafSoilMoistureCondition, LeafSoilMoistureCondition
 
 
 __all__ = [
     "IssCondition",
+    "IssRealTimeCondition",
     "LssBarometerCondition",
     "LssTempHumidityCondition",
-    "LeafSoilMoistureCondition"
+    "LeafSoilMoistureCondition",
+    "CompactIssCondition",
+    "CompactIssRealTimeCondition",
+    "CompactLssBarometerCondition",
+    "CompactLssTempHumidityCondition",
+    "CompactLeafSoilMoistureCondition"
 ]
+
+# Condition classes are imported from their submodule on first access (PEP 562), so importing the package, or
+# one class from it, doesn't build every dataclass
+_SUBMODULES: Dict[str, str] = {
+    "IssCondition": ".iss",
+    "IssRealTimeCondition": ".iss",
+    "CompactIssCondition": ".iss",
+    "CompactIssRealTimeCondition": ".iss",
+    "LssBarometerCondition": ".lss",
+    "LssTempHumidityCondition": ".lss",
+    "CompactLssBarometerCondition": ".lss",
+    "CompactLssTempHumidityCondition": ".lss",
+    "LeafSoilMoistureCondition": ".moisture",
+    "CompactLeafSoilMoistureCondition": ".moisture"
+}
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
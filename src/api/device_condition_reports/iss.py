@@ -59,10 +59,34 @@ from ..from_json import FromJson
 #     "rain_storm_last_end_at":null                  // UNIX timestamp of last rain storm end **(sec)**
 # }
 
+RAIN_INCHES_PER_COUNT: Dict[int, float] = {
+    1: 0.01,
+    2: 0.2 * 0.0393701,
+    3: 0.1 * 0.0393701,
+    4: 0.001
+}
+"""Inches of rain per collector tip, by `rain_size`"""
+
+
+def RainCountToInches(count: float | None, rain_size: int) -> float | None:
+    """
+    Convert a rain collector tip count to inches. Counts from an unknown collector, such as the reserved `rain_size`
+    0, can't be converted and give None; report decoders list such records in their Errors.
+
+    :param count: Number of tips, or None
+    :param rain_size: Rain collector type/size as reported in `rain_size`
+    """
+    if count is None:
+        return None
+
+    factor = RAIN_INCHES_PER_COUNT.get(rain_size)
+    return count * factor if factor is not None else None
+
+
 @dataclass
 class Wind:
-    Speed: float
-    Direction: int
+    Speed: float | None
+    Direction: int | None
 
 
 @dataclass
@@ -179,19 +203,7 @@ class IssCondition(FromJson):
     @classmethod
     def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> IssCondition:
         def _RainCountToInches(count: float | None) -> float | None:
-            if count is None:
-                return None
-
-            if obj['rain_size'] == 1:
-                return count * 0.01
-            elif obj['rain_size'] == 2:
-                return count * 0.2 * 0.0393701
-            elif obj['rain_size'] == 3:
-                return count * 0.1 * 0.0393701
-            elif obj['rain_size'] == 4:
-                return count * 0.001
-            
-            ValueError(f'Unknown rain cup size found: {obj["rain_size"]}')
+            return RainCountToInches(count, obj['rain_size'])
 
         return IssCondition(
             LsId=obj['lsid'],
@@ -226,6 +238,377 @@ class IssCondition(FromJson):
             RainYearly=_RainCountToInches(obj['rainfall_year']),
             SolarRadiation=obj['solar_rad'],
             UVIndex=obj['uv_index'],
-            RxState=RxState(int(obj['rx_state'])),
+            RxState=RxState(int(obj['rx_state'])) if obj['rx_state'] is not None else None,
             TxBatteryLow=True if obj['trans_battery_flag'] == 1 else False
         )
+
+
+# Example UDP broadcast from https://weatherlink.github.io/weatherlink-live-local-api/
+#
+# {
+#     "lsid":48308,                                  // logical sensor ID **(no unit)**
+#     "data_structure_type":1,                       // data structure type **(no unit)**
+#     "txid":1,                                      // transmitter ID **(no unit)**
+#     "wind_speed_last":2,                           // most recent valid wind speed **(mph)**
+#     "wind_dir_last":0,                             // most recent valid wind direction **(°degree)**
+#     "wind_speed_hi_last_10_min":0,                 // maximum wind speed over last 10 min **(mph)**
+#     "wind_dir_at_hi_speed_last_10_min":0,          // gust wind direction over last 10 min **(°degree)**
+#     "rain_size":2,                                 // rain collector type/size **(0: Reserved, 1: 0.01", 2: 0.2 mm, 3:  0.1 mm, 4: 0.001")**
+#     "rain_rate_last":0,                            // most recent valid rain rate **(counts/hour)**
+#     "rain_15_min":0,                               // total rain count over last 15 min **(counts)**
+#     "rain_60_min":0,                               // total rain count for last 60 min **(counts)**
+#     "rain_24_hr":0,                                // total rain count for last 24 hours **(counts)**
+#     "rain_storm":0,                                // total rain count since last 24 hour long break in rain **(counts)**
+#     "rain_storm_start_at":0,                       // UNIX timestamp of current rain storm start **(seconds)**
+#     "rainfall_daily":0,                            // total rain count since local midnight **(counts)**
+#     "rainfall_monthly":0,                          // total rain count since first of month at local midnight **(counts)**
+#     "rainfall_year":0                              // total rain count since first of user-chosen month at local midnight **(counts)**
+# }
+
+@dataclass
+class IssRealTimeCondition(FromJson):
+    """
+    Wind and rain update from the real-time UDP broadcast. Fields carry the same names, units and meaning as the
+    matching fields of IssCondition.
+    """
+
+    LsId: int
+    """Logical sensor id"""
+
+    TxId: int
+    """Transmitter id"""
+
+    WindLast: Wind | None
+    """Most recent wind reading. Speed in miles per hour"""
+
+    Wind10MinGust: Wind | None
+    """Last 10-minute wind gust speed and direction, speed in miles per hour"""
+
+    RainRate: float | None
+    """Most recent rain rate in inches per hour"""
+
+    Rain15MinTotal: float | None
+    """Last 15-minute total rain in inches"""
+
+    Rain60MinTotal: float | None
+    """Last 60-minute total rain in inches"""
+
+    Rain24HourTotal: float | None
+    """Last 24-hour total rain in inches"""
+
+    RainStormTotal: float | None
+    """Most recent rain storm total rain in inches"""
+
+    RainStormStarted: datetime | None
+    """When most recent rain storm started"""
+
+    RainDaily: float | None
+    """Total rain since station local midmight in inches"""
+
+    RainMonthly: float | None
+    """Total rain since first of month at station local midnight in inches"""
+
+    RainYearly: float | None
+    """Total rain since first of year at station local midnight in inches"""
+
+    @classmethod
+    def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> IssRealTimeCondition:
+        rain_size = obj['rain_size']
+
+        return IssRealTimeCondition(
+            LsId=obj['lsid'],
+            TxId=obj['txid'],
+            WindLast=Wind(Speed=obj['wind_speed_last'], Direction=obj['wind_dir_last']),
+            Wind10MinGust=Wind(Speed=obj['wind_speed_hi_last_10_min'], Direction=obj['wind_dir_at_hi_speed_last_10_min']),
+            RainRate=RainCountToInches(obj['rain_rate_last'], rain_size),
+            Rain15MinTotal=RainCountToInches(obj['rain_15_min'], rain_size),
+            Rain60MinTotal=RainCountToInches(obj['rain_60_min'], rain_size),
+            Rain24HourTotal=RainCountToInches(obj['rain_24_hr'], rain_size),
+            RainStormTotal=RainCountToInches(obj['rain_storm'], rain_size),
+            RainStormStarted=datetime.fromtimestamp(obj['rain_storm_start_at'], timezone.utc) if obj['rain_storm_start_at'] else None,
+            RainDaily=RainCountToInches(obj['rainfall_daily'], rain_size),
+            RainMonthly=RainCountToInches(obj['rainfall_monthly'], rain_size),
+            RainYearly=RainCountToInches(obj['rainfall_year'], rain_size)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactIssCondition(FromJson):
+    """
+    Memory-compact, immutable form of IssCondition for holding large numbers of records. Wind readings are stored
+    inline as speed/direction pairs and exposed as Wind through properties of the same names as IssCondition.
+    """
+
+    LsId: int
+    """Logical sensor id"""
+
+    TxId: int
+    """Transmitter id"""
+
+    Temperature: float | None
+    """Most recent temperature in degrees Fahrenheit"""
+
+    Humidity: float | None
+    """Most recent relative humidity in percent"""
+
+    DewPoint: float | None
+    """Most recent dew point in degrees Fahrenheit"""
+
+    WetBulb: float | None
+    """Most recent wet bulb in degrees Fahrenheit"""
+
+    HeatIndex: float | None
+    """Most recent heat index in degrees Fahrenheit"""
+
+    WindChill: float | None
+    """Most recent wind chill in degrees Fahrenheit"""
+
+    THWIndex: float | None
+    """Most recent temperature humidity wind index in degrees Fahrenheit"""
+
+    THSWIndex: float | None
+    """Most recent temperature humidity sun wind index in degrees Fahrenheit"""
+
+    WindLastSpeed: float | None
+    """Most recent wind speed in miles per hour"""
+
+    WindLastDirection: int | None
+    """Most recent wind direction in degrees"""
+
+    Wind1MinAverageSpeed: float | None
+    """Last 1-minute average wind speed in miles per hour"""
+
+    Wind1MinAverageDirection: int | None
+    """Last 1-minute scalar average wind direction in degrees"""
+
+    Wind2MinAverageSpeed: float | None
+    """Last 2-minute average wind speed in miles per hour"""
+
+    Wind2MinAverageDirection: int | None
+    """Last 2-minute scalar average wind direction in degrees"""
+
+    Wind2MinGustSpeed: float | None
+    """Last 2-minute highest wind speed in miles per hour"""
+
+    Wind2MinGustDirection: int | None
+    """Wind direction at the last 2-minute highest speed in degrees"""
+
+    Wind10MinAverageSpeed: float | None
+    """Last 10-minute average wind speed in miles per hour"""
+
+    Wind10MinAverageDirection: int | None
+    """Last 10-minute scalar average wind direction in degrees"""
+
+    Wind10MinGustSpeed: float | None
+    """Last 10-minute highest wind speed in miles per hour"""
+
+    Wind10MinGustDirection: int | None
+    """Wind direction at the last 10-minute highest speed in degrees"""
+
+    RainRate: float | None
+    """Most recent rain rate in inches per hour"""
+
+    Rain1MinMax: float | None
+    """Last 1-minute maximum rain rate in inches per hour"""
+
+    Rain15MinTotal: float | None
+    """Last 15-minute total rain in inches"""
+
+    Rain15MinMax: float | None
+    """Last 15-minute maximum rain rate in inches per hour"""
+
+    Rain60MinTotal: float | None
+    """Last 60-minute total rain in inches"""
+
+    Rain24HourTotal: float | None
+    """Last 24-hour total rain in inches"""
+
+    RainStormTotal: float | None
+    """Most recent rain storm total rain in inches"""
+
+    RainStormStarted: datetime | None
+    """When most recent rain storm started"""
+
+    RainStormLastTotal: float | None
+    """Total rain since last 24-hour long break in rain in inches"""
+
+    RainStormLastStarted: datetime | None
+    """When last rain storm started"""
+
+    RainStormLastEnded: datetime | None
+    """When last rain storm ended"""
+
+    RainDaily: float | None
+    """Total rain since station local midnight in inches"""
+
+    RainMonthly: float | None
+    """Total rain since first of month at station local midnight in inches"""
+
+    RainYearly: float | None
+    """Total rain since first of year at station local midnight in inches"""
+
+    SolarRadiation: float | None
+    """Most recent solar radiation in watts per square meter"""
+
+    UVIndex: float | None
+    """Most recent UV index"""
+
+    RxState: RxState | None
+    """Radio receiver state, as IssCondition.RxState"""
+
+    TxBatteryLow: bool | None
+    """Internal CR-123A is low, as IssCondition.TxBatteryLow"""
+
+    @property
+    def WindLast(self) -> Wind:
+        return Wind(Speed=self.WindLastSpeed, Direction=self.WindLastDirection)
+
+    @property
+    def Wind1MinAverage(self) -> Wind:
+        return Wind(Speed=self.Wind1MinAverageSpeed, Direction=self.Wind1MinAverageDirection)
+
+    @property
+    def Wind2MinAverage(self) -> Wind:
+        return Wind(Speed=self.Wind2MinAverageSpeed, Direction=self.Wind2MinAverageDirection)
+
+    @property
+    def Wind2MinGust(self) -> Wind:
+        return Wind(Speed=self.Wind2MinGustSpeed, Direction=self.Wind2MinGustDirection)
+
+    @property
+    def Wind10MinAverage(self) -> Wind:
+        return Wind(Speed=self.Wind10MinAverageSpeed, Direction=self.Wind10MinAverageDirection)
+
+    @property
+    def Wind10MinGust(self) -> Wind:
+        return Wind(Speed=self.Wind10MinGustSpeed, Direction=self.Wind10MinGustDirection)
+
+    @classmethod
+    def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> CompactIssCondition:
+        rain_size = obj['rain_size']
+
+        return CompactIssCondition(
+            LsId=obj['lsid'],
+            TxId=obj['txid'],
+            Temperature=obj['temp'],
+            Humidity=obj['hum'],
+            DewPoint=obj['dew_point'],
+            WetBulb=obj['wet_bulb'],
+            HeatIndex=obj['heat_index'],
+            WindChill=obj['wind_chill'],
+            THWIndex=obj['thw_index'],
+            THSWIndex=obj['thsw_index'],
+            WindLastSpeed=obj['wind_speed_last'],
+            WindLastDirection=obj['wind_dir_last'],
+            Wind1MinAverageSpeed=obj['wind_speed_avg_last_1_min'],
+            Wind1MinAverageDirection=obj['wind_dir_scalar_avg_last_1_min'],
+            Wind2MinAverageSpeed=obj['wind_speed_avg_last_2_min'],
+            Wind2MinAverageDirection=obj['wind_dir_scalar_avg_last_2_min'],
+            Wind2MinGustSpeed=obj['wind_speed_hi_last_2_min'],
+            Wind2MinGustDirection=obj['wind_dir_at_hi_speed_last_2_min'],
+            Wind10MinAverageSpeed=obj['wind_speed_avg_last_10_min'],
+            Wind10MinAverageDirection=obj['wind_dir_scalar_avg_last_10_min'],
+            Wind10MinGustSpeed=obj['wind_speed_hi_last_10_min'],
+            Wind10MinGustDirection=obj['wind_dir_at_hi_speed_last_10_min'],
+            RainRate=RainCountToInches(obj['rain_rate_last'], rain_size),
+            Rain1MinMax=RainCountToInches(obj['rain_rate_hi'], rain_size),
+            Rain15MinTotal=RainCountToInches(obj['rainfall_last_15_min'], rain_size),
+            Rain15MinMax=RainCountToInches(obj['rain_rate_hi_last_15_min'], rain_size),
+            Rain60MinTotal=RainCountToInches(obj['rainfall_last_60_min'], rain_size),
+            Rain24HourTotal=RainCountToInches(obj['rainfall_last_24_hr'], rain_size),
+            RainStormTotal=RainCountToInches(obj['rain_storm'], rain_size),
+            RainStormStarted=datetime.fromtimestamp(obj['rain_storm_start_at'], timezone.utc) if obj['rain_storm_start_at'] is not None else None,
+            RainStormLastTotal=RainCountToInches(obj['rain_storm_last'], rain_size),
+            RainStormLastStarted=datetime.fromtimestamp(obj['rain_storm_last_start_at'], timezone.utc) if obj['rain_storm_last_start_at'] is not None else None,
+            RainStormLastEnded=datetime.fromtimestamp(obj['rain_storm_last_end_at'], timezone.utc) if obj['rain_storm_last_end_at'] is not None else None,
+            RainDaily=RainCountToInches(obj['rainfall_daily'], rain_size),
+            RainMonthly=RainCountToInches(obj['rainfall_monthly'], rain_size),
+            RainYearly=RainCountToInches(obj['rainfall_year'], rain_size),
+            SolarRadiation=obj['solar_rad'],
+            UVIndex=obj['uv_index'],
+            RxState=RxState(int(obj['rx_state'])) if obj['rx_state'] is not None else None,
+            TxBatteryLow=True if obj['trans_battery_flag'] == 1 else False
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactIssRealTimeCondition(FromJson):
+    """
+    Memory-compact, immutable form of IssRealTimeCondition. Wind readings are stored inline and exposed as Wind
+    through properties of the same names as IssRealTimeCondition.
+    """
+
+    LsId: int
+    """Logical sensor id"""
+
+    TxId: int
+    """Transmitter id"""
+
+    WindLastSpeed: float | None
+    """Most recent wind speed in miles per hour"""
+
+    WindLastDirection: int | None
+    """Most recent wind direction in degrees"""
+
+    Wind10MinGustSpeed: float | None
+    """Last 10-minute highest wind speed in miles per hour"""
+
+    Wind10MinGustDirection: int | None
+    """Wind direction at the last 10-minute highest speed in degrees"""
+
+    RainRate: float | None
+    """Most recent rain rate in inches per hour"""
+
+    Rain15MinTotal: float | None
+    """Last 15-minute total rain in inches"""
+
+    Rain60MinTotal: float | None
+    """Last 60-minute total rain in inches"""
+
+    Rain24HourTotal: float | None
+    """Last 24-hour total rain in inches"""
+
+    RainStormTotal: float | None
+    """Most recent rain storm total rain in inches"""
+
+    RainStormStarted: datetime | None
+    """When most recent rain storm started"""
+
+    RainDaily: float | None
+    """Total rain since station local midnight in inches"""
+
+    RainMonthly: float | None
+    """Total rain since first of month at station local midnight in inches"""
+
+    RainYearly: float | None
+    """Total rain since first of year at station local midnight in inches"""
+
+    @property
+    def WindLast(self) -> Wind:
+        return Wind(Speed=self.WindLastSpeed, Direction=self.WindLastDirection)
+
+    @property
+    def Wind10MinGust(self) -> Wind:
+        return Wind(Speed=self.Wind10MinGustSpeed, Direction=self.Wind10MinGustDirection)
+
+    @classmethod
+    def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> CompactIssRealTimeCondition:
+        rain_size = obj['rain_size']
+
+        return CompactIssRealTimeCondition(
+            LsId=obj['lsid'],
+            TxId=obj['txid'],
+            WindLastSpeed=obj['wind_speed_last'],
+            WindLastDirection=obj['wind_dir_last'],
+            Wind10MinGustSpeed=obj['wind_speed_hi_last_10_min'],
+            Wind10MinGustDirection=obj['wind_dir_at_hi_speed_last_10_min'],
+            RainRate=RainCountToInches(obj['rain_rate_last'], rain_size),
+            Rain15MinTotal=RainCountToInches(obj['rain_15_min'], rain_size),
+            Rain60MinTotal=RainCountToInches(obj['rain_60_min'], rain_size),
+            Rain24HourTotal=RainCountToInches(obj['rain_24_hr'], rain_size),
+            RainStormTotal=RainCountToInches(obj['rain_storm'], rain_size),
+            RainStormStarted=datetime.fromtimestamp(obj['rain_storm_start_at'], timezone.utc) if obj['rain_storm_start_at'] else None,
+            RainDaily=RainCountToInches(obj['rainfall_daily'], rain_size),
+            RainMonthly=RainCountToInches(obj['rainfall_monthly'], rain_size),
+            RainYearly=RainCountToInches(obj['rainfall_year'], rain_size)
+        )
@@ -79,4 +79,59 @@ class LssBarometerCondition(FromJson):
             SeaLevelPressure=obj['bar_sea_level'],
             ThreeHourPressureTrend=obj['bar_trend']
         )
-        
\ No newline at end of file
+
+
+@dataclass(frozen=True, slots=True)
+class CompactLssTempHumidityCondition(FromJson):
+    """Memory-compact, immutable form of LssTempHumidityCondition"""
+
+    LsId: int
+    """Logical Sensor Id"""
+
+    Temperature: float | None
+    """Most recent indoor temperature in degrees Fahrenheit"""
+
+    Humidity: float | None
+    """Most recent indoor humidity in percent relative humidity"""
+
+    DewPoint: float | None
+    """Most recent indoor dewpoint in degrees Fahrenheit"""
+
+    HeatIndex: float | None
+    """Most recent indoor heat index in degrees Fahrenheit"""
+
+    @classmethod
+    def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> CompactLssTempHumidityCondition:
+        return CompactLssTempHumidityCondition(
+            LsId=obj['lsid'],
+            Temperature=obj['temp_in'],
+            Humidity=obj['hum_in'],
+            DewPoint=obj['dew_point_in'],
+            HeatIndex=obj['heat_index_in']
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactLssBarometerCondition(FromJson):
+    """Memory-compact, immutable form of LssBarometerCondition"""
+
+    LsId: int
+    """Logical Sensor Id"""
+
+    Pressure: float | None
+    """Absolute barometric pressure reading in inches"""
+
+    SeaLevelPressure: float | None
+    """Barometric pressure reading corrected for local elevation in inches"""
+
+    ThreeHourPressureTrend: float | None
+    """3-hour barometric pressure trend in inches"""
+
+    @classmethod
+    def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> CompactLssBarometerCondition:
+        return CompactLssBarometerCondition(
+            LsId=obj['lsid'],
+            Pressure=obj['bar_absolute'],
+            SeaLevelPressure=obj['bar_sea_level'],
+            ThreeHourPressureTrend=obj['bar_trend']
+        )
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import (
     Any,
     Dict,
+    Tuple,
     Type
 )
 
@@ -82,6 +83,60 @@ class LeafSoilMoistureCondition(FromJson):
                 1: obj['wet_leaf_1'],
                 2: obj['wet_leaf_2']
             },
-            RxState=RxState(obj['rx_state']),
+            RxState=RxState(obj['rx_state']) if obj['rx_state'] is not None else None,
+            TxBatteryLow=True if obj['trans_battery_flag'] == 1 else False
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompactLeafSoilMoistureCondition(FromJson):
+    """
+    Memory-compact, immutable form of LeafSoilMoistureCondition. Slot readings are stored in tuples (slot 1 at
+    index 0) and exposed as dicts keyed by slot number through properties of the same names as
+    LeafSoilMoistureCondition.
+    """
+
+    LsId: int
+    """Logical sensor id"""
+
+    TxId: int
+    """Transmitter id"""
+
+    SoilTemperatureSlots: Tuple[float | None, ...]
+    """Most recent soil temperatures in degress Fahrenheit (4 slots)"""
+
+    SoilMoistureSlots: Tuple[float | None, ...]
+    """Most recent soil moisture in |cb| (4 slots)"""
+
+    LeafWetnessSlots: Tuple[float | None, ...]
+    """Most recent leaf wetness (2 slots)"""
+
+    RxState: RxState | None
+    """Radio receiver state, as LeafSoilMoistureCondition.RxState"""
+
+    TxBatteryLow: bool | None
+    """Internal CR-123A is low, as LeafSoilMoistureCondition.TxBatteryLow"""
+
+    @property
+    def SoilTemperatures(self) -> Dict[int, float | None]:
+        return dict(enumerate(self.SoilTemperatureSlots, 1))
+
+    @property
+    def SoilMoisture(self) -> Dict[int, float | None]:
+        return dict(enumerate(self.SoilMoistureSlots, 1))
+
+    @property
+    def LeafWetness(self) -> Dict[int, float | None]:
+        return dict(enumerate(self.LeafWetnessSlots, 1))
+
+    @classmethod
+    def FromJson(cls: Type[FromJson], obj: Dict[str, Any]) -> CompactLeafSoilMoistureCondition:
+        return CompactLeafSoilMoistureCondition(
+            LsId=obj['lsid'],
+            TxId=obj['txid'],
+            SoilTemperatureSlots=(obj['temp_1'], obj['temp_2'], obj['temp_3'], obj['temp_4']),
+            SoilMoistureSlots=(obj['moist_soil_1'], obj['moist_soil_2'], obj['moist_soil_3'], obj['moist_soil_4']),
+            LeafWetnessSlots=(obj['wet_leaf_1'], obj['wet_leaf_2']),
+            RxState=RxState(obj['rx_state']) if obj['rx_state'] is not None else None,
             TxBatteryLow=True if obj['trans_battery_flag'] == 1 else False
         )
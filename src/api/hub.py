@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from collections import deque
+from dataclasses import replace
+from enum import Enum
+from types import TracebackType
+from typing import (
+    AsyncIterable,
+    Callable,
+    Deque,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union
+)
+
+from . import device_condition_reports
+from .decoder import StructureType
+from .weatherlink_conditions_report import DeviceConditionT, WeatherLinkConditionsReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+ConditionTypeT = Union[int, str, type]
+"""A `data_structure_type`, or a condition class or its name, e.g. IssCondition"""
+
+
+class Overflow(Enum):
+    DropOldest = 'drop_oldest'
+    """Discard the oldest waiting report to make room for the new one"""
+
+    Coalesce = 'coalesce'
+    """Replace a waiting report from the same device with the new one, keeping its place in the queue, and
+    otherwise discard the oldest"""
+
+
+def _StructureType(value: ConditionTypeT) -> int:
+    if isinstance(value, int):
+        return value
+    cls = getattr(device_condition_reports, value, None) if isinstance(value, str) else value
+    structureType = StructureType(cls) if isinstance(cls, type) else None
+    if structureType is None:
+        raise ValueError(f'{value} is not a condition type')
+    return structureType
+
+
+class Subscription:
+    """
+    Filtered reports from a ReportHub, delivered through an async iterator. Only the matching conditions of a report
+    are delivered; reports with none are skipped. The queue is bounded and never blocks the hub: when it is full
+    the Overflow policy decides what is discarded. Delivered reports are shared with other subscribers and should
+    not be modified.
+    """
+
+    def __init__(
+        self,
+        hub: ReportHub,
+        device_ids: Optional[Iterable[str]],
+        ls_ids: Optional[Iterable[int]],
+        types: Optional[Iterable[ConditionTypeT]],
+        predicate: Optional[Callable[[DeviceConditionT], bool]],
+        size: int,
+        overflow: Overflow
+    ) -> None:
+        self.DeviceIds: Optional[FrozenSet[str]] = frozenset(device_ids) if device_ids is not None else None
+        self.LsIds: Optional[FrozenSet[int]] = frozenset(ls_ids) if ls_ids is not None else None
+        self.Types: Optional[FrozenSet[int]] = frozenset(_StructureType(t) for t in types) if types is not None else None
+        self.Predicate = predicate
+        self.Size = size
+        self.Overflow = overflow
+
+        self.Delivered = 0
+        """Reports taken from the queue by the subscriber"""
+
+        self.Dropped = 0
+        """Reports discarded because the queue was full"""
+
+        self.Coalesced = 0
+        """Waiting reports replaced by a newer report from the same device"""
+
+        self._hub = hub
+        self._queue: Deque[WeatherLinkConditionsReport] = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    async def __aenter__(self) -> Subscription:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        self.Close()
+
+    def __aiter__(self) -> Subscription:
+        return self
+
+    async def __anext__(self) -> WeatherLinkConditionsReport:
+        while not self._queue:
+            if self._closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+        self.Delivered += 1
+        return self._queue.popleft()
+
+    @property
+    def Pending(self) -> int:
+        """Reports waiting to be taken"""
+        return len(self._queue)
+
+    def Close(self) -> None:
+        """Unsubscribe. Reports already waiting are still delivered before iteration ends."""
+        self._closed = True
+        self._hub._Unsubscribe(self)
+        self._ready.set()
+
+    def _Match(self, condition: DeviceConditionT) -> bool:
+        if self.LsIds is not None and condition.LsId not in self.LsIds:
+            return False
+        if self.Types is not None and StructureType(type(condition)) not in self.Types:
+            return False
+        if self.Predicate is not None:
+            try:
+                return bool(self.Predicate(condition))
+            except Exception as e:
+                # e.g. a field the condition type doesn't have, or a comparison with a missing value
+                _LOGGER.debug('Predicate failed on %s: %r', type(condition).__name__, e)
+                return False
+        return True
+
+    def _Offer(self, report: WeatherLinkConditionsReport) -> None:
+        if self._closed:
+            return
+        if self.DeviceIds is not None and report.DeviceId not in self.DeviceIds:
+            return
+
+        if self.LsIds is not None or self.Types is not None or self.Predicate is not None:
+            conditions = [c for c in report.DeviceConditions if self._Match(c)]
+            if not conditions:
+                return
+            if len(conditions) != len(report.DeviceConditions):
+                report = replace(report, DeviceConditions=conditions)
+
+        if self.Overflow is Overflow.Coalesce:
+            for i, waiting in enumerate(self._queue):
+                if waiting.DeviceId == report.DeviceId:
+                    self._queue[i] = report
+                    self.Coalesced += 1
+                    return
+
+        if len(self._queue) >= self.Size:
+            self._queue.popleft()
+            self.Dropped += 1
+        self._queue.append(report)
+        self._ready.set()
+
+
+class ReportHub:
+    """
+    Fans one stream of reports out to any number of filtered subscribers, so several consumers can share a single
+    poller. Publishing never waits for subscribers; each has its own bounded queue, so a slow one only loses its
+    own reports:
+
+        hub = ReportHub()
+        async with WeatherLinkPoller(hosts) as poller:
+            asyncio.create_task(hub.Run(poller))
+            async with hub.Subscribe(types=['IssCondition'], predicate=lambda c: c.WindLast.Speed > 20) as gusts:
+                async for report in gusts:
+                    ...
+    """
+
+    def __init__(self) -> None:
+        self.Subscriptions: List[Subscription] = []
+        """Open subscriptions"""
+
+        self.Published = 0
+        """Reports published"""
+
+        self._closed = False
+
+    def Subscribe(
+        self,
+        device_ids: Optional[Iterable[str]] = None,
+        ls_ids: Optional[Iterable[int]] = None,
+        types: Optional[Iterable[ConditionTypeT]] = None,
+        predicate: Optional[Callable[[DeviceConditionT], bool]] = None,
+        size: int = 64,
+        overflow: Overflow = Overflow.DropOldest
+    ) -> Subscription:
+        """
+        Start receiving reports. Each filter that is given must match; a predicate that raises does not match.
+
+        :param device_ids: Only reports from these WeatherLink devices
+        :param ls_ids: Only conditions from these logical sensors
+        :param types: Only conditions of these types, given as `data_structure_type` numbers, classes or class names.
+            Compact* classes and lazy views match the type of their regular class.
+        :param predicate: Only conditions for which this returns true, e.g. lambda c: c.Temperature > 90
+        :param size: Maximum reports waiting to be taken
+        :param overflow: What to discard when the queue is full
+        """
+        subscription = Subscription(self, device_ids, ls_ids, types, predicate, size, overflow)
+        if self._closed:
+            subscription.Close()
+        else:
+            self.Subscriptions.append(subscription)
+        return subscription
+
+    def _Unsubscribe(self, subscription: Subscription) -> None:
+        if subscription in self.Subscriptions:
+            self.Subscriptions.remove(subscription)
+
+    def Publish(self, report: WeatherLinkConditionsReport) -> None:
+        """
+        Offer a report to every subscriber without waiting
+
+        :param report: Report to deliver; it should not be modified afterwards
+        """
+        self.Published += 1
+        for subscription in self.Subscriptions:
+            subscription._Offer(report)
+
+    async def Run(self, source: AsyncIterable[WeatherLinkConditionsReport]) -> None:
+        """
+        Publish every report from a WeatherLinkPoller, ShardedCollector or other async iterator, then close the hub
+        when it ends
+
+        :param source: Source of reports
+        """
+        try:
+            async for report in source:
+                self.Publish(report)
+        finally:
+            self.Close()
+
+    def Close(self) -> None:
+        """Close every subscription. Their waiting reports are still delivered."""
+        self._closed = True
+        for subscription in list(self.Subscriptions):
+            subscription.Close()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import bisect
+import time
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple
+)
+
+import aiohttp
+from aiohttp import web
+
+from .weatherlink_conditions_report import RecordError
+
+
+STAGES: Tuple[str, ...] = ('connect', 'response', 'json', 'build')
+"""Timed stages of a poll: opening a connection, receiving the full response, decoding JSON and building the report"""
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""Histogram bucket upper bounds in seconds"""
+
+
+@dataclass
+class Histogram:
+    """Cumulative-style latency histogram with fixed bucket bounds"""
+
+    Bounds: Tuple[float, ...]
+    Counts: List[int] = field(default_factory=list)
+    Sum: float = 0.0
+    Count: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.Counts:
+            self.Counts = [0] * (len(self.Bounds) + 1)
+
+    def Observe(self, value: float) -> None:
+        self.Counts[bisect.bisect_left(self.Bounds, value)] += 1
+        self.Sum += value
+        self.Count += 1
+
+    def Quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile, or +Inf if it falls past the last bucket"""
+        target = q * self.Count
+        running = 0
+        for bound, count in zip(self.Bounds, self.Counts):
+            running += count
+            if running >= target and running > 0:
+                return bound
+        return float('inf')
+
+
+class PollMetrics:
+    """
+    Per-host latency histograms, error counters and structure type counts for WeatherLinkPoller. Pass an instance
+    as the poller's `metrics` to enable recording; without one the poller skips all timing.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, callback: Optional[Callable[[PollMetrics], None]] = None) -> None:
+        """
+        :param buckets: Histogram bucket upper bounds in seconds
+        :param callback: Called with this object after every completed poll, for pushing metrics elsewhere
+        """
+        self.Buckets = buckets
+        self.Callback = callback
+
+        self.Latency: Dict[Tuple[str, str], Histogram] = {}
+        """Histograms by (host, stage)"""
+
+        self.Errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        """Failed polls by (host, exception type name)"""
+
+        self.StructureTypes: Dict[Any, int] = defaultdict(int)
+        """Condition records received by `data_structure_type`"""
+
+        self.RecordErrors: Dict[Tuple[str, str], int] = defaultdict(int)
+        """Condition records left out by tolerant decoding, by (host, exception type name)"""
+
+        self.Polls: Dict[str, int] = defaultdict(int)
+        """Successful polls by host"""
+
+        self.CacheHits: Dict[str, int] = defaultdict(int)
+        """Successful polls answered from the report cache, by host"""
+
+    def Observe(self, host: str, stage: str, seconds: float) -> None:
+        histogram = self.Latency.get((host, stage))
+        if histogram is None:
+            histogram = self.Latency[(host, stage)] = Histogram(self.Buckets)
+        histogram.Observe(seconds)
+
+    def Error(self, host: str, error: BaseException) -> None:
+        self.Errors[(host, type(error).__name__)] += 1
+        if self.Callback is not None:
+            self.Callback(self)
+
+    def Completed(self, host: str, obj: Dict[str, Any]) -> None:
+        """
+        Count a successful poll and the structure types it carried
+
+        :param host: Polled host
+        :param obj: The `data` member of the response
+        """
+        self.Polls[host] += 1
+        for c in obj['conditions']:
+            self.StructureTypes[c.get('data_structure_type')] += 1
+        if self.Callback is not None:
+            self.Callback(self)
+
+    def Malformed(self, host: str, errors: Iterable[RecordError]) -> None:
+        """
+        Count condition records a tolerant decode left out of a report
+
+        :param host: Polled host
+        :param errors: The report's Errors
+        """
+        for error in errors:
+            self.RecordErrors[(host, error.Error)] += 1
+
+    def CacheHit(self, host: str) -> None:
+        """Count a successful poll whose report came from the cache"""
+        self.Polls[host] += 1
+        self.CacheHits[host] += 1
+        if self.Callback is not None:
+            self.Callback(self)
+
+    def TraceConfig(self) -> aiohttp.TraceConfig:
+        """aiohttp trace hooks recording the 'connect' stage, for sessions created outside the poller"""
+        config = aiohttp.TraceConfig()
+
+        async def _RequestStart(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceRequestStartParams) -> None:
+            requestCtx = ctx.trace_request_ctx
+            ctx.host = requestCtx['host'] if requestCtx and 'host' in requestCtx else params.url.authority
+
+        async def _ConnectStart(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceConnectionCreateStartParams) -> None:
+            ctx.connectStart = time.perf_counter()
+
+        async def _ConnectEnd(session: aiohttp.ClientSession, ctx: SimpleNamespace, params: aiohttp.TraceConnectionCreateEndParams) -> None:
+            self.Observe(getattr(ctx, 'host', ''), 'connect', time.perf_counter() - ctx.connectStart)
+
+        config.on_request_start.append(_RequestStart)
+        config.on_connection_create_start.append(_ConnectStart)
+        config.on_connection_create_end.append(_ConnectEnd)
+        return config
+
+    def RenderPrometheus(self) -> str:
+        """Metrics in the Prometheus text exposition format"""
+        lines: List[str] = [
+            '# HELP weatherlink_poll_stage_seconds Time spent in each stage of a poll',
+            '# TYPE weatherlink_poll_stage_seconds histogram'
+        ]
+        for (host, stage), h in sorted(self.Latency.items()):
+            labels = f'host="{_Escape(host)}",stage="{stage}"'
+            running = 0
+            for bound, count in zip(h.Bounds, h.Counts):
+                running += count
+                lines.append(f'weatherlink_poll_stage_seconds_bucket{{{labels},le="{bound}"}} {running}')
+            lines.append(f'weatherlink_poll_stage_seconds_bucket{{{labels},le="+Inf"}} {h.Count}')
+            lines.append(f'weatherlink_poll_stage_seconds_sum{{{labels}}} {h.Sum}')
+            lines.append(f'weatherlink_poll_stage_seconds_count{{{labels}}} {h.Count}')
+
+        lines.append('# HELP weatherlink_polls_total Successful polls')
+        lines.append('# TYPE weatherlink_polls_total counter')
+        for host, count in sorted(self.Polls.items()):
+            lines.append(f'weatherlink_polls_total{{host="{_Escape(host)}"}} {count}')
+
+        lines.append('# HELP weatherlink_poll_cache_hits_total Successful polls answered from the report cache')
+        lines.append('# TYPE weatherlink_poll_cache_hits_total counter')
+        for host, count in sorted(self.CacheHits.items()):
+            lines.append(f'weatherlink_poll_cache_hits_total{{host="{_Escape(host)}"}} {count}')
+
+        lines.append('# HELP weatherlink_poll_errors_total Failed polls')
+        lines.append('# TYPE weatherlink_poll_errors_total counter')
+        for (host, error), count in sorted(self.Errors.items()):
+            lines.append(f'weatherlink_poll_errors_total{{host="{_Escape(host)}",error="{error}"}} {count}')
+
+        lines.append('# HELP weatherlink_record_errors_total Condition records left out of reports because they could not be decoded')
+        lines.append('# TYPE weatherlink_record_errors_total counter')
+        for (host, error), count in sorted(self.RecordErrors.items()):
+            lines.append(f'weatherlink_record_errors_total{{host="{_Escape(host)}",error="{error}"}} {count}')
+
+        lines.append('# HELP weatherlink_condition_records_total Condition records received by data structure type')
+        lines.append('# TYPE weatherlink_condition_records_total counter')
+        for structureType, count in sorted(self.StructureTypes.items(), key=lambda i: str(i[0])):
+            lines.append(f'weatherlink_condition_records_total{{data_structure_type="{structureType}"}} {count}')
+
+        return '\n'.join(lines) + '\n'
+
+    async def Serve(self, host: str = '0.0.0.0', port: int = 9100) -> web.AppRunner:
+        """
+        Serve RenderPrometheus() at /metrics. Call cleanup() on the returned runner to stop.
+
+        :param host: Address to listen on
+        :param port: Port to listen on
+        """
+        async def _Metrics(request: web.Request) -> web.Response:
+            return web.Response(text=self.RenderPrometheus(), content_type='text/plain', charset='utf-8')
+
+        app = web.Application()
+        app.router.add_get('/metrics', _Metrics)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        return runner
+
+
+def _Escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
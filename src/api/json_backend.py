@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore[import-not-found, import-untyped, unused-ignore]
+except ImportError:  # pragma: no cover - msgspec is optional
+    msgspec = None
+
+
+LoadsT = Callable[[bytes], Any]
+DumpsT = Callable[[Any], bytes]
+
+BACKENDS: Dict[str, LoadsT] = {}
+"""Installed JSON decoders by name, fastest first"""
+
+if orjson is not None:
+    BACKENDS['orjson'] = orjson.loads
+if msgspec is not None:
+    BACKENDS['msgspec'] = msgspec.json.Decoder().decode
+BACKENDS['json'] = json.loads
+
+BACKEND: str = next(iter(BACKENDS))
+"""Name of the backend used by Loads()"""
+
+Loads: LoadsT = BACKENDS[BACKEND]
+"""Decode a JSON document from bytes with the fastest installed backend"""
+
+
+def _Dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+Dumps: DumpsT = orjson.dumps if orjson is not None else msgspec.json.encode if msgspec is not None else _Dumps
+"""Encode an object as compact JSON bytes with the fastest installed backend"""
+
+
+def GetBackend(name: Optional[str] = None) -> LoadsT:
+    """
+    Decoder for a named backend
+
+    :param name: orjson, msgspec or json; None for the fastest installed
+    """
+    if name is None:
+        return Loads
+
+    backend = BACKENDS.get(name)
+    if backend is None:
+        raise ValueError(f'JSON backend {name!r} is not installed, available: {", ".join(BACKENDS)}')
+    return backend
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+
+from dataclasses import fields
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+
+from .decoder import _SPECS, ConditionSpec, DecodeCondition, FieldDecoderT, FieldDecoders
+from .units import UnitSystem
+from .weatherlink_conditions_report import RECORD_ERRORS, DeviceConditionT, RecordError, WeatherLinkConditionsReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+LazyConditionT = Callable[[Dict[str, Any]], DeviceConditionT]
+"""Lazy condition class: a subclass of one of the condition classes, created from an API record"""
+
+
+class _LazyField:
+    """
+    Non-data descriptor that decodes one attribute from the wrapped record on first access and stores it in the
+    instance __dict__, which then shadows the descriptor so later reads are plain attribute lookups.
+    """
+
+    def __init__(self, name: str, decode: FieldDecoderT) -> None:
+        self.Name = name
+        self.Decode = decode
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[self.Name] = self.Decode(instance.__dict__['_record'])
+        return value
+
+
+def _LazyClass(spec: ConditionSpec) -> LazyConditionT:
+    # Subclassing the eager dataclass keeps isinstance() checks, the dataclass fields(), __eq__ and __repr__, which
+    # all read attributes and so decode whatever they touch
+    def __init__(self: Any, record: Dict[str, Any]) -> None:
+        self.__dict__['_record'] = record
+
+    # The dataclass __eq__ only accepts its own class, so compare field values with the eager class and other views
+    names = tuple(f.name for f in fields(spec.Class))
+
+    def __eq__(self: Any, other: Any) -> bool:
+        if not isinstance(other, spec.Class):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in names)
+
+    namespace: Dict[str, Any] = {
+        '__init__': __init__,
+        '__eq__': __eq__,
+        '__module__': __name__,
+        '__doc__': f'{spec.Class.__name__} decoding each attribute from its API record on first access'
+    }
+    for attr, decode in FieldDecoders(spec):
+        namespace[attr] = _LazyField(attr, decode)
+
+    cls: LazyConditionT = type(f'Lazy{spec.Class.__name__}', (spec.Class,), namespace)
+    return cls
+
+
+_LAZY_CLASSES: Dict[UnitSystem, Dict[int, LazyConditionT]] = {
+    units: {structureType: _LazyClass(spec) for structureType, spec in _SPECS[(False, units)].items()}
+    for units in UnitSystem
+}
+
+LAZY_CONDITION_CLASSES: Dict[int, LazyConditionT] = _LAZY_CLASSES[UnitSystem.Imperial]
+"""Lazy condition class for each known `data_structure_type`, decoding to imperial units"""
+
+LazyIssCondition = LAZY_CONDITION_CLASSES[1]
+LazyLeafSoilMoistureCondition = LAZY_CONDITION_CLASSES[2]
+LazyLssBarometerCondition = LAZY_CONDITION_CLASSES[3]
+LazyLssTempHumidityCondition = LAZY_CONDITION_CLASSES[4]
+
+
+def DecodeLazyCondition(obj: Dict[str, Any], units: UnitSystem = UnitSystem.Imperial) -> DeviceConditionT | None:
+    """
+    Wrap one record of the `conditions` list without decoding any of it. Attributes are decoded the first time they
+    are read, with the same conversions as DecodeCondition(), and cached on the object.
+
+    :param obj: Condition record from the source API JSON; it must not be modified afterwards
+    :param units: Unit system of the decoded values
+    :return: Lazy condition, or None if the `data_structure_type` is not known
+    """
+    cls = _LAZY_CLASSES[units].get(obj['data_structure_type'])
+    return cls(obj) if cls is not None else None
+
+
+def Record(condition: DeviceConditionT) -> Dict[str, Any]:
+    """
+    API record a lazy condition was created from
+
+    :param condition: Condition from DecodeLazyCondition() or DecodeLazyReport()
+    """
+    record: Dict[str, Any] = condition.__dict__['_record']
+    return record
+
+
+def DecodeLazyReport(
+    obj: Dict[str, Any],
+    units: UnitSystem = UnitSystem.Imperial,
+    tolerant: bool = False,
+    validate: bool = False
+) -> WeatherLinkConditionsReport:
+    """
+    Create a report of lazy conditions from source API JSON. Records with an unknown `data_structure_type` are
+    skipped.
+
+    :param obj: The `data` member of a `current_conditions` response
+    :param units: Unit system of the decoded values
+    :param tolerant: Leave out malformed condition records and list them in the report's Errors; implies validate
+    :param validate: Decode every record once up front, so a malformed one fails here rather than when its bad
+        attribute is first read. This gives up most of the saving of lazy decoding.
+    """
+    classes = _LAZY_CLASSES[units]
+    _conditions: List[DeviceConditionT] = []
+    _errors: List[RecordError] = []
+
+    for i, c in enumerate(obj['conditions']):
+        try:
+            cls = classes.get(c['data_structure_type'])
+            if (validate or tolerant) and cls is not None:
+                DecodeCondition(c, units=units)
+        except RECORD_ERRORS as e:
+            if not tolerant:
+                raise
+            _LOGGER.debug('Skipping malformed record %d from %s: %r', i, obj['did'], e)
+            _errors.append(RecordError.FromException(i, c, e))
+            continue
+        if cls is None:
+            _LOGGER.debug('Skipping unknown data structure type %s from %s', c.get('data_structure_type'), obj['did'])
+            continue
+        _conditions.append(cls(c))
+        rainError = RecordError.UnknownRainSize(i, c)
+        if rainError is not None:
+            _errors.append(rainError)
+
+    return WeatherLinkConditionsReport(
+        DeviceId=obj['did'],
+        Timestamp=datetime.fromtimestamp(obj['ts'], timezone.utc),
+        DeviceConditions=_conditions,
+        Errors=_errors
+    )
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import time
+
+from types import TracebackType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type
+)
+
+import aiohttp
+
+from .cache import ReportCache
+from .decoder import DecodeReport
+from .instrumentation import PollMetrics
+from .json_backend import GetBackend
+from .scheduler import FixedScheduler, Scheduler
+from .units import UnitSystem
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class WeatherLinkPoller:
+    """
+    Long-lived poller for many WeatherLink Live devices. All hosts share a single keep-alive connection pool, each
+    host is polled on its own schedule (jittered fixed intervals unless another Scheduler is given), and parsed
+    reports are delivered through an async iterator:
+
+        async with WeatherLinkPoller(hosts, interval=10) as poller:
+            async for report in poller:
+                ...
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        interval: float = 10.0,
+        jitter: float = 0.1,
+        per_host_limit: int = 1,
+        max_in_flight: int = 64,
+        queue_size: int = 256,
+        timeout: float = 10.0,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache: Optional[ReportCache] = None,
+        metrics: Optional[PollMetrics] = None,
+        json_backend: Optional[str] = None,
+        scheduler: Optional[Scheduler] = None,
+        units: UnitSystem = UnitSystem.Imperial,
+        tolerant: bool = False,
+        decoder: Optional[Callable[[Dict[str, Any]], WeatherLinkConditionsReport]] = None
+    ) -> None:
+        """
+        :param hosts: WeatherLink Live host names or addresses (optionally with :port)
+        :param interval: Seconds between polls of the same host, when no scheduler is given
+        :param jitter: Fraction of the interval each poll is randomly shifted by, when no scheduler is given
+        :param per_host_limit: Maximum concurrent requests to a single host; polls beyond it are skipped
+        :param max_in_flight: Maximum concurrent requests across all hosts
+        :param queue_size: Maximum parsed reports waiting to be consumed before polling applies backpressure
+        :param timeout: Total timeout for a single request in seconds
+        :param session: Externally owned session to use instead of creating one
+        :param cache: Cache to reuse reports from when a host returns an unchanged body
+        :param metrics: Records per-stage latency, errors and structure type counts when given
+        :param json_backend: JSON decoder to use (orjson, msgspec or json), or None for the fastest installed
+        :param scheduler: Decides when each host is polled, e.g. an AdaptiveScheduler; defaults to a FixedScheduler
+        :param units: Unit system reports are decoded into
+        :param tolerant: Deliver reports without their malformed condition records, listed in the report's Errors,
+            instead of failing the poll
+        :param decoder: Builds a report from the `data` member of a response, e.g. a partial of DecodeLazyReport;
+            defaults to DecodeReport with `units` and `tolerant`
+        """
+        self.Hosts: List[str] = list(dict.fromkeys(hosts))
+        self.Interval = interval
+        self.Jitter = jitter
+        self.PerHostLimit = per_host_limit
+        self.MaxInFlight = max_in_flight
+        self.Timeout = timeout
+        self.Cache = cache
+        self.Metrics = metrics
+        self.Scheduler = scheduler if scheduler is not None else FixedScheduler(interval, jitter)
+        self.Units = units
+        self.Tolerant = tolerant
+        self.Decoder = decoder if decoder is not None else functools.partial(DecodeReport, units=units, tolerant=tolerant)
+
+        self._loads = GetBackend(json_backend)
+
+        self._session = session
+        self._ownsSession = session is None
+        # None marks the end of iteration after Close()
+        self._queue: asyncio.Queue[Optional[WeatherLinkConditionsReport]] = asyncio.Queue(maxsize=queue_size)
+        self._ended = False
+        self._inFlight = asyncio.Semaphore(max_in_flight)
+        self._hostLimits: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+        self._requests: set[asyncio.Task[None]] = set()
+
+    async def __aenter__(self) -> WeatherLinkPoller:
+        await self.Start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        await self.Close()
+
+    def __aiter__(self) -> WeatherLinkPoller:
+        return self
+
+    async def __anext__(self) -> WeatherLinkConditionsReport:
+        if not self._tasks and self._queue.empty():
+            raise StopAsyncIteration
+        report = await self._queue.get()
+        if report is None:
+            # Leave the marker for any other consumer waiting
+            self._queue.put_nowait(None)
+            raise StopAsyncIteration
+        return report
+
+    async def Start(self) -> None:
+        """Open the shared connection pool and start polling every host."""
+        if self._tasks:
+            return
+
+        if self._ended:
+            self._queue.get_nowait()
+            self._ended = False
+
+        if self._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.MaxInFlight,
+                limit_per_host=self.PerHostLimit,
+                keepalive_timeout=max(30.0, self.Interval * 2)
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.Timeout),
+                trace_configs=[self.Metrics.TraceConfig()] if self.Metrics is not None else None
+            )
+
+        for host in self.Hosts:
+            self._hostLimits[host] = asyncio.Semaphore(self.PerHostLimit)
+            self._tasks.append(asyncio.create_task(self._Schedule(host), name=f'poll {host}'))
+
+    async def Close(self) -> None:
+        """Stop polling, cancel outstanding requests and release the connection pool."""
+        tasks = self._tasks + list(self._requests)
+        self._tasks = []
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._requests.clear()
+        self._End()
+
+        if self._session is not None and self._ownsSession:
+            await self._session.close()
+            self._session = None
+
+    def _End(self) -> None:
+        # Wake consumers waiting in __anext__. Only an empty queue can have any, and reports still queued end
+        # iteration once they have been taken.
+        if self._queue.empty() and not self._ended:
+            self._queue.put_nowait(None)
+            self._ended = True
+
+    async def _Schedule(self, host: str) -> None:
+        loop = asyncio.get_running_loop()
+        deadline = self.Scheduler.First(host, loop.time())
+
+        while True:
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+            if self._hostLimits[host].locked():
+                _LOGGER.debug('Skipping poll of %s, %d request(s) still outstanding', host, self.PerHostLimit)
+                self.Scheduler.Skipped(host)
+            else:
+                await self.Scheduler.Acquire()
+                request = asyncio.create_task(self._Poll(host))
+                self._requests.add(request)
+                request.add_done_callback(self._requests.discard)
+
+            deadline = await self.Scheduler.Next(host, deadline)
+
+    async def _Poll(self, host: str) -> None:
+        async with self._hostLimits[host]:
+            async with self._inFlight:
+                try:
+                    report = await self._Fetch(host)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    _LOGGER.warning('Polling %s failed: %r', host, e)
+                    if self.Metrics is not None:
+                        self.Metrics.Error(host, e)
+                    self.Scheduler.Failed(host, e)
+                    return
+
+            self.Scheduler.Succeeded(host, report)
+
+            # Wait for room outside the in-flight slot so a slow consumer throttles polling without holding
+            # connections open
+            await self._queue.put(report)
+
+    async def _Fetch(self, host: str) -> WeatherLinkConditionsReport:
+        assert self._session is not None
+
+        if self.Metrics is not None:
+            return await self._FetchInstrumented(host, self.Metrics)
+
+        url = f'http://{host}/v1/current_conditions'
+        async with self._session.get(url) as response:
+            response.raise_for_status()
+            body = await response.read()
+
+        if self.Cache is None:
+            return self.Decoder(self._loads(body)['data'])
+
+        digest = ReportCache.Digest(body)
+        report = self.Cache.Get(host, digest)
+        if report is None:
+            report = self.Decoder(self._loads(body)['data'])
+            self.Cache.Put(host, digest, report)
+
+        return report
+
+    async def _FetchInstrumented(self, host: str, metrics: PollMetrics) -> WeatherLinkConditionsReport:
+        # Same as _Fetch, timing each stage. Kept separate so polling without metrics pays nothing for them.
+        assert self._session is not None
+
+        url = f'http://{host}/v1/current_conditions'
+        started = time.perf_counter()
+        async with self._session.get(url, trace_request_ctx={'host': host}) as response:
+            response.raise_for_status()
+            body = await response.read()
+        received = time.perf_counter()
+        metrics.Observe(host, 'response', received - started)
+
+        digest = ReportCache.Digest(body) if self.Cache is not None else b''
+        report = self.Cache.Get(host, digest) if self.Cache is not None else None
+        if report is not None:
+            metrics.CacheHit(host)
+            return report
+
+        js = self._loads(body)
+        decoded = time.perf_counter()
+        metrics.Observe(host, 'json', decoded - received)
+
+        report = self.Decoder(js['data'])
+        metrics.Observe(host, 'build', time.perf_counter() - decoded)
+        metrics.Malformed(host, report.Errors)
+        metrics.Completed(host, js['data'])
+
+        if self.Cache is not None:
+            self.Cache.Put(host, digest, report)
+
+        return report
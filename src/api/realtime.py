@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from types import TracebackType
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type
+)
+
+import aiohttp
+
+from .decoder import DecodeRealTimeReport
+from .json_backend import Loads
+from .units import UnitSystem
+from .weatherlink_realtime_report import WeatherLinkRealTimeReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+REAL_TIME_PORT = 22222
+"""Default UDP port WeatherLink Live devices broadcast real-time updates on"""
+
+
+class RealTimeProtocol(asyncio.DatagramProtocol):
+    """Decodes real-time broadcast packets and hands each report to a callback."""
+
+    def __init__(self, callback: Callable[[WeatherLinkRealTimeReport], None], units: UnitSystem = UnitSystem.Imperial) -> None:
+        self._callback = callback
+        self._units = units
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]) -> None:
+        try:
+            report = DecodeRealTimeReport(Loads(data), self._units)
+        except Exception as e:
+            _LOGGER.debug('Ignoring malformed real-time packet from %s: %r', addr[0], e)
+            return
+
+        self._callback(report)
+
+    def error_received(self, exc: Exception) -> None:
+        _LOGGER.warning('Real-time socket error: %r', exc)
+
+
+class WeatherLinkRealTimeListener:
+    """
+    Receives real-time wind and rain broadcasts from many WeatherLink Live devices on a single UDP socket. The
+    broadcast lease of every host is renewed through `/v1/real_time` before it expires, and packets are routed to
+    per-device queues by `did`:
+
+        async with WeatherLinkRealTimeListener(hosts) as listener:
+            async for report in listener.Subscribe('001D0A700002'):
+                ...
+    """
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        duration: int = 1200,
+        rearm_margin: float = 60.0,
+        port: int = REAL_TIME_PORT,
+        queue_size: int = 64,
+        timeout: float = 10.0,
+        session: Optional[aiohttp.ClientSession] = None,
+        units: UnitSystem = UnitSystem.Imperial
+    ) -> None:
+        """
+        :param hosts: WeatherLink Live host names or addresses (optionally with :port) to request broadcasts from
+        :param duration: Broadcast lease to request from each device in seconds
+        :param rearm_margin: Seconds before the lease expires to renew it
+        :param port: Local UDP port to listen on, must match the devices' broadcast port
+        :param queue_size: Reports buffered per queue; the oldest is dropped when a consumer falls behind
+        :param timeout: Total timeout for a lease request in seconds
+        :param session: Externally owned session to use instead of creating one
+        :param units: Unit system of the reported values
+        """
+        self.Hosts: List[str] = list(dict.fromkeys(hosts))
+        self.Duration = duration
+        self.RearmMargin = min(rearm_margin, duration / 2)
+        self.Port = port
+        self.QueueSize = queue_size
+        self.Timeout = timeout
+        self.Units = units
+
+        self._session = session
+        self._ownsSession = session is None
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._queue: asyncio.Queue[WeatherLinkRealTimeReport] = asyncio.Queue(maxsize=queue_size)
+        self._subscribers: Dict[str, asyncio.Queue[WeatherLinkRealTimeReport]] = {}
+        self._tasks: List[asyncio.Task[None]] = []
+
+    async def __aenter__(self) -> WeatherLinkRealTimeListener:
+        await self.Start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        await self.Close()
+
+    def __aiter__(self) -> WeatherLinkRealTimeListener:
+        return self
+
+    async def __anext__(self) -> WeatherLinkRealTimeReport:
+        """Reports from devices without a dedicated subscription"""
+        if self._transport is None and self._queue.empty():
+            raise StopAsyncIteration
+        return await self._queue.get()
+
+    def Subscribe(self, device_id: str) -> _Subscription:
+        """
+        Route reports from one device to a dedicated queue
+
+        :param device_id: Device id (`did`) of the WeatherLink Live
+        """
+        queue = self._subscribers.get(device_id)
+        if queue is None:
+            queue = self._subscribers[device_id] = asyncio.Queue(maxsize=self.QueueSize)
+        return _Subscription(self, queue)
+
+    async def Start(self) -> None:
+        """Bind the UDP socket and start requesting broadcasts from every host."""
+        if self._transport is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: RealTimeProtocol(self._Dispatch, self.Units),
+            local_addr=('0.0.0.0', self.Port),
+            reuse_port=True,
+            allow_broadcast=True
+        )
+
+        if self._session is None:
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.Timeout))
+
+        for host in self.Hosts:
+            self._tasks.append(asyncio.create_task(self._Lease(host), name=f'real_time {host}'))
+
+    async def Close(self) -> None:
+        """Stop renewing leases and close the socket. Devices stop broadcasting once their lease runs out."""
+        tasks = self._tasks
+        self._tasks = []
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+        if self._session is not None and self._ownsSession:
+            await self._session.close()
+            self._session = None
+
+    def _Dispatch(self, report: WeatherLinkRealTimeReport) -> None:
+        queue = self._subscribers.get(report.DeviceId, self._queue)
+
+        # Real-time updates supersede each other, so a slow consumer loses the oldest rather than stalling the socket
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(report)
+
+    async def _Lease(self, host: str) -> None:
+        assert self._session is not None
+
+        url = f'http://{host}/v1/real_time'
+        while True:
+            try:
+                async with self._session.get(url, params={'duration': str(self.Duration)}) as response:
+                    response.raise_for_status()
+                    js = Loads(await response.read())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                _LOGGER.warning('Requesting real-time broadcast from %s failed: %r', host, e)
+                await asyncio.sleep(self.RearmMargin)
+                continue
+
+            data = js.get('data') or {}
+            if data.get('broadcast_port', self.Port) != self.Port:
+                _LOGGER.warning('%s broadcasts on port %s, but listening on %d', host, data['broadcast_port'], self.Port)
+
+            duration = data.get('duration', self.Duration)
+            _LOGGER.debug('Real-time lease from %s granted for %ss', host, duration)
+            await asyncio.sleep(max(1.0, duration - self.RearmMargin))
+
+
+class _Subscription:
+    """Async iterator over the reports of a single device"""
+
+    def __init__(self, listener: WeatherLinkRealTimeListener, queue: asyncio.Queue[WeatherLinkRealTimeReport]) -> None:
+        self._listener = listener
+        self._queue = queue
+
+    def __aiter__(self) -> _Subscription:
+        return self
+
+    async def __anext__(self) -> WeatherLinkRealTimeReport:
+        if self._listener._transport is None and self._queue.empty():
+            raise StopAsyncIteration
+        return await self._queue.get()
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Deque,
+    Dict,
+    Optional
+)
+
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+class TokenBucket:
+    """Caps the average rate of an operation at `rate` per second while allowing bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: float = 1.0) -> None:
+        """
+        :param rate: Tokens added per second
+        :param burst: Maximum tokens held, i.e. the largest burst allowed after a quiet period
+        """
+        if rate <= 0:
+            raise ValueError(f'rate must be positive, got {rate}')
+
+        self.Rate = rate
+        self.Burst = max(1.0, burst)
+
+        self._tokens = self.Burst
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def Acquire(self) -> None:
+        """Take one token, waiting for it if the bucket is empty. Waiters are served in arrival order."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.Burst, self._tokens + (now - self._updated) * self.Rate)
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.Rate)
+
+
+class Scheduler:
+    """
+    Decides when WeatherLinkPoller polls each host. The poller calls First() once per host, then for every tick
+    waits in Acquire(), starts a poll and asks Next() for the following deadline. Deadlines are event loop times.
+    Succeeded() and Failed() report the outcome of each poll that was started, and Skipped() is called instead when
+    a tick is skipped because the host's previous poll is still outstanding.
+    """
+
+    def __init__(self, max_rate: Optional[float] = None, burst: float = 1.0) -> None:
+        """
+        :param max_rate: Maximum polls per second across all hosts, or None for no limit
+        :param burst: Polls allowed at once when under `max_rate`
+        """
+        self.Bucket = TokenBucket(max_rate, burst) if max_rate is not None else None
+
+    def First(self, host: str, now: float) -> float:
+        raise NotImplementedError
+
+    async def Next(self, host: str, deadline: float) -> float:
+        """
+        Deadline of the poll after the one due at `deadline`
+
+        :param host: Polled host
+        :param deadline: Deadline of the poll just started or skipped
+        """
+        raise NotImplementedError
+
+    async def Acquire(self) -> None:
+        """Wait until the global rate limit allows another poll"""
+        if self.Bucket is not None:
+            await self.Bucket.Acquire()
+
+    def Succeeded(self, host: str, report: WeatherLinkConditionsReport) -> None:
+        pass
+
+    def Failed(self, host: str, error: BaseException) -> None:
+        pass
+
+    def Skipped(self, host: str) -> None:
+        pass
+
+
+class FixedScheduler(Scheduler):
+    """Polls every host every `interval` seconds, shifted by random jitter so hosts don't fire in lockstep."""
+
+    def __init__(self, interval: float = 10.0, jitter: float = 0.1, max_rate: Optional[float] = None, burst: float = 1.0) -> None:
+        """
+        :param interval: Seconds between polls of the same host
+        :param jitter: Fraction of the interval each poll is randomly shifted by
+        :param max_rate: Maximum polls per second across all hosts, or None for no limit
+        :param burst: Polls allowed at once when under `max_rate`
+        """
+        super().__init__(max_rate, burst)
+        self.Interval = interval
+        self.Jitter = jitter
+
+    def First(self, host: str, now: float) -> float:
+        # Spread the first poll of every host over one interval so a large fleet doesn't start in a burst
+        return now + random.uniform(0.0, self.Interval)
+
+    async def Next(self, host: str, deadline: float) -> float:
+        return deadline + max(0.0, self.Interval * (1.0 + random.uniform(-self.Jitter, self.Jitter)))
+
+
+@dataclass
+class _DeviceState:
+    Cadence: float
+    """Estimated seconds between updates of the device's conditions"""
+
+    LastTimestamp: Optional[float] = None
+    """Report timestamp of the latest update seen"""
+
+    Skews: Deque[float] = field(default_factory=lambda: deque(maxlen=16))
+    """Local time minus device timestamp when each recent update was first seen"""
+
+    Failures: int = 0
+    """Consecutive failed polls"""
+
+    Stale: int = 0
+    """Consecutive polls that returned an update already seen"""
+
+    Learning: bool = True
+    """Polling at the minimum interval until two consecutive updates have been seen"""
+
+    Settled: asyncio.Event = field(default_factory=asyncio.Event)
+    """Set when a poll completes or a tick is skipped, so Next() can plan from the latest outcome"""
+
+
+class AdaptiveScheduler(Scheduler):
+    """
+    Learns how often each device updates its conditions from successive report timestamps and polls just after
+    each expected update. Failed polls back off exponentially, and `max_rate` caps requests across all hosts.
+
+    A new device is polled every `min_interval` until two consecutive updates have been seen, which measures its
+    cadence directly; after that the estimate follows the intervals between the updates each poll finds.
+
+    Each device is polled at most once at a time: Next() waits for the outcome of the previous poll before planning
+    the following one. A skipped tick doesn't wait, since the poll still outstanding (e.g. held back by a slow
+    consumer) may not finish for a while.
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = 10.0,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        lag: float = 0.5,
+        smoothing: float = 0.2,
+        max_backoff: float = 300.0,
+        max_rate: Optional[float] = None,
+        burst: float = 1.0
+    ) -> None:
+        """
+        :param initial_interval: Assumed update cadence of a device until one has been measured
+        :param min_interval: Shortest time between polls of the same host
+        :param max_interval: Longest time between polls of a healthy host
+        :param lag: Seconds after an expected update to poll, allowing for clock error and request latency
+        :param smoothing: Weight of each new interval measurement in the cadence estimate, between 0 and 1
+        :param max_backoff: Longest time between polls of a failing host
+        :param max_rate: Maximum polls per second across all hosts, or None for no limit
+        :param burst: Polls allowed at once when under `max_rate`
+        """
+        super().__init__(max_rate, burst)
+        self.InitialInterval = initial_interval
+        self.MinInterval = min_interval
+        self.MaxInterval = max_interval
+        self.Lag = lag
+        self.Smoothing = smoothing
+        self.MaxBackoff = max_backoff
+
+        self._devices: Dict[str, _DeviceState] = {}
+
+    def Cadence(self, host: str) -> Optional[float]:
+        """Estimated seconds between updates of a host, or None if it hasn't been polled"""
+        state = self._devices.get(host)
+        return state.Cadence if state is not None else None
+
+    def _State(self, host: str) -> _DeviceState:
+        state = self._devices.get(host)
+        if state is None:
+            state = self._devices[host] = _DeviceState(Cadence=self.InitialInterval)
+        return state
+
+    def First(self, host: str, now: float) -> float:
+        self._State(host)
+        return now + random.uniform(0.0, self.InitialInterval)
+
+    def Succeeded(self, host: str, report: WeatherLinkConditionsReport) -> None:
+        state = self._State(host)
+        state.Failures = 0
+
+        ts = report.Timestamp.timestamp()
+        if state.LastTimestamp is not None and ts <= state.LastTimestamp:
+            state.Stale += 1
+        else:
+            if state.LastTimestamp is not None:
+                delta = ts - state.LastTimestamp
+                if state.Learning:
+                    state.Cadence = min(self.MaxInterval, max(self.MinInterval, delta))
+                    state.Learning = False
+                else:
+                    # Polls that miss updates see a multiple of the cadence, so measure one cycle of it
+                    cycles = max(1, round(delta / state.Cadence))
+                    measured = min(self.MaxInterval, max(self.MinInterval, delta / cycles))
+                    state.Cadence += self.Smoothing * (measured - state.Cadence)
+
+            state.LastTimestamp = ts
+            state.Stale = 0
+            # The update happened no later than now, so the smallest recent difference is the closest estimate of
+            # the device's clock offset plus the delay before its updates become visible
+            state.Skews.append(time.time() - ts)
+
+        state.Settled.set()
+
+    def Failed(self, host: str, error: BaseException) -> None:
+        state = self._State(host)
+        state.Failures += 1
+        state.Settled.set()
+
+    def Skipped(self, host: str) -> None:
+        # Plan from what is already known; the outstanding poll's outcome is picked up by the tick after
+        self._State(host).Settled.set()
+
+    async def Next(self, host: str, deadline: float) -> float:
+        state = self._State(host)
+        await state.Settled.wait()
+        state.Settled.clear()
+
+        now = asyncio.get_running_loop().time()
+
+        if state.Failures:
+            backoff = min(self.MaxBackoff, state.Cadence * 2.0 ** (state.Failures - 1))
+            return now + random.uniform(0.5, 1.0) * backoff
+
+        if state.Learning:
+            return now + self.MinInterval
+
+        if state.Stale:
+            # Polled before the expected update arrived: retry soon, a little later each time
+            return now + min(self.MaxInterval, max(self.MinInterval, state.Cadence * 0.25 * state.Stale))
+
+        assert state.LastTimestamp is not None
+        expected = state.LastTimestamp + min(state.Skews) + state.Cadence + self.Lag
+        delay = expected - time.time()
+        return now + min(self.MaxInterval, max(self.MinInterval, delay))
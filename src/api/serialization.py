@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import typing
+
+from dataclasses import asdict, fields
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type
+)
+
+from . import device_condition_reports
+from .device_condition_reports.iss import Wind
+from .device_condition_reports.receiver_state import RxState
+from .weatherlink_conditions_report import DeviceConditionT, RecordError, WeatherLinkConditionsReport
+
+
+# Condition objects are written as plain JSON-compatible dicts keyed by attribute name, plus a "Type" entry naming
+# the class. Field codecs are chosen once per class from the dataclass annotations.
+
+CodecT = Tuple[Callable[[Any], Any], Callable[[Any], Any]]
+"""(encode, decode) functions converting one field to and from its JSON-compatible form"""
+
+
+def _Identity(value: Any) -> Any:
+    return value
+
+
+def _Optional(func: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else func(value)
+
+
+_CODECS: Dict[str, CodecT] = {
+    'value': (_Identity, _Identity),
+    'datetime': (
+        _Optional(lambda v: v.timestamp()),
+        _Optional(lambda v: datetime.fromtimestamp(v, timezone.utc))
+    ),
+    'rx_state': (
+        _Optional(lambda v: v.value),
+        _Optional(RxState)
+    ),
+    'wind': (
+        _Optional(lambda v: [v.Speed, v.Direction]),
+        _Optional(lambda v: Wind(v[0], v[1]))
+    ),
+    'slots': (
+        lambda v: {str(k): x for k, x in v.items()},
+        lambda v: {int(k): x for k, x in v.items()}
+    ),
+    'tuple': (list, tuple)
+}
+
+
+def _Kind(annotation: Any) -> str:
+    args = typing.get_args(annotation)
+    if datetime in args or annotation is datetime:
+        return 'datetime'
+    if RxState in args or annotation is RxState:
+        return 'rx_state'
+    if Wind in args or annotation is Wind:
+        return 'wind'
+
+    origin = typing.get_origin(annotation)
+    if origin is dict:
+        return 'slots'
+    if origin is tuple:
+        return 'tuple'
+    return 'value'
+
+
+CONDITION_TYPES: Dict[str, Type[DeviceConditionT]] = {
+    name: getattr(device_condition_reports, name) for name in device_condition_reports.__all__
+}
+"""Condition classes by class name"""
+
+_FIELD_CODECS: Dict[Type[Any], Tuple[Tuple[str, CodecT], ...]] = {}
+
+
+def FieldCodecs(cls: Type[Any]) -> Tuple[Tuple[str, CodecT], ...]:
+    """
+    (field name, codec) of every field of a condition class, in field order. Built once per class.
+
+    :param cls: Any condition class from api.device_condition_reports
+    """
+    codecs = _FIELD_CODECS.get(cls)
+    if codecs is None:
+        hints = typing.get_type_hints(cls)
+        codecs = _FIELD_CODECS[cls] = tuple((f.name, _CODECS[_Kind(hints[f.name])]) for f in fields(cls))
+    return codecs
+
+
+_CONDITION_CLASSES: Dict[type, Type[DeviceConditionT]] = {}
+
+
+def ConditionClass(cls: type) -> Type[DeviceConditionT]:
+    """
+    Condition class that objects of `cls` are written as. Subclasses such as the api.lazy views are written as the
+    condition class they extend, so they can be read back without them.
+
+    :param cls: Any condition class from api.device_condition_reports, or a subclass of one
+    """
+    conditionClass = _CONDITION_CLASSES.get(cls)
+    if conditionClass is None:
+        conditionClass = _CONDITION_CLASSES[cls] = next(c for c in cls.__mro__ if CONDITION_TYPES.get(c.__name__) is c)
+    return conditionClass
+
+
+def ConditionToDict(condition: DeviceConditionT) -> Dict[str, Any]:
+    """
+    Convert a condition to a JSON-compatible dict
+
+    :param condition: Any condition class from api.device_condition_reports
+    """
+    cls = ConditionClass(type(condition))
+    obj: Dict[str, Any] = {'Type': cls.__name__}
+    for name, (encode, _) in FieldCodecs(cls):
+        obj[name] = encode(getattr(condition, name))
+    return obj
+
+
+def ConditionFromDict(obj: Dict[str, Any]) -> DeviceConditionT:
+    """
+    Rebuild a condition from ConditionToDict() output
+
+    :param obj: Python dictionary, often returned from json.loads()
+    """
+    cls = CONDITION_TYPES[obj['Type']]
+    return cls(**{name: decode(obj[name]) for name, (_, decode) in FieldCodecs(cls)})
+
+
+_ROW_DECODERS: Dict[Type[Any], Tuple[Tuple[int, Callable[[Any], Any]], ...]] = {}
+
+
+def ConditionToRow(condition: DeviceConditionT) -> List[Any]:
+    """
+    Convert a condition to a compact JSON-compatible list: the class name, then every field in field order. Smaller
+    and quicker to read back than ConditionToDict() output, for passing conditions between processes of the same
+    version.
+
+    :param condition: Any condition class from api.device_condition_reports
+    """
+    cls = ConditionClass(type(condition))
+    row: List[Any] = [cls.__name__]
+    for name, (encode, _) in FieldCodecs(cls):
+        row.append(encode(getattr(condition, name)))
+    return row
+
+
+def ConditionFromRow(row: List[Any]) -> DeviceConditionT:
+    """
+    Rebuild a condition from ConditionToRow() output
+
+    :param row: List, often returned from json.loads()
+    """
+    cls = CONDITION_TYPES[row[0]]
+    decoders = _ROW_DECODERS.get(cls)
+    if decoders is None:
+        # Most fields are plain values, so only the others are decoded
+        decoders = _ROW_DECODERS[cls] = tuple(
+            (i, decode) for i, (_, (_, decode)) in enumerate(FieldCodecs(cls)) if decode is not _Identity
+        )
+
+    values = row[1:]
+    for i, decode in decoders:
+        values[i] = decode(values[i])
+    return cls(*values)
+
+
+def ReportToDict(report: WeatherLinkConditionsReport) -> Dict[str, Any]:
+    """
+    Convert a report to a JSON-compatible dict
+
+    :param report: Report to convert
+    """
+    obj: Dict[str, Any] = {
+        'DeviceId': report.DeviceId,
+        'Timestamp': report.Timestamp.timestamp(),
+        'DeviceConditions': [ConditionToDict(c) for c in report.DeviceConditions]
+    }
+    # Left out when empty, so reports decoded strictly serialize as they always have
+    if report.Errors:
+        obj['Errors'] = [asdict(e) for e in report.Errors]
+    return obj
+
+
+def ReportFromDict(obj: Dict[str, Any]) -> WeatherLinkConditionsReport:
+    """
+    Rebuild a report from ReportToDict() output
+
+    :param obj: Python dictionary, often returned from json.loads()
+    """
+    return WeatherLinkConditionsReport(
+        DeviceId=obj['DeviceId'],
+        Timestamp=datetime.fromtimestamp(obj['Timestamp'], timezone.utc),
+        DeviceConditions=[ConditionFromDict(c) for c in obj['DeviceConditions']],
+        Errors=[RecordError(**e) for e in obj.get('Errors', ())]
+    )
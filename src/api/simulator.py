@@ -0,0 +1,572 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import random
+import socket
+import time
+
+from argparse import ArgumentParser
+from collections import deque
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    List,
+    Optional,
+    Tuple
+)
+
+from aiohttp import web
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+# Record generators. Values follow the documented schemas in api/device_condition_reports. Each sensor keeps its
+# state from one update to the next, so consecutive polls look like a real station rather than noise: readings
+# follow the time of day plus a small random walk, rain counters only grow until the day, month or year rolls over,
+# and storm timestamps stay put once set.
+
+def _Diurnal(t: float, mean: float, amplitude: float, phase: float = 0.0) -> float:
+    return mean + amplitude * math.sin(2 * math.pi * ((t / 86400.0) + phase))
+
+
+def _Walk(rng: random.Random, value: float, mean: float, step: float, steps: float, low: float, high: float) -> float:
+    # A random walk pulled back towards `mean`, scaled to the number of 10 second steps that have passed
+    pull = min(1.0, 0.02 * steps)
+    value += pull * (mean - value) + rng.gauss(0, step * math.sqrt(steps))
+    return min(high, max(low, value))
+
+
+@dataclass
+class SensorState:
+    """State one simulated sensor carries between updates"""
+
+    Updated: float | None = None
+    """UNIX time of the latest update"""
+
+    def Advance(self, rng: random.Random, t: float) -> float:
+        """
+        Move the state forward to UNIX time `t`
+
+        :return: Number of 10 second steps since the previous update, 0 for the first update or a repeated time
+        """
+        steps = 0.0 if self.Updated is None or t <= self.Updated else min(8640.0, (t - self.Updated) / 10.0)
+        if self.Updated is None or t > self.Updated:
+            self.Updated = t
+        return steps
+
+
+@dataclass
+class IssState(SensorState):
+    """Weather, wind and rain state of a simulated ISS"""
+
+    TemperatureOffset: float = 0.0
+    """Degrees Fahrenheit added to the time of day's temperature"""
+
+    HumidityOffset: float = 0.0
+    """Percent added to the time of day's humidity"""
+
+    WindSpeed: float = 6.0
+    """Wind speed in miles per hour"""
+
+    WindDirection: float = 250.0
+    """Wind direction in degrees, unwrapped so it can walk past north"""
+
+    WindAverages: List[float] = field(default_factory=lambda: [6.0, 6.0, 6.0])
+    """1, 2 and 10 minute moving averages of WindSpeed"""
+
+    DirectionAverages: List[float] = field(default_factory=lambda: [250.0, 250.0, 250.0])
+    """1, 2 and 10 minute moving averages of WindDirection"""
+
+    Winds: Deque[Tuple[float, float, int]] = field(default_factory=deque)
+    """(time, speed, direction) of the last 10 minutes' readings, for the gusts"""
+
+    Raining: bool = False
+    """Whether a shower is in progress"""
+
+    RainRate: float = 0.0
+    """Rain rate in counts per hour"""
+
+    RainFraction: float = 0.0
+    """Rain not yet counted, as a fraction of one count"""
+
+    Rain: Deque[Tuple[float, int, int]] = field(default_factory=deque)
+    """(time, counts, rate) of the last 24 hours' rain"""
+
+    Day: Tuple[int, int, int] | None = None
+    """(year, month, day) in UTC of the latest update, to reset the counters when it changes"""
+
+    Daily: int = 0
+    """Rain counts since midnight UTC"""
+
+    Monthly: int = 0
+    """Rain counts since the first of the month"""
+
+    Yearly: int = 0
+    """Rain counts since the first of the year"""
+
+    Storm: int = 0
+    """Rain counts of the current storm"""
+
+    StormStarted: int | None = None
+    """UNIX time the current storm started, None between storms"""
+
+    LastRain: float | None = None
+    """UNIX time rain was last counted"""
+
+    StormLast: int = 0
+    """Rain counts of the previous storm"""
+
+    StormLastStarted: int | None = None
+    """UNIX time the previous storm started"""
+
+    StormLastEnded: int | None = None
+    """UNIX time the previous storm ended"""
+
+    def Advance(self, rng: random.Random, t: float) -> float:
+        first = self.Updated is None
+        steps = super().Advance(rng, t)
+        if first:
+            self.Monthly = rng.randint(0, 200)
+            self.Yearly = self.Monthly + rng.randint(500, 2000)
+            self.StormLast = rng.randint(10, 80)
+            self.StormLastEnded = int(t) - rng.randint(2, 20) * 86400
+            self.StormLastStarted = self.StormLastEnded - rng.randint(3600, 2 * 86400)
+        elif not steps:
+            return steps
+
+        self.TemperatureOffset = _Walk(rng, self.TemperatureOffset, 0.0, 0.05, steps, -5, 5)
+        self.HumidityOffset = _Walk(rng, self.HumidityOffset, 0.0, 0.2, steps, -20, 20)
+        self.WindSpeed = _Walk(rng, self.WindSpeed, 6.0, 0.6, steps, 0, 60)
+        self.WindDirection = _Walk(rng, self.WindDirection, 250.0, 4.0, steps, 0, 720)
+        for i, period in enumerate((60.0, 120.0, 600.0)):
+            weight = 1.0 if first else min(1.0, steps * 10.0 / period)
+            self.WindAverages[i] += weight * (self.WindSpeed - self.WindAverages[i])
+            self.DirectionAverages[i] += weight * (self.WindDirection - self.DirectionAverages[i])
+        self.Winds.append((t, round(self.WindSpeed), int(self.WindDirection) % 360))
+        while self.Winds[0][0] <= t - 600:
+            self.Winds.popleft()
+
+        tm = time.gmtime(t)
+        day = (tm.tm_year, tm.tm_mon, tm.tm_mday)
+        if self.Day is not None and day != self.Day:
+            self.Daily = 0
+            if day[:2] != self.Day[:2]:
+                self.Monthly = 0
+            if day[0] != self.Day[0]:
+                self.Yearly = 0
+        self.Day = day
+
+        # Dry spells average 12 hours and showers 1 hour
+        hours = steps * 10.0 / 3600.0
+        if self.Raining and rng.random() < 1.0 - math.exp(-hours):
+            self.Raining = False
+        elif not self.Raining and rng.random() < 1.0 - math.exp(-hours / 12.0):
+            self.Raining = True
+            self.RainRate = rng.uniform(5, 40)
+
+        if self.Raining:
+            self.RainRate = _Walk(rng, self.RainRate, 20.0, 1.0, steps, 2, 120)
+            self.RainFraction += self.RainRate * hours
+            counts = int(self.RainFraction)
+            self.RainFraction -= counts
+            if counts:
+                if self.StormStarted is None:
+                    self.StormStarted = int(t)
+                    self.Storm = 0
+                self.Daily += counts
+                self.Monthly += counts
+                self.Yearly += counts
+                self.Storm += counts
+                self.LastRain = t
+            self.Rain.append((t, counts, int(self.RainRate)))
+        while self.Rain and self.Rain[0][0] <= t - 86400:
+            self.Rain.popleft()
+
+        # A storm ends after a 24 hour break in rain
+        if self.StormStarted is not None and self.LastRain is not None and t - self.LastRain >= 86400:
+            self.StormLast, self.StormLastStarted, self.StormLastEnded = self.Storm, self.StormStarted, int(self.LastRain)
+            self.StormStarted = None
+            self.Storm = 0
+        return steps
+
+    def RainSince(self, t: float) -> int:
+        """Rain counts after UNIX time `t`"""
+        return sum(counts for when, counts, _ in self.Rain if when > t)
+
+    def RateSince(self, t: float) -> int:
+        """Highest rain rate in counts per hour after UNIX time `t`"""
+        return max((rate for when, _, rate in self.Rain if when > t), default=0)
+
+
+@dataclass
+class MoistureState(SensorState):
+    """Soil moisture and leaf wetness of a simulated leaf/soil station"""
+
+    Moisture: List[float] = field(default_factory=lambda: [20.0, 28.0])
+    """Soil moisture of slots 1 and 2 in centibars"""
+
+    Wetness: float = 4.0
+    """Leaf wetness of slot 1"""
+
+    def Advance(self, rng: random.Random, t: float) -> float:
+        steps = super().Advance(rng, t)
+        self.Moisture = [_Walk(rng, m, mean, 0.05, steps, 0, 200) for m, mean in zip(self.Moisture, (20.0, 28.0))]
+        self.Wetness = _Walk(rng, self.Wetness, 4.0, 0.05, steps, 0, 15)
+        return steps
+
+
+@dataclass
+class IndoorState(SensorState):
+    """Offsets of the readings of a simulated WeatherLink Live's built-in sensors"""
+
+    PressureOffset: float = 0.0
+    """Inches of mercury added to the time of day's pressure"""
+
+    TemperatureOffset: float = 0.0
+    """Degrees Fahrenheit added to the indoor temperature"""
+
+    HumidityOffset: float = 0.0
+    """Percent added to the indoor humidity"""
+
+    def Advance(self, rng: random.Random, t: float) -> float:
+        steps = super().Advance(rng, t)
+        self.PressureOffset = _Walk(rng, self.PressureOffset, 0.0, 0.0002, steps, -0.5, 0.5)
+        self.TemperatureOffset = _Walk(rng, self.TemperatureOffset, 0.0, 0.02, steps, -3, 3)
+        self.HumidityOffset = _Walk(rng, self.HumidityOffset, 0.0, 0.05, steps, -10, 10)
+        return steps
+
+
+def IssRecord(
+    rng: random.Random,
+    lsid: int,
+    txid: int,
+    t: float,
+    rain_size: int = 1,
+    state: Optional[IssState] = None
+) -> Dict[str, Any]:
+    """
+    ISS current conditions record (data_structure_type 1) at UNIX time t
+
+    :param state: State carried over from the previous update of the same ISS, updated in place. A new station is
+        simulated when it is None.
+    """
+    if state is None:
+        state = IssState()
+    state.Advance(rng, t)
+
+    temp = round(_Diurnal(t, 60.0, 12.0) + state.TemperatureOffset, 1)
+    hum = round(min(100.0, max(5.0, _Diurnal(t, 55.0, -20.0) + state.HumidityOffset)), 1)
+    dew = round(temp - (100 - hum) / 5 * 1.8, 1)
+    wind = float(round(state.WindSpeed))
+    direction = int(state.WindDirection) % 360
+    averages = [round(a, 1) for a in state.WindAverages]
+    directions = [int(d) % 360 for d in state.DirectionAverages]
+    gust2 = max((w for w in state.Winds if w[0] > t - 120), key=lambda w: w[1])
+    gust10 = max(state.Winds, key=lambda w: w[1])
+    solar = max(0, int(_Diurnal(t, 200, 600, -0.25)))
+    rate = int(state.RainRate) if state.Raining else 0
+
+    return {
+        "lsid": lsid, "data_structure_type": 1, "txid": txid,
+        "temp": temp, "hum": hum, "dew_point": dew, "wet_bulb": round((temp + dew) / 2, 1),
+        "heat_index": temp, "wind_chill": round(temp - wind / 4, 1), "thw_index": temp, "thsw_index": round(temp + solar / 200, 1),
+        "wind_speed_last": wind, "wind_dir_last": direction,
+        "wind_speed_avg_last_1_min": averages[0], "wind_dir_scalar_avg_last_1_min": directions[0],
+        "wind_speed_avg_last_2_min": averages[1], "wind_dir_scalar_avg_last_2_min": directions[1],
+        "wind_speed_hi_last_2_min": gust2[1], "wind_dir_at_hi_speed_last_2_min": gust2[2],
+        "wind_speed_avg_last_10_min": averages[2], "wind_dir_scalar_avg_last_10_min": directions[2],
+        "wind_speed_hi_last_10_min": gust10[1], "wind_dir_at_hi_speed_last_10_min": gust10[2],
+        "rain_size": rain_size,
+        "rain_rate_last": rate, "rain_rate_hi": state.RateSince(t - 60),
+        "rainfall_last_15_min": state.RainSince(t - 900), "rain_rate_hi_last_15_min": state.RateSince(t - 900),
+        "rainfall_last_60_min": state.RainSince(t - 3600), "rainfall_last_24_hr": state.RainSince(t - 86400),
+        "rain_storm": state.Storm if state.StormStarted is not None else None, "rain_storm_start_at": state.StormStarted,
+        "solar_rad": solar, "uv_index": round(solar / 110, 1), "rx_state": 0, "trans_battery_flag": 0,
+        "rainfall_daily": state.Daily, "rainfall_monthly": state.Monthly, "rainfall_year": state.Yearly,
+        "rain_storm_last": state.StormLast, "rain_storm_last_start_at": state.StormLastStarted,
+        "rain_storm_last_end_at": state.StormLastEnded
+    }
+
+
+def MoistureRecord(rng: random.Random, lsid: int, txid: int, t: float, state: Optional[MoistureState] = None) -> Dict[str, Any]:
+    """Leaf/soil moisture record (data_structure_type 2) at UNIX time t, with slots 1-2 populated"""
+    if state is None:
+        state = MoistureState()
+    state.Advance(rng, t)
+
+    return {
+        "lsid": lsid, "data_structure_type": 2, "txid": txid,
+        "temp_1": round(_Diurnal(t, 58.0, 4.0, -0.1), 1), "temp_2": round(_Diurnal(t, 56.0, 2.0, -0.15), 1),
+        "temp_3": None, "temp_4": None,
+        "moist_soil_1": round(state.Moisture[0]), "moist_soil_2": round(state.Moisture[1]), "moist_soil_3": None, "moist_soil_4": None,
+        "wet_leaf_1": round(state.Wetness), "wet_leaf_2": None,
+        "rx_state": 0, "trans_battery_flag": 0
+    }
+
+
+def BarometerRecord(rng: random.Random, lsid: int, t: float, state: Optional[IndoorState] = None) -> Dict[str, Any]:
+    """LSS barometer record (data_structure_type 3) at UNIX time t"""
+    if state is None:
+        state = IndoorState()
+    state.Advance(rng, t)
+
+    pressure = round(_Diurnal(t, 29.92, 0.05, 0.3) + state.PressureOffset, 3)
+    trend = round(_Diurnal(t, 29.92, 0.05, 0.3) - _Diurnal(t - 10800, 29.92, 0.05, 0.3), 2)
+    return {
+        "lsid": lsid, "data_structure_type": 3,
+        "bar_sea_level": pressure, "bar_trend": trend, "bar_absolute": round(pressure - 0.55, 3)
+    }
+
+
+def TempHumRecord(rng: random.Random, lsid: int, t: float, state: Optional[IndoorState] = None) -> Dict[str, Any]:
+    """LSS indoor temperature/humidity record (data_structure_type 4) at UNIX time t"""
+    if state is None:
+        state = IndoorState()
+    state.Advance(rng, t)
+
+    temp = round(71.0 + state.TemperatureOffset, 1)
+    return {
+        "lsid": lsid, "data_structure_type": 4,
+        "temp_in": temp, "hum_in": round(40 + state.HumidityOffset, 1), "dew_point_in": round(temp - 25, 1), "heat_index_in": temp
+    }
+
+
+def _Malform(rng: random.Random, records: List[Dict[str, Any]]) -> None:
+    # The failure modes seen from real devices and firmware updates
+    record = rng.choice(records)
+    fault = rng.randrange(4)
+    if fault == 0:
+        record.pop(rng.choice([k for k in record if k not in ('lsid', 'data_structure_type')]))
+    elif fault == 1 and 'rx_state' in record:
+        record['rx_state'] = None
+    elif fault == 2 and 'rain_size' in record:
+        record['rain_size'] = 0
+    else:
+        record['data_structure_type'] = 99
+
+
+@dataclass
+class VirtualDevice:
+    """
+    A simulated WeatherLink Live with one ISS, a leaf/soil station, and the built-in barometer and sensors. Sensor
+    state moves forward with each update, so times should be given in increasing order; earlier times return the
+    latest update.
+    """
+
+    DeviceId: str
+    Seed: int
+    UpdateInterval: float = 10.0
+    """Seconds between sensor updates; polls in between return the same payload"""
+
+    _cached: Tuple[int, Dict[str, Any]] | None = field(default=None, repr=False)
+    _rng: random.Random = field(init=False, repr=False)
+    _iss: IssState = field(default_factory=IssState, repr=False)
+    _moisture: MoistureState = field(default_factory=MoistureState, repr=False)
+    _indoor: IndoorState = field(default_factory=IndoorState, repr=False)
+
+    def __post_init__(self) -> None:
+        self._rng = random.Random(self.Seed)
+
+    def CurrentConditions(self, now: float) -> Dict[str, Any]:
+        """`data` member of a `current_conditions` response at UNIX time `now`"""
+        ts = int(now - now % self.UpdateInterval)
+        if self._cached is not None and self._cached[0] >= ts:
+            return self._cached[1]
+
+        rng = self._rng
+        base = self.Seed * 10
+        data = {
+            "did": self.DeviceId,
+            "ts": ts,
+            "conditions": [
+                IssRecord(rng, base + 1, 1, ts, state=self._iss),
+                MoistureRecord(rng, base + 2, 3, ts, state=self._moisture),
+                BarometerRecord(rng, base + 3, ts, state=self._indoor),
+                TempHumRecord(rng, base + 4, ts, state=self._indoor)
+            ]
+        }
+        self._cached = (ts, data)
+        return data
+
+    def RealTime(self, now: float) -> Dict[str, Any]:
+        """Real-time UDP broadcast packet at UNIX time `now`"""
+        iss = IssRecord(self._rng, self.Seed * 10 + 1, 1, now, state=self._iss)
+        keys = (
+            'lsid', 'data_structure_type', 'txid', 'wind_speed_last', 'wind_dir_last', 'wind_speed_hi_last_10_min',
+            'wind_dir_at_hi_speed_last_10_min', 'rain_size', 'rain_rate_last', 'rain_storm', 'rain_storm_start_at',
+            'rainfall_daily', 'rainfall_monthly', 'rainfall_year'
+        )
+        record = {k: iss[k] for k in keys}
+        record.update(rain_15_min=iss['rainfall_last_15_min'], rain_60_min=iss['rainfall_last_60_min'], rain_24_hr=iss['rainfall_last_24_hr'])
+        return {"did": self.DeviceId, "ts": int(now), "conditions": [record]}
+
+
+class WeatherLinkSimulator:
+    """
+    Serves `/v1/current_conditions` and `/v1/real_time` for many virtual WeatherLink Live devices from one aiohttp
+    server. Each device is reached at its own loopback address (127.0.x.y, all routed to lo on Linux) and selected
+    by the request's Host header, so clients see distinct hosts:
+
+        async with WeatherLinkSimulator(devices=100) as sim:
+            async with WeatherLinkPoller(sim.Hosts()) as poller:
+                ...
+    """
+
+    def __init__(
+        self,
+        devices: int = 10,
+        port: int = 0,
+        latency: Tuple[float, float] = (0.0, 0.0),
+        error_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        update_interval: float = 10.0,
+        broadcast_address: Tuple[str, int] = ('127.0.0.1', 22222),
+        seed: int = 0
+    ) -> None:
+        """
+        :param devices: Number of virtual devices
+        :param port: TCP port to listen on, 0 for any free port
+        :param latency: Minimum and maximum seconds to delay each response
+        :param error_rate: Fraction of requests answered with HTTP 500
+        :param malformed_rate: Fraction of responses with one malformed condition record
+        :param update_interval: Seconds between sensor updates of each device
+        :param broadcast_address: Where real-time UDP packets are sent while a lease is active
+        :param seed: Seed for device data and fault injection
+        """
+        if devices > 254 * 256:
+            raise ValueError('At most 65024 devices can be given loopback addresses')
+
+        self.Port = port
+        self.Latency = latency
+        self.ErrorRate = error_rate
+        self.MalformedRate = malformed_rate
+        self.BroadcastAddress = broadcast_address
+
+        self.Devices: List[VirtualDevice] = [
+            VirtualDevice(f'001D0A{seed:02X}{i:04X}', seed * 100000 + i, update_interval) for i in range(devices)
+        ]
+        self.Requests = 0
+
+        self._rng = random.Random(seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._leases: Dict[int, float] = {}
+        self._broadcaster: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> WeatherLinkSimulator:
+        await self.Start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.Close()
+
+    def Hosts(self) -> List[str]:
+        """host:port of every virtual device"""
+        return [f'{self._Address(i)}:{self.Port}' for i in range(len(self.Devices))]
+
+    @staticmethod
+    def _Address(index: int) -> str:
+        return f'127.0.{index // 254}.{index % 254 + 1}'
+
+    def _Device(self, request: web.Request) -> Tuple[int, VirtualDevice]:
+        address = request.host.rsplit(':', 1)[0]
+        try:
+            _, _, high, low = (int(p) for p in address.split('.'))
+            index = high * 254 + low - 1
+            return index, self.Devices[index]
+        except (ValueError, IndexError):
+            raise web.HTTPNotFound(text=f'No simulated device at {address}')
+
+    async def _Respond(self) -> None:
+        self.Requests += 1
+        low, high = self.Latency
+        if high > 0:
+            await asyncio.sleep(self._rng.uniform(low, high))
+        if self.ErrorRate and self._rng.random() < self.ErrorRate:
+            raise web.HTTPInternalServerError(text='{"data":null,"error":{"code":500,"message":"simulated failure"}}', content_type='application/json')
+
+    async def _CurrentConditions(self, request: web.Request) -> web.Response:
+        _, device = self._Device(request)
+        await self._Respond()
+
+        data = device.CurrentConditions(time.time())
+        if self.MalformedRate and self._rng.random() < self.MalformedRate:
+            data = json.loads(json.dumps(data))
+            _Malform(self._rng, data['conditions'])
+
+        return web.json_response({"data": data, "error": None})
+
+    async def _RealTime(self, request: web.Request) -> web.Response:
+        index, _ = self._Device(request)
+        await self._Respond()
+
+        duration = int(request.query.get('duration', '1200'))
+        self._leases[index] = time.monotonic() + duration
+        return web.json_response({"data": {"broadcast_port": self.BroadcastAddress[1], "duration": duration}, "error": None})
+
+    async def _Broadcast(self) -> None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        try:
+            while True:
+                now = time.monotonic()
+                for index, expires in list(self._leases.items()):
+                    if expires < now:
+                        del self._leases[index]
+                        continue
+                    packet = json.dumps(self.Devices[index].RealTime(time.time())).encode()
+                    sock.sendto(packet, self.BroadcastAddress)
+                await asyncio.sleep(2.5)
+        finally:
+            sock.close()
+
+    async def Start(self) -> None:
+        app = web.Application()
+        app.router.add_get('/v1/current_conditions', self._CurrentConditions)
+        app.router.add_get('/v1/real_time', self._RealTime)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '0.0.0.0', self.Port, backlog=4096)
+        await site.start()
+
+        if self.Port == 0:
+            self.Port = self._runner.addresses[0][1]
+
+        self._broadcaster = asyncio.create_task(self._Broadcast())
+        _LOGGER.info('Simulating %d devices on port %d', len(self.Devices), self.Port)
+
+    async def Close(self) -> None:
+        if self._broadcaster is not None:
+            self._broadcaster.cancel()
+            await asyncio.gather(self._broadcaster, return_exceptions=True)
+            self._broadcaster = None
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def main() -> None:
+    parser = ArgumentParser(description='Simulate WeatherLink Live devices for testing and load tests.')
+    parser.add_argument('-n', '--devices', type=int, default=10, help='Number of virtual devices')
+    parser.add_argument('-p', '--port', type=int, default=8080, help='TCP port to listen on')
+    parser.add_argument('--latency', type=float, nargs=2, default=(0.0, 0.0), metavar=('MIN', 'MAX'), help='Response delay range in seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help='Fraction of responses with a malformed record')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+
+    async with WeatherLinkSimulator(args.devices, args.port, tuple(args.latency), args.error_rate, args.malformed_rate) as sim:
+        print('\n'.join(sim.Hosts()))
+        await asyncio.Event().wait()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
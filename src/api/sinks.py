@@ -0,0 +1,447 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+import os
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from operator import attrgetter
+from types import TracebackType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type
+)
+
+from .columnar import COLUMNS, Column
+from .decoder import CONDITION_SPECS, StructureType
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class Table:
+    """Flattened conditions of one `data_structure_type` from a batch of reports"""
+
+    Name: str
+    """Name of the regular condition class, e.g. IssCondition"""
+
+    Columns: Tuple[Column, ...]
+    """Columns of each row, from api.columnar.COLUMNS"""
+
+    DeviceIds: List[str]
+    """Device of each row"""
+
+    Timestamps: List[datetime]
+    """Report time of each row"""
+
+    Rows: List[Tuple[Any, ...]]
+    """Values in column order. Wind and slot parts, timestamps and booleans are as in the condition classes,
+    RxState is its integer value, and missing values are None."""
+
+
+def _Getter(column: Column) -> Callable[[Any], Any]:
+    attribute, part = column.Attribute, column.Part
+    if column.Kind == 'rx_state':
+        return lambda c: None if (v := getattr(c, attribute)) is None else v.value
+    if isinstance(part, str):
+        return lambda c: None if (v := getattr(c, attribute)) is None else getattr(v, part)
+    if isinstance(part, int):
+        return lambda c: None if (v := getattr(c, attribute)) is None else v.get(part)
+    return attrgetter(attribute)
+
+
+# Getters read the regular attribute names, which the Compact* classes and lazy views provide too
+_ROW_GETTERS: Dict[int, Tuple[Callable[[Any], Any], ...]] = {
+    structureType: tuple(_Getter(c) for c in columns) for structureType, columns in COLUMNS.items()
+}
+
+def Tabulate(reports: Iterable[WeatherLinkConditionsReport]) -> List[Table]:
+    """
+    Flatten reports into one table per condition type
+
+    :param reports: Reports with any of the condition classes
+    """
+    tables: Dict[int, Table] = {}
+
+    for report in reports:
+        for condition in report.DeviceConditions:
+            structureType = StructureType(type(condition))
+            if structureType is None:
+                continue
+
+            table = tables.get(structureType)
+            if table is None:
+                table = tables[structureType] = Table(
+                    CONDITION_SPECS[structureType].Class.__name__, COLUMNS[structureType], [], [], []
+                )
+            table.DeviceIds.append(report.DeviceId)
+            table.Timestamps.append(report.Timestamp)
+            table.Rows.append(tuple([get(condition) for get in _ROW_GETTERS[structureType]]))
+
+    return list(tables.values())
+
+
+class Sink:
+    """
+    Destination for batches of reports. SinkPipeline calls Write() and Close() from its writer thread, one call at a
+    time, so sinks may block on I/O.
+    """
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        raise NotImplementedError
+
+    def Close(self) -> None:
+        pass
+
+
+def _EscapeTag(value: str) -> str:
+    return value.replace('\\', '\\\\').replace(',', '\\,').replace('=', '\\=').replace(' ', '\\ ')
+
+
+def EncodeLineProtocol(tables: Sequence[Table]) -> bytes:
+    """
+    Encode tables as InfluxDB line protocol with second precision. Each condition class is a measurement,
+    DeviceId and the integer columns (LsId, TxId) are tags, and missing values are left out.
+
+    :param tables: Output of Tabulate()
+    """
+    lines: List[str] = []
+
+    for table in tables:
+        tagColumns = [i for i, c in enumerate(table.Columns) if c.Kind == 'integer']
+        fieldColumns = [(i, c.Name, c.Kind) for i, c in enumerate(table.Columns) if c.Kind != 'integer']
+        measurement = _EscapeTag(table.Name)
+
+        for did, ts, row in zip(table.DeviceIds, table.Timestamps, table.Rows):
+            tags = ''.join(f',{table.Columns[i].Name}={row[i]}' for i in tagColumns if row[i] is not None)
+
+            fields: List[str] = []
+            for i, name, kind in fieldColumns:
+                value = row[i]
+                if value is None:
+                    continue
+                if kind == 'battery':
+                    fields.append(f'{name}={"true" if value else "false"}')
+                elif kind == 'timestamp':
+                    fields.append(f'{name}={int(value.timestamp())}i')
+                elif kind == 'rx_state':
+                    fields.append(f'{name}={value}i')
+                else:
+                    # Always floats: the API sends whole numbers as integers, and InfluxDB rejects a field whose
+                    # type changes between points
+                    fields.append(f'{name}={float(value)!r}')
+
+            if fields:
+                lines.append(f'{measurement},DeviceId={_EscapeTag(did)}{tags} {",".join(fields)} {int(ts.timestamp())}')
+
+    return ''.join(line + '\n' for line in lines).encode()
+
+
+class InfluxLineSink(Sink):
+    """Appends InfluxDB line protocol (second precision) to a file"""
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: File to append to, created if missing
+        """
+        self.Path = path
+        self._file: IO[bytes] = open(path, 'ab')
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        self._file.write(EncodeLineProtocol(tables))
+        self._file.flush()
+
+    def Close(self) -> None:
+        self._file.close()
+
+
+class InfluxHttpSink(Sink):
+    """Posts InfluxDB line protocol to a write endpoint"""
+
+    def __init__(self, url: str, token: Optional[str] = None, timeout: float = 10.0) -> None:
+        """
+        :param url: Write URL including the database or bucket and `precision=s`, e.g.
+            http://influxdb:8086/api/v2/write?org=home&bucket=weather&precision=s
+        :param token: API token sent as `Authorization: Token ...`
+        :param timeout: Request timeout in seconds
+        """
+        self.Url = url
+        self.Token = token
+        self.Timeout = timeout
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        body = EncodeLineProtocol(tables)
+        if not body:
+            return
+
+        import urllib.request
+
+        request = urllib.request.Request(self.Url, data=body, method='POST')
+        request.add_header('Content-Type', 'text/plain; charset=utf-8')
+        if self.Token is not None:
+            request.add_header('Authorization', f'Token {self.Token}')
+
+        with urllib.request.urlopen(request, timeout=self.Timeout) as response:
+            response.read()
+
+
+def _CsvValue(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+class CsvSink(Sink):
+    """Appends rows to one CSV file per condition class, named after the class, in a directory"""
+
+    def __init__(self, directory: str) -> None:
+        """
+        :param directory: Output directory, created if missing. Existing files are appended to.
+        """
+        self.Directory = directory
+        self._files: Dict[str, Tuple[IO[str], Any]] = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        for table in tables:
+            entry = self._files.get(table.Name)
+            if entry is None:
+                f: IO[str] = open(os.path.join(self.Directory, f'{table.Name}.csv'), 'a', newline='')
+                writer = csv.writer(f)
+                if f.tell() == 0:
+                    writer.writerow(['DeviceId', 'Timestamp', *(c.Name for c in table.Columns)])
+                entry = self._files[table.Name] = (f, writer)
+
+            f, writer = entry
+            writer.writerows(
+                [did, ts.isoformat(), *map(_CsvValue, row)]
+                for did, ts, row in zip(table.DeviceIds, table.Timestamps, table.Rows)
+            )
+            f.flush()
+
+    def Close(self) -> None:
+        for f, _ in self._files.values():
+            f.close()
+        self._files.clear()
+
+
+class ParquetSink(Sink):
+    """
+    Writes one Parquet file per condition class and run, named after the class and start time, in a directory.
+    Each batch becomes a row group; files are complete once the sink is closed. Requires pyarrow.
+    """
+
+    def __init__(self, directory: str, compression: str = 'zstd') -> None:
+        """
+        :param directory: Output directory, created if missing
+        :param compression: Parquet compression codec
+        """
+        # Imported here rather than with the module: pyarrow is optional and slow to import
+        try:
+            import pyarrow  # type: ignore[import-not-found, import-untyped, unused-ignore]
+            import pyarrow.parquet  # type: ignore[import-not-found, import-untyped, unused-ignore]
+        except ImportError:  # pragma: no cover - pyarrow is optional
+            raise ImportError('ParquetSink requires pyarrow, use CsvSink instead') from None
+        self._pyarrow = pyarrow
+
+        self.Directory = directory
+        self.Compression = compression
+        self._started = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        self._writers: Dict[str, Any] = {}
+
+        os.makedirs(directory, exist_ok=True)
+
+    def _Type(self, kind: str) -> Any:
+        pyarrow = self._pyarrow
+        return {
+            'value': pyarrow.float64(),
+            'integer': pyarrow.int64(),
+            'rain': pyarrow.float64(),
+            'timestamp': pyarrow.timestamp('s', tz='UTC'),
+            'rx_state': pyarrow.int8(),
+            'battery': pyarrow.bool_()
+        }[kind]
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        pyarrow = self._pyarrow
+        for table in tables:
+            schema = pyarrow.schema([
+                ('DeviceId', pyarrow.string()),
+                ('Timestamp', pyarrow.timestamp('s', tz='UTC')),
+                *((c.Name, self._Type(c.Kind)) for c in table.Columns)
+            ])
+            columns = [table.DeviceIds, table.Timestamps, *map(list, zip(*table.Rows))]
+            batch = pyarrow.Table.from_arrays(
+                [pyarrow.array(values, type=f.type) for values, f in zip(columns, schema)], schema=schema
+            )
+
+            writer = self._writers.get(table.Name)
+            if writer is None:
+                path = os.path.join(self.Directory, f'{table.Name}-{self._started}.parquet')
+                writer = self._writers[table.Name] = pyarrow.parquet.ParquetWriter(path, schema, compression=self.Compression)
+            writer.write_table(batch)
+
+    def Close(self) -> None:
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+
+class SinkPipeline:
+    """
+    Batches reports and hands them to sinks on a background thread, so flattening, encoding and I/O never run on
+    the event loop. A batch is written once it reaches `batch_size` reports or its first report is `flush_interval`
+    seconds old. Put() waits while `queue_size` reports are pending, which slows a WeatherLinkPoller feeding it:
+
+        async with SinkPipeline([CsvSink('out')]) as pipeline:
+            async for report in poller:
+                await pipeline.Put(report)
+
+    A sink that raises is logged and the batch is still offered to the other sinks. If the pipeline itself fails,
+    Put() raises RuntimeError from then on and Close() raises the error.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[Sink],
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+        queue_size: Optional[int] = None
+    ) -> None:
+        """
+        :param sinks: Destinations for every batch
+        :param batch_size: Reports per batch
+        :param flush_interval: Longest time in seconds a report waits for its batch to fill
+        :param queue_size: Reports waiting to be written before Put() blocks, default twice `batch_size`
+        """
+        self.Sinks: List[Sink] = list(sinks)
+        self.BatchSize = batch_size
+        self.FlushInterval = flush_interval
+
+        self.Written = 0
+        """Reports handed to the sinks"""
+
+        self.Failures = 0
+        """Sink writes that raised"""
+
+        self._queue: asyncio.Queue[Optional[WeatherLinkConditionsReport]] = asyncio.Queue(maxsize=queue_size or batch_size * 2)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> SinkPipeline:
+        await self.Start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType]
+    ) -> None:
+        await self.Close()
+
+    async def Start(self) -> None:
+        """Start the batching task and writer thread."""
+        if self._task is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sinks')
+        self._task = asyncio.create_task(self._Run(), name='sink pipeline')
+
+    async def Put(self, report: WeatherLinkConditionsReport) -> None:
+        """Queue a report for writing, waiting while the queue is full"""
+        task = self._task
+        if task is None or task.done() or not await self._Enqueue(task, report):
+            error = task.exception() if task is not None and task.done() and not task.cancelled() else None
+            raise RuntimeError('SinkPipeline is not running') from error
+
+    async def Close(self) -> None:
+        """Write everything queued, then close the sinks. Raises the error that stopped the pipeline, if any."""
+        if self._task is None or self._executor is None:
+            return
+
+        task = self._task
+        self._task = None
+        try:
+            await self._Enqueue(task, None)
+            await task
+        finally:
+            loop = asyncio.get_running_loop()
+            for sink in self.Sinks:
+                try:
+                    await loop.run_in_executor(self._executor, sink.Close)
+                except Exception:
+                    _LOGGER.exception('Closing %s failed', type(sink).__name__)
+
+            self._executor.shutdown()
+            self._executor = None
+
+    async def _Enqueue(self, task: asyncio.Task[None], item: Optional[WeatherLinkConditionsReport]) -> bool:
+        # Wait for room in the queue, but give up if the batching task has stopped, since nothing would ever take
+        # from the queue again
+        if task.done():
+            return False
+        if not self._queue.full():
+            self._queue.put_nowait(item)
+            return True
+
+        put = asyncio.ensure_future(self._queue.put(item))
+        try:
+            await asyncio.wait((put, task), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+        return put.done() and not put.cancelled()
+
+    async def _Run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+
+            batch = [first]
+            deadline = loop.time() + self.FlushInterval
+            while len(batch) < self.BatchSize:
+                if self._queue.empty():
+                    try:
+                        report = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    report = self._queue.get_nowait()
+
+                if report is None:
+                    stopping = True
+                    break
+                batch.append(report)
+
+            await loop.run_in_executor(self._executor, self._Write, batch)
+
+    def _Write(self, batch: List[WeatherLinkConditionsReport]) -> None:
+        tables = Tabulate(batch)
+        for sink in self.Sinks:
+            try:
+                sink.Write(tables)
+            except Exception:
+                self.Failures += 1
+                _LOGGER.exception('Writing %d report(s) to %s failed', len(batch), type(sink).__name__)
+        self.Written += len(batch)
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import bisect
+import math
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import (
+    AsyncIterable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+from .sinks import Tabulate
+from .weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+RESOLUTIONS: Tuple[int, ...] = (0, 60, 600)
+"""Seconds covered by one point of each tier: raw samples, then 1 minute and 10 minute buckets"""
+
+_NAN = math.nan
+_INF = math.inf
+
+# Raw samples, and the per-metric (count, total, minimum, maximum) that buckets are built from
+_StatsT = Tuple[List[int], List[float], List[float], List[float]]
+
+
+@dataclass(frozen=True)
+class Point:
+    """One sample, or a summary of the samples in one bucket"""
+
+    Timestamp: datetime
+    """Report time, or the start of the bucket"""
+
+    Value: float
+    """Reported value, or the mean over the bucket"""
+
+    Min: float
+    """Smallest value covered"""
+
+    Max: float
+    """Largest value covered"""
+
+    Count: int
+    """Number of raw samples covered"""
+
+
+class _Ring:
+    """Fixed-capacity ring buffer over an array, indexed oldest first so bisect can search it"""
+
+    __slots__ = ('_items', '_start', '_size')
+
+    def __init__(self, typecode: str, capacity: int) -> None:
+        self._items: array[float] = array(typecode, bytes(array(typecode).itemsize * capacity))
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return self._items[(self._start + index) % len(self._items)]
+
+    def Append(self, value: float) -> None:
+        capacity = len(self._items)
+        if self._size < capacity:
+            self._items[(self._start + self._size) % capacity] = value
+            self._size += 1
+        else:
+            self._items[self._start] = value
+            self._start = (self._start + 1) % capacity
+
+
+class _Buckets:
+    """Fixed-width buckets of one series: completed buckets in rings, plus the bucket still being filled"""
+
+    def __init__(self, width: int, capacity: int, metrics: int) -> None:
+        self.Width = width
+        self.Starts = _Ring('d', capacity)
+        self.Counts = [_Ring('I', capacity) for _ in range(metrics)]
+        self.Means = [_Ring('d', capacity) for _ in range(metrics)]
+        self.Minimums = [_Ring('d', capacity) for _ in range(metrics)]
+        self.Maximums = [_Ring('d', capacity) for _ in range(metrics)]
+
+        self._start: Optional[float] = None
+        self._stats: _StatsT = ([0] * metrics, [0.0] * metrics, [_INF] * metrics, [-_INF] * metrics)
+
+    def Oldest(self) -> Optional[float]:
+        return self.Starts[0] if len(self.Starts) else self._start
+
+    def Add(self, timestamp: float, stats: _StatsT) -> Optional[Tuple[float, _StatsT]]:
+        """
+        Fold samples into the bucket containing timestamp
+
+        :return: Start and stats of the previous bucket, if timestamp begins a new one
+        """
+        start = timestamp - timestamp % self.Width
+        completed = None
+        if start != self._start:
+            if self._start is not None:
+                completed = (self._start, self._stats)
+                self._Store(self._start, self._stats)
+            n = len(self.Counts)
+            self._start = start
+            self._stats = ([0] * n, [0.0] * n, [_INF] * n, [-_INF] * n)
+
+        counts, totals, minimums, maximums = self._stats
+        for i, (count, total, minimum, maximum) in enumerate(zip(*stats)):
+            if count:
+                counts[i] += count
+                totals[i] += total
+                if minimum < minimums[i]:
+                    minimums[i] = minimum
+                if maximum > maximums[i]:
+                    maximums[i] = maximum
+
+        return completed
+
+    def _Store(self, start: float, stats: _StatsT) -> None:
+        self.Starts.Append(start)
+        for i, (count, total, minimum, maximum) in enumerate(zip(*stats)):
+            self.Counts[i].Append(count)
+            self.Means[i].Append(total / count if count else _NAN)
+            self.Minimums[i].Append(minimum if count else _NAN)
+            self.Maximums[i].Append(maximum if count else _NAN)
+
+    def Points(self, metric: int, start: float, end: float) -> List[Point]:
+        lo = bisect.bisect_left(self.Starts, start)
+        hi = bisect.bisect_right(self.Starts, end)
+        counts, means, minimums, maximums = self.Counts[metric], self.Means[metric], self.Minimums[metric], self.Maximums[metric]
+        points = [
+            Point(_Datetime(self.Starts[i]), means[i], minimums[i], maximums[i], int(counts[i]))
+            for i in range(lo, hi) if counts[i]
+        ]
+
+        # The bucket being filled holds the most recent samples at this resolution
+        if self._start is not None and start <= self._start <= end:
+            count = self._stats[0][metric]
+            if count:
+                points.append(Point(
+                    _Datetime(self._start), self._stats[1][metric] / count, self._stats[2][metric], self._stats[3][metric], count
+                ))
+
+        return points
+
+
+class _Series:
+    """Raw samples and downsampled tiers of every metric of one sensor"""
+
+    def __init__(self, metrics: Tuple[str, ...], capacities: Sequence[int]) -> None:
+        self.Metrics = metrics
+        self.Index = {name: i for i, name in enumerate(metrics)}
+        self.Timestamps = _Ring('d', capacities[0])
+        self.Values = [_Ring('d', capacities[0]) for _ in metrics]
+        self.Tiers = [_Buckets(width, capacity, len(metrics)) for width, capacity in zip(RESOLUTIONS[1:], capacities[1:])]
+
+    def Add(self, timestamp: float, values: Sequence[Optional[float]]) -> bool:
+        # Repeated reports (e.g. from the poller's cache) and late arrivals would break the ordered index
+        if len(self.Timestamps) and timestamp <= self.Timestamps[-1]:
+            return False
+
+        self.Timestamps.Append(timestamp)
+        stats: _StatsT = ([], [], [], [])
+        for ring, value in zip(self.Values, values):
+            value = _NAN if value is None else float(value)
+            ring.Append(value)
+            missing = value != value
+            stats[0].append(0 if missing else 1)
+            stats[1].append(0.0 if missing else value)
+            stats[2].append(value)
+            stats[3].append(value)
+
+        carry: Optional[Tuple[float, _StatsT]] = (timestamp, stats)
+        for tier in self.Tiers:
+            if carry is None:
+                break
+            carry = tier.Add(*carry)
+
+        return True
+
+    def Points(self, metric: int, start: float, end: float) -> List[Point]:
+        lo = bisect.bisect_left(self.Timestamps, start)
+        hi = bisect.bisect_right(self.Timestamps, end)
+        values = self.Values[metric]
+        return [
+            Point(_Datetime(self.Timestamps[i]), v, v, v, 1)
+            for i in range(lo, hi) if (v := values[i]) == v
+        ]
+
+
+def _Datetime(timestamp: float) -> datetime:
+    return datetime.fromtimestamp(timestamp, timezone.utc)
+
+
+def _Seconds(value: datetime | float | None, default: float) -> float:
+    if value is None:
+        return default
+    return value.timestamp() if isinstance(value, datetime) else float(value)
+
+
+class TimeSeriesStore:
+    """
+    Bounded in-memory history of every numeric condition attribute, kept per (DeviceId, LsId). Each metric has a
+    ring of raw samples plus rings of 1 minute and 10 minute buckets that are filled as samples arrive, so memory
+    is fixed by the capacities while older history remains available at lower resolution:
+
+        store = TimeSeriesStore()
+        async with WeatherLinkPoller(hosts) as poller:
+            asyncio.create_task(store.Consume(poller))
+            ...
+            points = await store.Range(did, lsid, 'Temperature', start)
+
+    Metric names are the column names of api.columnar, e.g. Temperature, WindLastSpeed or SoilTemperatures1. Means of
+    wind directions are arithmetic, not circular as in api.aggregation.
+    """
+
+    def __init__(
+        self,
+        raw_capacity: int = 360,
+        minute_capacity: int = 360,
+        ten_minute_capacity: int = 432,
+        metrics: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        :param raw_capacity: Raw samples kept per sensor, an hour at the default 10 second poll interval
+        :param minute_capacity: 1 minute buckets kept per sensor, six hours by default
+        :param ten_minute_capacity: 10 minute buckets kept per sensor, three days by default
+        :param metrics: Names of the only metrics to keep, or None for all of them
+        """
+        self.Capacities: Tuple[int, ...] = (raw_capacity, minute_capacity, ten_minute_capacity)
+        self.Only = frozenset(metrics) if metrics is not None else None
+
+        self.Series: Dict[Tuple[str, int], _Series] = {}
+        """Stored series by (DeviceId, LsId)"""
+
+        self.Samples = 0
+        """Samples stored, counting each sensor of a report once"""
+
+    def Add(self, report: WeatherLinkConditionsReport) -> int:
+        """
+        Store the conditions of a report
+
+        :param report: Report with any of the condition classes
+        :return: Number of sensors stored; reports no newer than a sensor's last are ignored for it
+        """
+        timestamp = report.Timestamp.timestamp()
+        added = 0
+
+        for table in Tabulate([report]):
+            lsIdColumn = next(i for i, c in enumerate(table.Columns) if c.Name == 'LsId')
+            columns = [
+                (i, c.Name) for i, c in enumerate(table.Columns)
+                if c.Kind in ('value', 'rain') and (self.Only is None or c.Name in self.Only)
+            ]
+            for row in table.Rows:
+                key = (report.DeviceId, row[lsIdColumn])
+                series = self.Series.get(key)
+                if series is None:
+                    series = self.Series[key] = _Series(tuple(name for _, name in columns), self.Capacities)
+                if series.Add(timestamp, [row[i] for i, _ in columns]):
+                    added += 1
+
+        self.Samples += added
+        return added
+
+    async def Consume(self, reports: AsyncIterable[WeatherLinkConditionsReport]) -> None:
+        """
+        Store every report from a WeatherLinkPoller, ShardedCollector or other async iterator until it ends
+
+        :param reports: Source of reports
+        """
+        async for report in reports:
+            self.Add(report)
+
+    def Metrics(self, device_id: str, ls_id: int) -> Tuple[str, ...]:
+        """Names of the metrics stored for a sensor, empty if it has not reported"""
+        series = self.Series.get((device_id, ls_id))
+        return series.Metrics if series is not None else ()
+
+    def _Metric(self, device_id: str, ls_id: int, metric: str) -> Tuple[Optional[_Series], int]:
+        series = self.Series.get((device_id, ls_id))
+        if series is None:
+            return None, -1
+        index = series.Index.get(metric)
+        if index is None:
+            raise KeyError(f'{metric} is not stored for {device_id}/{ls_id}')
+        return series, index
+
+    async def Latest(self, device_id: str, ls_id: int, metric: str) -> Optional[Point]:
+        """
+        Most recent reported value of a metric
+
+        :param device_id: WeatherLink device Id
+        :param ls_id: Logical sensor Id
+        :param metric: Metric name
+        :return: Latest raw sample, or None if the sensor has not reported a value in the raw history
+        """
+        series, index = self._Metric(device_id, ls_id, metric)
+        if series is None:
+            return None
+
+        values = series.Values[index]
+        for i in range(len(values) - 1, -1, -1):
+            value = values[i]
+            if value == value:
+                return Point(_Datetime(series.Timestamps[i]), value, value, value, 1)
+        return None
+
+    async def Range(
+        self,
+        device_id: str,
+        ls_id: int,
+        metric: str,
+        start: datetime | float,
+        end: datetime | float | None = None,
+        resolution: Optional[int] = None
+    ) -> List[Point]:
+        """
+        Values of a metric between two times, oldest first
+
+        :param device_id: WeatherLink device Id
+        :param ls_id: Logical sensor Id
+        :param metric: Metric name
+        :param start: First time included, as a datetime or UNIX seconds
+        :param end: Last time included, or None for everything since start
+        :param resolution: Seconds per point, one of RESOLUTIONS, or None for the finest tier that still reaches back
+            to start
+        """
+        series, index = self._Metric(device_id, ls_id, metric)
+        if series is None:
+            return []
+
+        startSeconds = _Seconds(start, -_INF)
+        endSeconds = _Seconds(end, _INF)
+        if resolution is None:
+            resolution = RESOLUTIONS[-1]
+            if len(series.Timestamps) and series.Timestamps[0] <= startSeconds:
+                resolution = RESOLUTIONS[0]
+            else:
+                for tier in series.Tiers:
+                    oldest = tier.Oldest()
+                    if oldest is not None and oldest <= startSeconds:
+                        resolution = tier.Width
+                        break
+
+        if resolution == RESOLUTIONS[0]:
+            return series.Points(index, startSeconds, endSeconds)
+        for tier in series.Tiers:
+            if tier.Width == resolution:
+                # Buckets are found by their start, so include the one that start falls in
+                return tier.Points(index, startSeconds - startSeconds % tier.Width, endSeconds)
+        raise ValueError(f'Unknown resolution {resolution}, expected one of {RESOLUTIONS}')
+
+    async def Aggregate(
+        self,
+        device_id: str,
+        ls_id: int,
+        metric: str,
+        start: datetime | float,
+        end: datetime | float | None = None,
+        resolution: Optional[int] = None
+    ) -> Optional[Point]:
+        """
+        Summary of a metric between two times, from the same points as Range()
+
+        :return: Point with the first point's time, the sample-weighted mean, the extremes and the sample count, or
+            None if there are no values in the range
+        """
+        points = await self.Range(device_id, ls_id, metric, start, end, resolution)
+        if not points:
+            return None
+
+        count = sum(p.Count for p in points)
+        return Point(
+            points[0].Timestamp,
+            sum(p.Value * p.Count for p in points) / count,
+            min(p.Min for p in points),
+            max(p.Max for p in points),
+            count
+        )
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import (
+    Dict,
+    Optional,
+    Tuple
+)
+
+from .device_condition_reports.iss import RAIN_INCHES_PER_COUNT
+
+
+class UnitSystem(Enum):
+    Imperial = 'imperial'
+    """Units the API reports in: °F, mph, inches of mercury, and rain in inches"""
+
+    Metric = 'metric'
+    """°C, m/s, hPa, and rain in millimetres"""
+
+    Raw = 'raw'
+    """Values exactly as the API reports them, with rain left as collector counts"""
+
+
+ConversionT = Tuple[float, float]
+"""(scale, offset) applied as `value * scale + offset`"""
+
+CONVERSIONS: Dict[UnitSystem, Dict[str, ConversionT]] = {
+    UnitSystem.Imperial: {},
+    UnitSystem.Metric: {
+        'temperature': (5.0 / 9.0, -32.0 * 5.0 / 9.0),
+        'speed': (0.44704, 0.0),
+        'pressure': (33.8638866667, 0.0)
+    },
+    UnitSystem.Raw: {}
+}
+"""Conversion from the API's units for each quantity; quantities not listed are left unchanged"""
+
+RAIN_FACTORS: Dict[UnitSystem, Dict[int, float]] = {
+    UnitSystem.Imperial: RAIN_INCHES_PER_COUNT,
+    # Exact collector sizes rather than the imperial factors converted back, so metric collectors read exactly
+    UnitSystem.Metric: {1: 0.254, 2: 0.2, 3: 0.1, 4: 0.0254},
+    UnitSystem.Raw: {1: 1.0, 2: 1.0, 3: 1.0, 4: 1.0}
+}
+"""Rain per collector count for each `rain_size`, applied to rain totals (counts) and rates (counts/hour)"""
+
+QUANTITIES: Dict[str, str] = {
+    **dict.fromkeys((
+        'Temperature',
+        'DewPoint',
+        'WetBulb',
+        'HeatIndex',
+        'WindChill',
+        'THWIndex',
+        'THSWIndex',
+        'SoilTemperatures',
+        'SoilTemperatureSlots'
+    ), 'temperature'),
+    **dict.fromkeys((
+        'WindLastSpeed',
+        'Wind1MinAverageSpeed',
+        'Wind2MinAverageSpeed',
+        'Wind2MinGustSpeed',
+        'Wind10MinAverageSpeed',
+        'Wind10MinGustSpeed'
+    ), 'speed'),
+    **dict.fromkeys((
+        'Pressure',
+        'SeaLevelPressure',
+        'ThreeHourPressureTrend'
+    ), 'pressure')
+}
+"""Physical quantity of each attribute that has units other than rain. Wind speeds use the flattened names of
+the Compact* classes and columnar output (WindLastSpeed), and slot attributes cover every slot."""
+
+
+def Conversion(name: str, units: UnitSystem) -> Optional[ConversionT]:
+    """
+    Conversion for an attribute or column, or None if its values are used unchanged
+
+    :param name: Attribute or column name, e.g. Temperature or WindLastSpeed
+    :param units: Target unit system
+    """
+    quantity = QUANTITIES.get(name)
+    return CONVERSIONS[units].get(quantity) if quantity is not None else None
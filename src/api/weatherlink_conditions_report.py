@@ -1,25 +1,121 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     List,
+    Optional,
     Type,
     Union
 )
 
-from .device_condition_reports import *
+from . import device_condition_reports
 from .from_json import FromJson
 
+if TYPE_CHECKING:
+    from .device_condition_reports import (
+        CompactIssCondition,
+        CompactLeafSoilMoistureCondition,
+        CompactLssBarometerCondition,
+        CompactLssTempHumidityCondition,
+        IssCondition,
+        LeafSoilMoistureCondition,
+        LssBarometerCondition,
+        LssTempHumidityCondition
+    )
+
+# Forward references keep the condition models out of this module's imports; they load when first used
 DeviceConditionT = Union[
-    IssCondition, 
-    LeafSoilMoistureCondition, 
-    LssBarometerCondition, 
-    LssTempHumidityCondition
+    'IssCondition',
+    'LeafSoilMoistureCondition',
+    'LssBarometerCondition',
+    'LssTempHumidityCondition',
+    'CompactIssCondition',
+    'CompactLeafSoilMoistureCondition',
+    'CompactLssBarometerCondition',
+    'CompactLssTempHumidityCondition'
 ]
 
+_DATA_STRUCTURE_TYPE_MAPPING: Dict[int, str] = {
+    1: 'IssCondition',
+    2: 'LeafSoilMoistureCondition',
+    3: 'LssBarometerCondition',
+    4: 'LssTempHumidityCondition'
+}
+
+RECORD_ERRORS = (KeyError, TypeError, ValueError)
+"""Exceptions raised by malformed condition records, which tolerant decoding isolates to the record"""
+
+
+@dataclass(frozen=True)
+class RecordError:
+    """A condition record left out of a report because it could not be decoded, or kept with some values missing"""
+
+    Index: int
+    """Position of the record in the `conditions` list"""
+
+    LsId: Optional[int]
+    """Logical sensor Id of the record, if it has one"""
+
+    DataStructureType: Optional[int]
+    """`data_structure_type` of the record, if it has one"""
+
+    Error: str
+    """Exception type name, e.g. KeyError"""
+
+    Message: str
+    """Exception message"""
+
+    Kept: bool = False
+    """Whether the record is still in the report, with the values that couldn't be decoded set to None"""
+
+    @classmethod
+    def FromException(cls: Type[RecordError], index: int, obj: Any, error: BaseException) -> RecordError:
+        """
+        Describe a record that failed to decode
+
+        :param index: Position of the record in the `conditions` list
+        :param obj: The record, which may not even be a dict
+        :param error: Exception raised while decoding it
+        """
+        isDict = isinstance(obj, dict)
+        return cls(
+            Index=index,
+            LsId=obj.get('lsid') if isDict else None,
+            DataStructureType=obj.get('data_structure_type') if isDict else None,
+            Error=type(error).__name__,
+            Message=str(error)
+        )
+
+    @classmethod
+    def UnknownRainSize(cls: Type[RecordError], index: int, obj: Dict[str, Any]) -> Optional[RecordError]:
+        """
+        Describe a decoded record whose rain collector is unknown, such as the reserved `rain_size` 0, so its rain
+        fields were left as None. Records without rain fields, or from a known collector, give None.
+
+        :param index: Position of the record in the `conditions` list
+        :param obj: The record
+        """
+        if 'rain_size' not in obj:
+            return None
+
+        from .device_condition_reports.iss import RAIN_INCHES_PER_COUNT
+
+        rainSize = obj['rain_size']
+        if rainSize in RAIN_INCHES_PER_COUNT:
+            return None
+        return cls(
+            Index=index,
+            LsId=obj.get('lsid'),
+            DataStructureType=obj.get('data_structure_type'),
+            Error='ValueError',
+            Message=f'Unknown rain cup size found: {rainSize}; rain values left empty',
+            Kept=True
+        )
+
 
 @dataclass
 class WeatherLinkConditionsReport(FromJson):
@@ -37,29 +133,55 @@ class WeatherLinkConditionsReport(FromJson):
     DeviceConditions: List[DeviceConditionT]
     """Individual conditions reports from devices registered with parent device."""
 
+    Errors: List[RecordError] = field(default_factory=list)
+    """
+    Condition records that could not be decoded and were left out, which only happens when decoded tolerantly, and
+    records kept with rain values left empty because their rain collector is unknown
+    """
+
     @classmethod
-    def FromJson(cls: Type[WeatherLinkConditionsReport], obj: Dict[str, Any]) -> WeatherLinkConditionsReport:
+    def FromJson(
+        cls: Type[WeatherLinkConditionsReport],
+        obj: Dict[str, Any],
+        tolerant: bool = False
+    ) -> WeatherLinkConditionsReport:
         """
         Create object from source API JSON
 
         :param obj: Python dictionary with key-value pairs, often returned from json.load()
+        :param tolerant: Leave out malformed condition records and list them in Errors, instead of raising
         """
         _deviceId = obj['did']
         _timestamp = datetime.fromtimestamp(obj['ts'], timezone.utc)
 
         _conditions: List[DeviceConditionT] = []
+        _errors: List[RecordError] = []
 
-        for c in obj['conditions']:
-            data_structure_type_mapping: Dict[int, Type[DeviceConditionT]] = {
-                1: IssCondition,
-                2: LeafSoilMoistureCondition,
-                3: LssBarometerCondition,
-                4: LssTempHumidityCondition
-            }
-            _conditions.append(data_structure_type_mapping[c['data_structure_type']].FromJson(c))
+        for i, c in enumerate(obj['conditions']):
+            try:
+                conditionName = _DATA_STRUCTURE_TYPE_MAPPING.get(c['data_structure_type'])
+                if conditionName is None:
+                    continue
+                _conditions.append(getattr(device_condition_reports, conditionName).FromJson(c))
+                rainError = RecordError.UnknownRainSize(i, c)
+                if rainError is not None:
+                    _errors.append(rainError)
+            except RECORD_ERRORS as e:
+                if not tolerant:
+                    raise
+                _errors.append(RecordError.FromException(i, c, e))
 
         return WeatherLinkConditionsReport(
             DeviceId=_deviceId,
             Timestamp=_timestamp,
-            DeviceConditions=_conditions
+            DeviceConditions=_conditions,
+            Errors=_errors
         )
+
+    @property
+    def ErrorCounts(self) -> Dict[str, int]:
+        """Number of records left out, by exception type name"""
+        counts: Dict[str, int] = {}
+        for error in self.Errors:
+            counts[error.Error] = counts.get(error.Error, 0) + 1
+        return counts
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import (
+    Any,
+    Dict,
+    List,
+    Type
+)
+
+from .device_condition_reports import IssRealTimeCondition
+from .from_json import FromJson
+
+
+@dataclass
+class WeatherLinkRealTimeReport(FromJson):
+    """
+    Real-time UDP broadcast from a WeatherLink Live device. Only ISS wind and rain conditions are broadcast.
+    """
+
+    DeviceId: str
+    """WeatherLink Device Id"""
+
+    Timestamp: datetime
+    """Timestamp of broadcast"""
+
+    DeviceConditions: List[IssRealTimeCondition]
+    """Wind and rain updates for each ISS registered with the device."""
+
+    @classmethod
+    def FromJson(cls: Type[WeatherLinkRealTimeReport], obj: Dict[str, Any]) -> WeatherLinkRealTimeReport:
+        """
+        Create object from a decoded UDP broadcast packet
+
+        :param obj: Python dictionary with key-value pairs, often returned from json.loads()
+        """
+        return WeatherLinkRealTimeReport(
+            DeviceId=obj['did'],
+            Timestamp=datetime.fromtimestamp(obj['ts'], timezone.utc),
+            DeviceConditions=[
+                IssRealTimeCondition.FromJson(c) for c in obj['conditions'] if c['data_structure_type'] == 1
+            ]
+        )
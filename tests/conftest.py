@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The library is imported as `api` from src/, as the command line tool and benchmarks do
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
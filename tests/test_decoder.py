@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import random
+
+from typing import Any, Callable, Dict
+
+import pytest
+
+from api.decoder import DecodeReport
+from api.lazy import DecodeLazyReport
+from api.simulator import IssRecord, MoistureRecord
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+TS = 1700000000
+
+DECODERS: Dict[str, Callable[..., WeatherLinkConditionsReport]] = {
+    'FromJson': WeatherLinkConditionsReport.FromJson,
+    'DecodeReport': DecodeReport,
+    'DecodeLazyReport': DecodeLazyReport
+}
+
+
+def _Payload(rain_size: int) -> Dict[str, Any]:
+    rng = random.Random(1)
+    iss = IssRecord(rng, lsid=10, txid=1, t=TS, rain_size=rain_size)
+    iss.update(rainfall_daily=12, rain_storm_last=30)
+    return {'did': '001D0A700002', 'ts': TS, 'conditions': [MoistureRecord(rng, lsid=11, txid=2, t=TS), iss]}
+
+
+@pytest.mark.parametrize('decode', DECODERS.values(), ids=DECODERS.keys())
+@pytest.mark.parametrize('tolerant', [False, True])
+def test_unknown_rain_size_keeps_record(decode: Callable[..., WeatherLinkConditionsReport], tolerant: bool) -> None:
+    # rain_size 0 is "Reserved" in the API but is sent with counts; the record is kept without its rain values
+    report = decode(_Payload(rain_size=0), tolerant=tolerant)
+
+    moisture, iss = report.DeviceConditions
+    assert iss.Temperature is not None
+    assert iss.RainDaily is None and iss.RainStormLastTotal is None and iss.RainRate is None
+
+    [error] = report.Errors
+    assert error.Kept
+    assert (error.Index, error.LsId, error.DataStructureType, error.Error) == (1, 10, 1, 'ValueError')
+    assert 'rain cup size' in error.Message
+
+
+@pytest.mark.parametrize('decode', DECODERS.values(), ids=DECODERS.keys())
+def test_known_rain_size_converts(decode: Callable[..., WeatherLinkConditionsReport]) -> None:
+    report = decode(_Payload(rain_size=4))
+
+    assert report.Errors == []
+    assert report.DeviceConditions[1].RainDaily == pytest.approx(0.012)
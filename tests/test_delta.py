@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+
+from typing import List
+
+from api.decoder import DecodeReport
+from api.delta import ConditionDiffer, ConditionReconstructor, DeltaFromDict, DeltaToDict
+from api.serialization import ReportToDict
+from api.simulator import VirtualDevice
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+TS = 1700000000
+
+
+def _Reports(count: int, devices: int = 1) -> List[WeatherLinkConditionsReport]:
+    fleet = [VirtualDevice(DeviceId=f'001D0A7{i:05X}', Seed=i + 1) for i in range(devices)]
+    return [DecodeReport(device.CurrentConditions(TS + 10 * i)) for i in range(count) for device in fleet]
+
+
+def _Ratio(reports: List[WeatherLinkConditionsReport], differ: ConditionDiffer) -> float:
+    full = sum(len(json.dumps(ReportToDict(r))) for r in reports)
+    deltas = sum(len(json.dumps(DeltaToDict(d))) for r in reports for d in differ.Diff(r))
+    return full / deltas
+
+
+def test_delta_round_trips_through_json() -> None:
+    differ = ConditionDiffer(keyframe_interval=5)
+    reconstructor = ConditionReconstructor()
+
+    for report in _Reports(12):
+        for delta in differ.Diff(report):
+            obj = json.loads(json.dumps(DeltaToDict(delta)))
+            assert DeltaFromDict(obj) == delta
+            reconstructor.Apply(DeltaFromDict(obj))
+
+        for condition in report.DeviceConditions:
+            assert reconstructor.Latest(report.DeviceId, condition.LsId) == condition
+
+
+def test_keyframe_every_interval_reports() -> None:
+    differ = ConditionDiffer(keyframe_interval=3)
+    report = _Reports(1)[0]
+    lsid = report.DeviceConditions[0].LsId
+
+    # The same report over and over changes nothing, but every third one still carries a keyframe
+    keyframes = [[d.Keyframe for d in differ.Diff(report) if d.LsId == lsid] for _ in range(7)]
+    assert keyframes == [[True], [], [], [True], [], [], [True]]
+
+
+def test_delta_bandwidth() -> None:
+    # An hour of updates from a few stations; wind changes on almost every update, so exact deltas save less
+    reports = _Reports(360, devices=3)
+    assert _Ratio(reports, ConditionDiffer(keyframe_interval=60)) >= 2.5
+    assert _Ratio(reports, ConditionDiffer(keyframe_interval=60, default_epsilon=0.5)) >= 5.0
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import asyncio
+
+from typing import List
+
+from api.collector import ShardedCollector
+from api.poller import WeatherLinkPoller
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+async def _Consume(source: WeatherLinkPoller | ShardedCollector, received: List[WeatherLinkConditionsReport]) -> None:
+    async for report in source:
+        received.append(report)
+
+
+def test_poller_iteration_ends_on_close() -> None:
+    async def _Run() -> None:
+        # Nothing is polled within the test, so the consumer is left waiting on an empty queue
+        poller = WeatherLinkPoller(['127.0.0.1:9'], interval=3600)
+        await poller.Start()
+        received: List[WeatherLinkConditionsReport] = []
+        consumer = asyncio.create_task(_Consume(poller, received))
+        await asyncio.sleep(0.1)
+
+        await poller.Close()
+        await asyncio.wait_for(consumer, 5)
+        assert received == []
+
+        # A restarted poller can be iterated again
+        await poller.Start()
+        consumer = asyncio.create_task(_Consume(poller, received))
+        await asyncio.sleep(0.1)
+        assert not consumer.done()
+        await poller.Close()
+        await asyncio.wait_for(consumer, 5)
+
+    asyncio.run(_Run())
+
+
+def test_collector_iteration_ends_on_close() -> None:
+    async def _Run() -> None:
+        collector = ShardedCollector(['127.0.0.1:9'], workers=1, interval=3600)
+        await collector.Start()
+        received: List[WeatherLinkConditionsReport] = []
+        consumer = asyncio.create_task(_Consume(collector, received))
+        await asyncio.sleep(0.1)
+
+        await collector.Close()
+        await asyncio.wait_for(consumer, 5)
+        assert received == []
+
+    asyncio.run(_Run())
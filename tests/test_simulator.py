@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from api.simulator import VirtualDevice
+
+
+TS = 1700000000
+
+
+def _Iss(updates: int, start: int = TS) -> List[Dict[str, Any]]:
+    device = VirtualDevice(DeviceId='001D0A700002', Seed=3)
+    return [device.CurrentConditions(start + 10 * i)['conditions'][0] for i in range(updates)]
+
+
+def test_rain_counters_only_grow_within_a_day() -> None:
+    # Starts an hour before midnight UTC so the daily counter rolls over
+    start = TS - TS % 86400 + 82800
+    records = _Iss(2000, start)
+
+    for previous, record in zip(records, records[1:]):
+        if record['rainfall_daily'] < previous['rainfall_daily']:
+            assert record['rainfall_daily'] == 0
+        assert record['rainfall_monthly'] >= previous['rainfall_monthly']
+        assert record['rainfall_year'] >= previous['rainfall_year']
+        assert record['rain_storm_last_start_at'] == previous['rain_storm_last_start_at']
+        assert record['rain_storm_last_end_at'] == previous['rain_storm_last_end_at']
+        if previous['rain_storm_start_at'] is not None:
+            assert record['rain_storm_start_at'] == previous['rain_storm_start_at']
+
+
+def test_readings_change_gradually() -> None:
+    records = _Iss(360)
+    changed = 0
+
+    for previous, record in zip(records, records[1:]):
+        assert abs(record['temp'] - previous['temp']) < 1.0
+        assert abs(record['hum'] - previous['hum']) < 2.0
+        assert abs(record['wind_speed_last'] - previous['wind_speed_last']) <= 5.0
+        changed += sum(record[k] != previous[k] for k in record)
+
+    # Mostly wind and temperature; rain totals, storm times and battery flags rarely change
+    assert changed / (len(records) - 1) < len(records[0]) / 3
+
+
+def test_polls_between_updates_return_the_same_payload() -> None:
+    device = VirtualDevice(DeviceId='001D0A700002', Seed=3)
+    first = device.CurrentConditions(TS)
+    assert device.CurrentConditions(TS + 5) is first
+    assert device.CurrentConditions(TS + 10) is not first
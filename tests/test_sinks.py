@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import os
+import random
+import threading
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    Tuple
+)
+from urllib.error import HTTPError
+
+import pytest
+
+from api.columnar import COLUMNS
+from api.decoder import DecodeCondition
+from api.device_condition_reports import LssBarometerCondition
+from api.simulator import IssRecord
+from api.sinks import CsvSink, EncodeLineProtocol, InfluxHttpSink, Sink, SinkPipeline, Table, Tabulate
+from api.weatherlink_conditions_report import WeatherLinkConditionsReport
+
+
+TS = 1700000000
+
+
+def _Barometer(device_id: str = '001D0A700002', ts: int = TS, pressure: float | None = 29.92) -> WeatherLinkConditionsReport:
+    return WeatherLinkConditionsReport(
+        DeviceId=device_id,
+        Timestamp=datetime.fromtimestamp(ts, timezone.utc),
+        DeviceConditions=[LssBarometerCondition(LsId=3, Pressure=pressure, SeaLevelPressure=30, ThreeHourPressureTrend=None)]
+    )
+
+
+def _Iss() -> WeatherLinkConditionsReport:
+    record = IssRecord(random.Random(1), lsid=10, txid=2, t=TS)
+    record.update(temp=55, rain_rate_hi=None, rain_storm_start_at=TS - 3600, trans_battery_flag=1, rx_state=2)
+    return WeatherLinkConditionsReport(
+        DeviceId='001D0A700002',
+        Timestamp=datetime.fromtimestamp(TS, timezone.utc),
+        DeviceConditions=[DecodeCondition(record)]
+    )
+
+
+def _Fields(line: str) -> Dict[str, str]:
+    _, fields, _ = line.split(' ')
+    return dict(f.split('=', 1) for f in fields.split(','))
+
+
+def test_line_protocol_escapes_measurement_and_tags() -> None:
+    table = Table(
+        Name='Lss Barometer',
+        Columns=COLUMNS[3],
+        DeviceIds=['a b,c=d\\e'],
+        Timestamps=[datetime.fromtimestamp(TS, timezone.utc)],
+        Rows=[(3, 29.92, None, -0.5)]
+    )
+
+    assert EncodeLineProtocol([table]) == (
+        b'Lss\\ Barometer,DeviceId=a\\ b\\,c\\=d\\\\e,LsId=3 Pressure=29.92,ThreeHourPressureTrend=-0.5 1700000000\n'
+    )
+
+
+def test_line_protocol_field_types() -> None:
+    line = EncodeLineProtocol(Tabulate([_Iss()])).decode()
+    assert line.count('\n') == 1
+    assert line.startswith('IssCondition,DeviceId=001D0A700002,LsId=10,TxId=2 ')
+    assert line.endswith(f' {TS}\n')
+
+    fields = _Fields(line.strip())
+    # Integer readings are still written as floats, so the field type never changes between points
+    assert fields['Temperature'] == '55.0'
+    assert fields['TxBatteryLow'] == 'true'
+    assert fields['RxState'] == '2i'
+    assert fields['RainStormStarted'] == f'{TS - 3600}i'
+    assert 'LsId' not in fields and 'TxId' not in fields
+    # Missing values are left out rather than written empty
+    assert 'Rain1MinMax' not in fields
+    assert all(fields.values())
+
+
+def test_line_protocol_skips_rows_without_fields() -> None:
+    report = _Barometer(pressure=None)
+    report.DeviceConditions[0].SeaLevelPressure = None
+    assert EncodeLineProtocol(Tabulate([report])) == b''
+
+
+def test_csv_header_written_once(tmp_path: Any) -> None:
+    sink = CsvSink(str(tmp_path))
+    sink.Write(Tabulate([_Barometer(ts=TS)]))
+    sink.Write(Tabulate([_Barometer(ts=TS + 10)]))
+    sink.Close()
+
+    # A new sink appends to the existing file without repeating the header
+    sink = CsvSink(str(tmp_path))
+    sink.Write(Tabulate([_Barometer(ts=TS + 20, pressure=None)]))
+    sink.Close()
+
+    with open(os.path.join(tmp_path, 'LssBarometerCondition.csv'), newline='') as f:
+        rows = list(csv.reader(f))
+
+    assert rows[0] == ['DeviceId', 'Timestamp', 'LsId', 'Pressure', 'SeaLevelPressure', 'ThreeHourPressureTrend']
+    assert [r[1] for r in rows[1:]] == [
+        datetime.fromtimestamp(ts, timezone.utc).isoformat() for ts in (TS, TS + 10, TS + 20)
+    ]
+    assert rows[1][2:] == ['3', '29.92', '30', '']
+    assert rows[3][3] == ''
+
+
+class _RecordingSink(Sink):
+    def __init__(self) -> None:
+        self.Batches: List[int] = []
+        self.Closed = False
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        self.Batches.append(sum(len(t.Rows) for t in tables))
+
+    def Close(self) -> None:
+        self.Closed = True
+
+
+def test_pipeline_flushes_full_batches() -> None:
+    sink = _RecordingSink()
+
+    async def _Run() -> None:
+        async with SinkPipeline([sink], batch_size=3, flush_interval=60.0) as pipeline:
+            for i in range(7):
+                await pipeline.Put(_Barometer(ts=TS + i))
+            for _ in range(100):
+                if len(sink.Batches) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert sink.Batches == [3, 3]
+        assert pipeline.Written == 7
+
+    asyncio.run(_Run())
+    # The partial batch is written on close
+    assert sink.Batches == [3, 3, 1]
+    assert sink.Closed
+
+
+def test_pipeline_flushes_on_interval() -> None:
+    sink = _RecordingSink()
+
+    async def _Run() -> None:
+        async with SinkPipeline([sink], batch_size=100, flush_interval=0.1) as pipeline:
+            await pipeline.Put(_Barometer(ts=TS))
+            await pipeline.Put(_Barometer(ts=TS + 1))
+            await asyncio.sleep(0.5)
+            assert sink.Batches == [2]
+
+    asyncio.run(_Run())
+    assert sink.Batches == [2]
+
+
+class _BlockingSink(_RecordingSink):
+    def __init__(self) -> None:
+        super().__init__()
+        self.Started = threading.Event()
+        self.Release = threading.Event()
+
+    def Write(self, tables: Sequence[Table]) -> None:
+        self.Started.set()
+        self.Release.wait(5)
+        super().Write(tables)
+
+
+def test_pipeline_put_blocks_when_full() -> None:
+    sink = _BlockingSink()
+
+    async def _Run() -> None:
+        loop = asyncio.get_running_loop()
+        async with SinkPipeline([sink], batch_size=1, queue_size=2) as pipeline:
+            await pipeline.Put(_Barometer(ts=TS))
+            assert await loop.run_in_executor(None, sink.Started.wait, 5)
+
+            # The writer is stuck on the first report, so two more fill the queue and the next has to wait
+            await pipeline.Put(_Barometer(ts=TS + 1))
+            await pipeline.Put(_Barometer(ts=TS + 2))
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(pipeline.Put(_Barometer(ts=TS + 3)), 0.2)
+
+            sink.Release.set()
+            await asyncio.wait_for(pipeline.Put(_Barometer(ts=TS + 3)), 5)
+
+    asyncio.run(_Run())
+    assert sum(sink.Batches) == 4
+
+
+def test_pipeline_failure_stops_put_and_raises_on_close(monkeypatch: Any) -> None:
+    def _Fail(reports: Any) -> List[Table]:
+        raise ValueError('cannot tabulate')
+
+    monkeypatch.setattr('api.sinks.Tabulate', _Fail)
+    sink = _RecordingSink()
+
+    async def _Run() -> None:
+        pipeline = SinkPipeline([sink], batch_size=1, queue_size=1)
+        await pipeline.Start()
+
+        # The batching task dies on the first batch; later reports must not wait forever for room in the queue
+        with pytest.raises(RuntimeError):
+            for i in range(10):
+                await asyncio.wait_for(pipeline.Put(_Barometer(ts=TS + i)), 5)
+
+        with pytest.raises(ValueError, match='cannot tabulate'):
+            await asyncio.wait_for(pipeline.Close(), 5)
+
+    asyncio.run(_Run())
+    assert sink.Closed
+
+
+class _InfluxHandler(BaseHTTPRequestHandler):
+    Requests: List[Tuple[str, Dict[str, str], bytes]] = []
+    Status = 204
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.Requests.append((self.path, dict(self.headers), body))
+        self.send_response(self.Status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def influx() -> Iterator[HTTPServer]:
+    _InfluxHandler.Requests = []
+    _InfluxHandler.Status = 204
+    server = HTTPServer(('127.0.0.1', 0), _InfluxHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_influx_http_sink_posts_line_protocol(influx: HTTPServer) -> None:
+    url = f'http://127.0.0.1:{influx.server_port}/api/v2/write?org=home&bucket=weather&precision=s'
+    tables = Tabulate([_Barometer(), _Iss()])
+
+    InfluxHttpSink(url, token='secret').Write(tables)
+
+    [(path, headers, body)] = _InfluxHandler.Requests
+    assert path == '/api/v2/write?org=home&bucket=weather&precision=s'
+    assert headers['Authorization'] == 'Token secret'
+    assert headers['Content-Type'] == 'text/plain; charset=utf-8'
+    assert body == EncodeLineProtocol(tables)
+
+
+def test_influx_http_sink_skips_empty_batches(influx: HTTPServer) -> None:
+    InfluxHttpSink(f'http://127.0.0.1:{influx.server_port}/write').Write([])
+    assert _InfluxHandler.Requests == []
+
+
+def test_influx_http_sink_raises_on_error_status(influx: HTTPServer) -> None:
+    _InfluxHandler.Status = 500
+    with pytest.raises(HTTPError):
+        InfluxHttpSink(f'http://127.0.0.1:{influx.server_port}/write').Write(Tabulate([_Barometer()]))